@@ -0,0 +1,52 @@
+"""Add foreign key and sort indexes
+
+Revision ID: 4d2a8f61c0b7
+Revises: 7c3e1f9a2b54
+Create Date: 2026-10-17 19:00:12.304918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4d2a8f61c0b7'
+down_revision: Union[str, None] = '7c3e1f9a2b54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns). Sort indexes end with id, the keyset pagination tie-breaker.
+# team_members.user_id is served by the unique_membership (user_id, team_id) index.
+INDEXES = [
+    ('ix_posts_user_id', 'posts', ['user_id']),
+    ('ix_posts_event_id', 'posts', ['event_id']),
+    ('ix_posts_created_at_id', 'posts', ['created_at', 'id']),
+    ('ix_team_members_team_id', 'team_members', ['team_id']),
+    ('ix_team_members_joined_at_id', 'team_members', ['joined_at', 'id']),
+    ('ix_subscriptions_user_id', 'subscriptions', ['user_id']),
+    ('ix_subscriptions_created_at_id', 'subscriptions', ['created_at', 'id']),
+    ('ix_articles_author_id', 'articles', ['author_id']),
+    ('ix_articles_created_at_id', 'articles', ['created_at', 'id']),
+    ('ix_teams_owner_id', 'teams', ['owner_id']),
+    ('ix_teams_created_at_id', 'teams', ['created_at', 'id']),
+    ('ix_users_last_name_id', 'users', ['last_name', 'id']),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY does not block writes but cannot run inside a transaction. A build that
+    # fails leaves an INVALID index behind, which is dropped so a rerun rebuilds it.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.execute(
+                f"DO $$ BEGIN IF EXISTS (SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                f"WHERE c.relname = '{name}' AND NOT i.indisvalid) THEN DROP INDEX {name}; END IF; END $$"
+            )
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
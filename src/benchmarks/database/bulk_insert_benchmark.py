@@ -0,0 +1,115 @@
+"""
+Throughput of the repository bulk write APIs against the database in settings.db: rows
+inserted one create()/add_member() call at a time versus one create_many()/add_members()
+call, for posts, subscriptions and team members. Posts are also imported through the
+COPY pipeline of PostImportService (mode "copy").
+
+Every case runs inside a transaction that is rolled back, so the database is left as it
+was. Needs a migrated Postgres (alembic upgrade head).
+
+Run from the repository root:
+    python -m src.benchmarks.database.bulk_insert_benchmark --rows 10000
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config import settings
+from src.database.models.team.team import Team
+from src.database.models.user.user import User
+from src.repositories.post.post_repository import PostRepository
+from src.repositories.subscription.subscription_repository import SubscriptionRepository
+from src.repositories.team_members.team_members_repository import TeamMemberRepository
+from src.schemas.post.post_schema import PostInput
+from src.schemas.subscription.subscription_schema import SubscriptionInput
+from src.schemas.team_member.team_member_schema import TeamMemberInput
+from src.services.post.post_import_service import PostImportService
+
+MODES = ("single", "bulk", "copy")
+
+
+async def create_users(session: AsyncSession, count: int) -> list:
+    rows = [
+        dict(id=uuid4(), first_name="Bench", last_name="Mark", hashed_password=b"x", email=f"bench-{uuid4().hex[:20]}@x.io")
+        for _ in range(count)
+    ]
+    await session.execute(insert(User), rows)
+    return [row["id"] for row in rows]
+
+
+async def inputs(session: AsyncSession, table: str, rows: int) -> list:
+    if table == "posts":
+        (user_id,) = await create_users(session, 1)
+        return [PostInput(title=f"Post {i}", body=f"Body {i}", user_id=user_id, event_id=uuid4()) for i in range(rows)]
+    if table == "subscriptions":
+        end_at = datetime.now(timezone.utc) + timedelta(days=30)
+        return [SubscriptionInput(access=1.0, end_at=end_at, user_id=user_id) for user_id in await create_users(session, rows)]
+    (owner_id,) = await create_users(session, 1)
+    team_id = uuid4()
+    await session.execute(insert(Team).values(id=team_id, name="Benchmark", owner_id=owner_id))
+    return [TeamMemberInput(user_id=user_id, team_id=team_id) for user_id in await create_users(session, rows)]
+
+
+async def write(session: AsyncSession, table: str, mode: str, data: list) -> int:
+    if mode == "copy":
+        return (await PostImportService(session).import_posts(data)).inserted
+    if table == "posts":
+        repository = PostRepository(session)
+        single, bulk = repository.create, repository.create_many
+    elif table == "subscriptions":
+        repository = SubscriptionRepository(session)
+        single, bulk = repository.create, repository.create_many
+    else:
+        repository = TeamMemberRepository(session)
+        single, bulk = repository.add_member, repository.add_members
+    if mode == "bulk":
+        return (await bulk(data)).created
+    for item in data:
+        await single(item)
+    return len(data)
+
+
+async def run_case(engine, table: str, mode: str, rows: int) -> dict:
+    async with engine.connect() as connection:
+        transaction = await connection.begin()
+        session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+        data = await inputs(session, table, rows)
+        start = time.perf_counter()
+        created = await write(session, table, mode, data)
+        seconds = time.perf_counter() - start
+        await session.close()
+        await transaction.rollback()
+    return {"table": table, "mode": mode, "rows": created, "seconds": seconds, "rows_per_s": created / seconds}
+
+
+async def run(rows: int, tables: list[str], modes: list[str]):
+    engine = create_async_engine(settings.db.url)
+    try:
+        print(f"{'table':<14} {'mode':<7} {'rows':>7} {'seconds':>9} {'rows/s':>10}")
+        for table in tables:
+            for mode in modes:
+                if mode == "copy" and table != "posts":
+                    continue
+                result = await run_case(engine, table, mode, rows)
+                print(f"{table:<14} {mode:<7} {result['rows']:>7} {result['seconds']:>9.2f} {result['rows_per_s']:>10.0f}")
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--tables", nargs="+", default=["posts", "subscriptions", "team_members"],
+                        choices=["posts", "subscriptions", "team_members"])
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=MODES)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.tables, args.modes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Rows/s of reading posts into PostOutput objects through each read path:
+
+- orm:        select(Post) entities, PostOutput(**post.__dict__) (the old list methods)
+- core:       every column as plain rows, PostOutput(**row) per row
+- projection: only PostOutput's columns as plain rows, one cached list validator call
+- trusted:    only PostOutput's columns, model_construct without validation
+
+The posts are seeded with the COPY import inside a transaction that is rolled back, so
+the database is left as it was. Needs a migrated Postgres (alembic upgrade head).
+
+Run from the repository root:
+    python -m src.benchmarks.database.read_path_benchmark --rows 100000
+"""
+import argparse
+import asyncio
+import time
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.benchmarks.database.bulk_insert_benchmark import create_users
+from src.config import settings
+from src.database.models.post.post import Post
+from src.repositories.utils import columns, output_columns, to_outputs
+from src.schemas.post.post_schema import PostInput, PostOutput
+from src.services.post.post_import_service import PostImportService
+
+PATHS = ("orm", "core", "projection", "trusted")
+
+
+async def read(session: AsyncSession, path: str, event_id) -> list[PostOutput]:
+    if path == "orm":
+        stmt = select(Post).where(Post.event_id == event_id).order_by(Post.created_at)
+        return [PostOutput(**post.__dict__) for post in (await session.execute(stmt)).scalars().all()]
+    if path == "core":
+        stmt = select(*columns(Post)).where(Post.event_id == event_id).order_by(Post.created_at)
+        return [PostOutput(**row) for row in (await session.execute(stmt)).mappings().all()]
+    stmt = select(*output_columns(Post, PostOutput)).where(Post.event_id == event_id).order_by(Post.created_at)
+    return to_outputs(PostOutput, (await session.execute(stmt)).mappings().all(), trusted=path == "trusted")
+
+
+async def run(rows: int, repeat: int, paths: list[str]):
+    engine = create_async_engine(settings.db.url)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            session = AsyncSession(bind=connection, join_transaction_mode="create_savepoint")
+            (user_id,) = await create_users(session, 1)
+            event_id = uuid4()
+            await PostImportService(session).import_posts(
+                PostInput(title=f"Post {i}", body=f"Body {i}", user_id=user_id, event_id=event_id)
+                for i in range(rows)
+            )
+            print(f"{'path':<11} {'rows':>8} {'best s':>8} {'rows/s':>10}")
+            for path in paths:
+                best = float("inf")
+                for _ in range(repeat):
+                    session.expunge_all()
+                    start = time.perf_counter()
+                    outputs = await read(session, path, event_id)
+                    best = min(best, time.perf_counter() - start)
+                print(f"{path:<11} {len(outputs):>8} {best:>8.3f} {len(outputs) / best:>10.0f}")
+            await session.close()
+            await transaction.rollback()
+    finally:
+        await engine.dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--paths", nargs="+", default=list(PATHS), choices=PATHS)
+    args = parser.parse_args()
+    asyncio.run(run(args.rows, args.repeat, args.paths))
+
+
+if __name__ == "__main__":
+    main()
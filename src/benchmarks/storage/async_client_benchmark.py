@@ -0,0 +1,84 @@
+"""
+Compares the old boto3 + asyncio.to_thread path with the pooled aiobotocore client.
+
+Run from the repository root:
+    python -m src.benchmarks.storage.async_client_benchmark --requests 500 --concurrency 64
+"""
+import argparse
+import asyncio
+import time
+
+import boto3
+
+from src.services.storage.s3_helper import S3Helper
+from src.tests.services.storage.utils import local_s3_server
+
+BUCKET = "benchmark"
+REGION = "us-east-1"
+
+
+async def thread_hop_round(client, keys: list[str], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(key: str):
+        async with semaphore:
+            response = await asyncio.to_thread(client.get_object, Bucket=BUCKET, Key=key)
+            return await asyncio.to_thread(response['Body'].read)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(key) for key in keys))
+    return time.perf_counter() - start
+
+
+async def async_round(s3: S3Helper, keys: list[str], concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+    client = await s3.get_client()
+
+    async def fetch(key: str):
+        async with semaphore:
+            response = await client.get_object(Bucket=BUCKET, Key=key)
+            async with response['Body'] as stream:
+                return await stream.read()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(fetch(key) for key in keys))
+    return time.perf_counter() - start
+
+
+async def run(endpoint: str, requests: int, concurrency: int, size: int, pool: int):
+    s3 = S3Helper(endpoint_url=endpoint, region_name=REGION, max_pool_connections=pool)
+    client = await s3.get_client()
+    await client.create_bucket(Bucket=BUCKET)
+    payload = b"x" * size
+    keys = [f"objects/{i}" for i in range(min(requests, 100))]
+    await asyncio.gather(*(client.put_object(Bucket=BUCKET, Key=key, Body=payload) for key in keys))
+    workload = [keys[i % len(keys)] for i in range(requests)]
+
+    sync_client = boto3.client("s3", endpoint_url=endpoint, region_name=REGION)
+    thread_hop = await thread_hop_round(sync_client, workload, concurrency)
+    pooled = await async_round(s3, workload, concurrency)
+    await s3.close()
+
+    print(f"requests={requests} concurrency={concurrency} size={size}B pool={pool}")
+    print(f"thread-hop: {thread_hop:.3f}s  {requests / thread_hop:.1f} req/s")
+    print(f"async pool: {pooled:.3f}s  {requests / pooled:.1f} req/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoint-url", help="S3-compatible endpoint; a local moto server is started if omitted")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--size", type=int, default=64 * 1024)
+    parser.add_argument("--pool", type=int, default=50)
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        asyncio.run(run(args.endpoint_url, args.requests, args.concurrency, args.size, args.pool))
+    else:
+        with local_s3_server() as endpoint:
+            asyncio.run(run(endpoint, args.requests, args.concurrency, args.size, args.pool))
+
+
+if __name__ == "__main__":
+    main()
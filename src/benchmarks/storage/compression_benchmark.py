@@ -0,0 +1,61 @@
+"""
+Measures stored bytes and upload/download wall time of upload_to_json per codec and event size.
+
+Run from the repository root:
+    python -m src.benchmarks.storage.compression_benchmark --runners 10 100 1000
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from src.benchmarks.storage.events import synthetic_event
+from src.services.storage.s3_helper import S3Helper
+from src.services.storage.storage_service import StorageService
+from src.tests.services.storage.utils import local_s3_server
+
+BUCKET = "benchmark"
+CODECS = ("none", "gzip", "zstd")
+
+
+async def run(endpoint: str, runner_counts: list[int], repeat: int):
+    s3 = S3Helper(endpoint_url=endpoint, region_name="us-east-1")
+    client = await s3.get_client()
+    await client.create_bucket(Bucket=BUCKET)
+
+    print(f"{'runners':>8} {'codec':>6} {'raw B':>12} {'stored B':>12} {'ratio':>6} {'upload s':>9} {'download s':>10}")
+    for runners in runner_counts:
+        _, routes = synthetic_event(runners)
+        raw_size = len(json.dumps(routes, default=str).encode())
+        for codec in CODECS:
+            storage = StorageService(config={"bucket": BUCKET, "json_compression": codec}, s3=s3, cache=None)
+            key = f"Events/Routes/{runners}-{codec}"
+            upload = download = 0.0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                result = await storage.upload_to_json(data=routes, filename=key)
+                upload += time.perf_counter() - start
+                start = time.perf_counter()
+                await storage.download_json(key)
+                download += time.perf_counter() - start
+            print(f"{runners:>8} {codec:>6} {raw_size:>12} {result.size:>12} {raw_size / result.size:>6.1f} "
+                  f"{upload / repeat:>9.3f} {download / repeat:>10.3f}")
+    await s3.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoint-url", help="S3-compatible endpoint; a local moto server is started if omitted")
+    parser.add_argument("--runners", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        asyncio.run(run(args.endpoint_url, args.runners, args.repeat))
+    else:
+        with local_s3_server() as endpoint:
+            asyncio.run(run(endpoint, args.runners, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import random
+from uuid import uuid4
+
+
+def synthetic_event(runners: int, controls: int = 25, points: int = 600, seed: int = 0) -> tuple[dict, dict]:
+    """
+    Builds (splits, routes) dicts shaped like an imported event: one record per runner,
+    with split times per control and a GPS track of `points` samples.
+    """
+    rng = random.Random(seed)
+    splits, routes = {}, {}
+    for i in range(runners):
+        runner = str(uuid4())
+        class_name = f"M{rng.choice([12, 14, 16, 18, 21, 35, 40, 45])}"
+        times = [rng.randint(30, 600) for _ in range(controls)]
+        splits[runner] = {
+            "class": class_name,
+            "name": f"Runner {i}",
+            "splits": times,
+            "result": sum(times),
+        }
+        lat, lon = 59.9 + rng.random() / 100, 30.3 + rng.random() / 100
+        routes[runner] = {
+            "class": class_name,
+            "track": [
+                [round(lat + k * 1e-5, 6), round(lon + k * 1e-5, 6), k * 5]
+                for k in range(points)
+            ],
+        }
+    return splits, routes
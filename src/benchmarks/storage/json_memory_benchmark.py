@@ -0,0 +1,93 @@
+"""
+Peak RSS of uploading a large synthetic event's routes as JSON: the old buffered path
+(json.dumps -> bytes -> BytesIO -> UploadFile) versus the streaming upload_to_json.
+
+Each mode runs in a fresh subprocess so ru_maxrss is not shared between them.
+
+Run from the repository root:
+    python -m src.benchmarks.storage.json_memory_benchmark --runners 2000
+"""
+import argparse
+import asyncio
+import json
+import resource
+import subprocess
+import sys
+from io import BytesIO
+
+from fastapi import UploadFile
+
+from src.benchmarks.storage.events import synthetic_event
+from src.services.storage.s3_helper import S3Helper
+from src.services.storage.storage_service import StorageService
+from src.tests.services.storage.utils import local_s3_server
+
+BUCKET = "benchmark"
+MODES = ("buffered", "streaming")
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def upload(endpoint: str, mode: str, runners: int) -> tuple[float, float]:
+    s3 = S3Helper(endpoint_url=endpoint, region_name="us-east-1")
+    client = await s3.get_client()
+    storage = StorageService(config={"bucket": BUCKET, "json_compression": "none"}, s3=s3, cache=None)
+    _, routes = synthetic_event(runners)
+    baseline = peak_rss_mb()
+
+    if mode == "buffered":
+        file = UploadFile(file=BytesIO(json.dumps(routes, default=str).encode("UTF-8")), filename="routes")
+        await client.put_object(Bucket=BUCKET, Key=file.filename, Body=file.file.read())
+    else:
+        result = await storage.upload_to_json(data=routes, filename="routes")
+        assert result.status, result.error
+    await s3.close()
+    return baseline, peak_rss_mb()
+
+
+def child(endpoint: str, mode: str, runners: int):
+    baseline, peak = asyncio.run(upload(endpoint, mode, runners))
+    print(json.dumps({"mode": mode, "runners": runners, "baseline_mb": baseline, "peak_mb": peak}))
+
+
+async def create_bucket(endpoint: str):
+    s3 = S3Helper(endpoint_url=endpoint, region_name="us-east-1")
+    client = await s3.get_client()
+    await client.create_bucket(Bucket=BUCKET)
+    await s3.close()
+
+
+def run(endpoint: str, runner_counts: list[int]):
+    asyncio.run(create_bucket(endpoint))
+    print(f"{'runners':>8} {'mode':>10} {'data MB':>8} {'peak MB':>8} {'extra MB':>9}")
+    for runners in runner_counts:
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, "-m", __spec__.name, "--child", mode, "--endpoint-url", endpoint, "--runners", str(runners)],
+                capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+            row = json.loads(output)
+            print(f"{runners:>8} {mode:>10} {row['baseline_mb']:>8.0f} {row['peak_mb']:>8.0f} "
+                  f"{row['peak_mb'] - row['baseline_mb']:>9.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--endpoint-url", help="S3-compatible endpoint; a local moto server is started if omitted")
+    parser.add_argument("--runners", type=int, nargs="+", default=[500, 2000])
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.endpoint_url, args.child, args.runners[0])
+    elif args.endpoint_url:
+        run(args.endpoint_url, args.runners)
+    else:
+        with local_s3_server() as endpoint:
+            run(endpoint, args.runners)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Benchmark suite for StorageService against an S3-compatible endpoint.
+
+Covers upload, multi_upload, upload_to_json, download_json and upload_event_data over
+object sizes and concurrency levels, and reports throughput, p50/p99 latency and peak
+Python heap per case. --output writes the results as JSON for tracking regressions.
+
+Without --endpoint-url a local moto server is started and the cases run in a child
+process, so the server's own allocations are not counted as client memory.
+
+Run from the repository root:
+    python -m src.benchmarks.storage.storage_benchmark --output storage-benchmark.json
+"""
+import argparse
+import asyncio
+import json
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from io import BytesIO
+from types import SimpleNamespace
+from typing import Awaitable, Callable
+from uuid import uuid4
+
+from fastapi import UploadFile
+
+from src.benchmarks.storage.events import synthetic_event
+from src.services.storage.s3_helper import S3Helper
+from src.services.storage.storage_service import StorageService
+from src.tests.services.storage.utils import local_s3_server
+
+BUCKET = "benchmark"
+OPERATIONS = ("upload", "multi_upload", "upload_to_json", "download_json", "upload_event_data")
+
+
+@dataclass
+class CaseResult:
+    operation: str
+    size: str
+    concurrency: int
+    ops: int
+    bytes: int
+    seconds: float
+    ops_per_second: float
+    mb_per_second: float
+    p50_ms: float
+    p99_ms: float
+    peak_mb: float
+
+
+def percentile(values: list[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+async def measure(
+        operation: str,
+        size: str,
+        concurrency: int,
+        ops: int,
+        op: Callable[[int], Awaitable[int]],
+) -> CaseResult:
+    """
+    Runs `ops` calls of op(i) -> payload bytes on `concurrency` workers, then one more
+    round of `concurrency` calls under tracemalloc for the peak heap. Memory is measured
+    separately so tracing overhead does not skew the timings.
+    """
+    latencies: list[float] = []
+    counter = iter(range(ops))
+
+    async def worker():
+        total = 0
+        for i in counter:
+            start = time.perf_counter()
+            total += await op(i)
+            latencies.append(time.perf_counter() - start)
+        return total
+
+    start = time.perf_counter()
+    payload = sum(await asyncio.gather(*(worker() for _ in range(concurrency))))
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    await asyncio.gather(*(op(i) for i in range(concurrency)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return CaseResult(
+        operation=operation,
+        size=size,
+        concurrency=concurrency,
+        ops=ops,
+        bytes=payload,
+        seconds=round(seconds, 4),
+        ops_per_second=round(ops / seconds, 2),
+        mb_per_second=round(payload / seconds / 1024 / 1024, 2),
+        p50_ms=round(percentile(latencies, 50) * 1000, 2),
+        p99_ms=round(percentile(latencies, 99) * 1000, 2),
+        peak_mb=round(peak / 1024 / 1024, 2),
+    )
+
+
+async def run_cases(args) -> list[CaseResult]:
+    s3 = S3Helper(endpoint_url=args.endpoint_url, region_name="us-east-1")
+    client = await s3.get_client()
+    try:
+        await client.create_bucket(Bucket=BUCKET)
+    except client.exceptions.BucketAlreadyOwnedByYou:
+        pass
+    storage = StorageService(config={"bucket": BUCKET}, s3=s3, cache=None)
+    events = {runners: synthetic_event(runners) for runners in args.runners}
+    results = []
+
+    def report(result: CaseResult):
+        results.append(result)
+        print(f"{result.operation:>17} {result.size:>10} {result.concurrency:>4} {result.ops:>5} "
+              f"{result.ops_per_second:>8.1f} {result.mb_per_second:>8.1f} {result.p50_ms:>9.1f} "
+              f"{result.p99_ms:>9.1f} {result.peak_mb:>8.1f}", flush=True)
+
+    print(f"{'operation':>17} {'size':>10} {'conc':>4} {'ops':>5} {'ops/s':>8} {'MB/s':>8} "
+          f"{'p50 ms':>9} {'p99 ms':>9} {'peak MB':>8}")
+    for concurrency in args.concurrency:
+        for size in args.sizes:
+            payload = b"x" * size
+            label = f"{size // 1024}KiB"
+
+            async def upload(i, size=size, payload=payload):
+                file = UploadFile(file=BytesIO(payload), filename=f"bench/upload/{size}/{i % concurrency}", size=size)
+                result = await storage.upload(file=file)
+                assert result.status, result.error
+                return size
+
+            async def multi_upload(i, size=size, payload=payload):
+                files = [
+                    UploadFile(file=BytesIO(payload), filename=f"bench/multi/{size}/{n}", size=size)
+                    for n in range(concurrency)
+                ]
+                results = await storage.multi_upload(files=files)
+                assert all(result.status for result in results)
+                return size * concurrency
+
+            if "upload" in args.operations:
+                report(await measure("upload", label, concurrency, args.ops, upload))
+            if "multi_upload" in args.operations:
+                # One call uploads `concurrency` files; the calls themselves run one at a time
+                report(await measure("multi_upload", label, concurrency, max(1, args.ops // concurrency), multi_upload))
+
+        for runners, (splits, routes) in events.items():
+            label = f"{runners}r"
+            routes_size = len(json.dumps(routes, default=str).encode())
+            event_size = routes_size + len(json.dumps(splits, default=str).encode())
+
+            async def upload_to_json(i, runners=runners, routes=routes, routes_size=routes_size):
+                result = await storage.upload_to_json(data=routes, filename=f"bench/json/{runners}/{i % concurrency}")
+                assert result.status, result.error
+                return routes_size
+
+            async def download_json(i, runners=runners, routes_size=routes_size):
+                # Distinct keys per worker, so concurrent reads are not coalesced into one GET
+                data = await storage.download_json(f"bench/json/{runners}/{i % concurrency}")
+                assert isinstance(data, dict)
+                return routes_size
+
+            async def upload_event_data(i, splits=splits, routes=routes, event_size=event_size):
+                await storage.upload_event_data(SimpleNamespace(splits=splits, routes=routes), uuid4())
+                return event_size
+
+            if "upload_to_json" in args.operations or "download_json" in args.operations:
+                for i in range(concurrency):
+                    await upload_to_json(i)
+            if "upload_to_json" in args.operations:
+                report(await measure("upload_to_json", label, concurrency, args.ops, upload_to_json))
+            if "download_json" in args.operations:
+                report(await measure("download_json", label, concurrency, args.ops, download_json))
+            if "upload_event_data" in args.operations:
+                report(await measure("upload_event_data", label, concurrency, args.ops, upload_event_data))
+
+    await s3.close()
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    results = asyncio.run(run_cases(args))
+    if args.output:
+        report = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "endpoint_url": args.endpoint_url,
+            "max_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+            "results": [asdict(result) for result in results],
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", help="S3-compatible endpoint; a local moto server is started if omitted")
+    parser.add_argument("--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--sizes", type=int, nargs="+", default=[64 * 1024, 1024 * 1024, 24 * 1024 * 1024],
+                        help="Object sizes in bytes for upload and multi_upload")
+    parser.add_argument("--runners", type=int, nargs="+", default=[10, 100, 1000],
+                        help="Synthetic event sizes for the JSON and event data cases")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--ops", type=int, default=16, help="Operations per case")
+    parser.add_argument("--output", help="Write the results as JSON to this path")
+    args = parser.parse_args()
+
+    if args.endpoint_url:
+        run(args)
+    else:
+        with local_s3_server() as endpoint:
+            subprocess.run([sys.executable, "-m", __spec__.name, *sys.argv[1:], "--endpoint-url", endpoint], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,11 +15,32 @@ class DbSettings(BaseModel):
     host: str = os.getenv("DATABASE_HOST")
     name: str = os.getenv("DATABASE_NAME")
     echo: bool = False
+    pool_size: int = int(os.getenv("DATABASE_POOL_SIZE", 5))
+    max_overflow: int = int(os.getenv("DATABASE_MAX_OVERFLOW", 10))
+    pool_timeout: float = float(os.getenv("DATABASE_POOL_TIMEOUT", 30))
+    pool_recycle: int = int(os.getenv("DATABASE_POOL_RECYCLE", 1800))
+    pool_pre_ping: bool = os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"
+    statement_cache_size: int = int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", 100))
+    replica_hosts: list[str] = [host for host in os.getenv("DATABASE_REPLICA_HOSTS", "").split(",") if host]
+    sticky_seconds: float = float(os.getenv("DATABASE_STICKY_SECONDS", 5))
+    replica_eject_seconds: float = float(os.getenv("DATABASE_REPLICA_EJECT_SECONDS", 30))
+    replica_check_seconds: float = float(os.getenv("DATABASE_REPLICA_CHECK_SECONDS", 10))
+    n_plus_one_threshold: int = int(os.getenv("DATABASE_N_PLUS_ONE_THRESHOLD", 10))
+    slow_query_ms: float = float(os.getenv("DATABASE_SLOW_QUERY_MS", 500))
+    slow_query_explain_sample_rate: float = float(os.getenv("DATABASE_SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0.1))
+    slow_query_explains_per_minute: int = int(os.getenv("DATABASE_SLOW_QUERY_EXPLAINS_PER_MINUTE", 6))
+    page_size: int = int(os.getenv("DATABASE_PAGE_SIZE", 50))
+    max_page_size: int = int(os.getenv("DATABASE_MAX_PAGE_SIZE", 500))
+    stream_fetch_size: int = int(os.getenv("DATABASE_STREAM_FETCH_SIZE", 1000))
 
     @property
     def url(self) -> str:
         return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}/{self.name}"
 
+    @property
+    def replica_urls(self) -> list[str]:
+        return [f"postgresql+asyncpg://{self.username}:{self.password}@{host}/{self.name}" for host in self.replica_hosts]
+
 
 class AuthJWT(BaseModel):
     private_key_path: Path = BASE_DIR / os.getenv("JWT_PRIVATE_KEY_PATH")
@@ -35,9 +56,44 @@ class AWS_Settings(BaseSettings):
     AWS_SPLITS_PATH: str = os.getenv("SPLITS_PATH")
     AWS_ROUTES_PATH: str = os.getenv("ROUTES_PATH")
     AWS_RESULTS_PATH: str = os.getenv("RESULTS_PATH")
+    AWS_CONTENT_PATH: str = os.getenv("CONTENT_PATH", "Content/")
+    AWS_BUNDLES_PATH: str = os.getenv("BUNDLES_PATH", "Events/Bundles/")
+    AWS_ENDPOINT_URL: str = os.getenv("AWS_ENDPOINT_URL", "https://storage.yandexcloud.net")
+    AWS_MAX_POOL_CONNECTIONS: int = int(os.getenv("AWS_MAX_POOL_CONNECTIONS", 50))
+    AWS_CONNECT_TIMEOUT: float = float(os.getenv("AWS_CONNECT_TIMEOUT", 5))
+    AWS_READ_TIMEOUT: float = float(os.getenv("AWS_READ_TIMEOUT", 30))
+    AWS_MULTIPART_THRESHOLD: int = int(os.getenv("AWS_MULTIPART_THRESHOLD", 16 * 1024 * 1024))
+    AWS_MULTIPART_PART_SIZE: int = int(os.getenv("AWS_MULTIPART_PART_SIZE", 8 * 1024 * 1024))
+    AWS_MAX_CONCURRENT_PARTS: int = int(os.getenv("AWS_MAX_CONCURRENT_PARTS", 16))
+    AWS_MAX_CONCURRENT_FILES: int = int(os.getenv("AWS_MAX_CONCURRENT_FILES", 8))
+    AWS_PART_RETRIES: int = int(os.getenv("AWS_PART_RETRIES", 3))
+    AWS_EVENT_DATA_FORMAT: str = os.getenv("AWS_EVENT_DATA_FORMAT", "parquet")
+    AWS_BUNDLE_RETENTION: float = float(os.getenv("AWS_BUNDLE_RETENTION", 60 * 60))
+    AWS_MANIFEST_CACHE_TTL: float = float(os.getenv("AWS_MANIFEST_CACHE_TTL", 5))
+    AWS_PARQUET_ROW_GROUP_SIZE: int = int(os.getenv("AWS_PARQUET_ROW_GROUP_SIZE", 64))
+    AWS_JSON_COMPRESSION: str = os.getenv("AWS_JSON_COMPRESSION", "zstd")
+    AWS_JSON_COMPRESSION_LEVEL: int = int(os.getenv("AWS_JSON_COMPRESSION_LEVEL", 0))
+    AWS_JSON_INDEX_MIN_BYTES: int = int(os.getenv("AWS_JSON_INDEX_MIN_BYTES", 256 * 1024))
+    AWS_PRESIGN_EXPIRES_IN: int = int(os.getenv("AWS_PRESIGN_EXPIRES_IN", 3600))
+    AWS_DOWNLOAD_TIMEOUT: float = float(os.getenv("AWS_DOWNLOAD_TIMEOUT", 30))
+    AWS_STORAGE_LOCAL_ONLY: bool = os.getenv("AWS_STORAGE_LOCAL_ONLY", "false").lower() == "true"
+    AWS_HOT_TIER_DIR: str = os.getenv("AWS_HOT_TIER_DIR", "/tmp/forestbook-hot-tier")
+    AWS_HOT_TIER_MAX_BYTES: int = int(os.getenv("AWS_HOT_TIER_MAX_BYTES", 2 * 1024 * 1024 * 1024))
+    AWS_HOT_TIER_MAX_AGE: float = float(os.getenv("AWS_HOT_TIER_MAX_AGE", 6 * 60 * 60))
+    AWS_CACHE_DIR: str = os.getenv("AWS_CACHE_DIR", "")
+    AWS_CACHE_MAX_BYTES: int = int(os.getenv("AWS_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+    AWS_CACHE_REVALIDATE_AFTER: float = float(os.getenv("AWS_CACHE_REVALIDATE_AFTER", 60))
+    AWS_READ_RETRIES: int = int(os.getenv("AWS_READ_RETRIES", 2))
+    AWS_RETRY_BASE_DELAY: float = float(os.getenv("AWS_RETRY_BASE_DELAY", 0.1))
+    AWS_RETRY_MAX_DELAY: float = float(os.getenv("AWS_RETRY_MAX_DELAY", 2))
+    AWS_BREAKER_FAILURES: int = int(os.getenv("AWS_BREAKER_FAILURES", 5))
+    AWS_BREAKER_RESET_TIMEOUT: float = float(os.getenv("AWS_BREAKER_RESET_TIMEOUT", 30))
+    AWS_HEDGE_PERCENTILE: float = float(os.getenv("AWS_HEDGE_PERCENTILE", 95))
+    AWS_HEDGE_MIN_SAMPLES: int = int(os.getenv("AWS_HEDGE_MIN_SAMPLES", 50))
 
 class Settings(BaseSettings):
     api_v1_prefix: str = os.getenv("API_V1_PREFIX")
+    debug: bool = os.getenv("DEBUG", "false").lower() == "true"
     db: DbSettings = DbSettings()
     auth_jwt: AuthJWT = AuthJWT()
     aws: AWS_Settings = AWS_Settings()
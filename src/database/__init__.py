@@ -7,6 +7,7 @@ from .models.team_member.team_member import TeamMember
 
 from .models.user.user import User
 from .models.post.post import Post
+from .models.stored_file.stored_file import StoredFile
 
 
-__all__ = [User, Post, Team, TeamMember, Subscription, Article]
\ No newline at end of file
+__all__ = [User, Post, Team, TeamMember, Subscription, Article, StoredFile]
\ No newline at end of file
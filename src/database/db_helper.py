@@ -1,4 +1,6 @@
+import asyncio
 from asyncio import current_task
+from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -8,21 +10,103 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from src.config.config import settings
+from src.database.instrumentation import instrument_engine
+from src.database.pool import InstrumentedPool, PoolStats
+from src.database.routing import ReplicaRouter, RoutingSession
+from src.database.slow_queries import SlowQueryLog
 
 
 class DatabaseHelper:
-    def __init__(self, url: str, echo: bool = False):
-        self.engine = create_async_engine(
-            url=url,
+    """
+    Owns the primary engine and optional read replicas. Sessions from session_factory
+    route reads to a replica and writes to the primary (see RoutingSession); without
+    replica_urls everything goes to the primary. Use lifespan as (or inside) the app's
+    lifespan so replicas are health-checked every replica_check_seconds.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            echo: bool = False,
+            replica_urls: list[str] | None = None,
+            sticky_seconds: float = 5,
+            replica_eject_seconds: float = 30,
+            replica_check_seconds: float = 10,
+            pool_size: int = 5,
+            max_overflow: int = 10,
+            pool_timeout: float = 30,
+            pool_recycle: int = -1,
+            pool_pre_ping: bool = False,
+            statement_cache_size: int = 100,
+            slow_query_log: SlowQueryLog | None = None,
+    ):
+        engine_options = dict(
             echo=echo,
+            poolclass=InstrumentedPool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args={
+                # asyncpg's per-connection cache and SQLAlchemy's prepared statement cache;
+                # both must be 0 behind a transaction-mode pgbouncer
+                "statement_cache_size": statement_cache_size,
+                "prepared_statement_cache_size": statement_cache_size,
+            },
+        )
+        self.engine = create_async_engine(url=url, **engine_options)
+        self.replicas = [create_async_engine(url=replica_url, **engine_options) for replica_url in replica_urls or []]
+        self.slow_query_log = slow_query_log
+        for engine in (self.engine, *self.replicas):
+            instrument_engine(engine)
+            if slow_query_log is not None:
+                slow_query_log.attach(engine)
+        self.router = ReplicaRouter(
+            primary=self.engine,
+            replicas=self.replicas,
+            sticky_seconds=sticky_seconds,
+            eject_seconds=replica_eject_seconds,
         )
+        self.replica_check_seconds = replica_check_seconds
         self.session_factory = async_sessionmaker(
             bind=self.engine,
+            sync_session_class=RoutingSession,
+            info={"router": self.router},
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
 
+    def pool_stats(self) -> PoolStats:
+        return self.engine.pool.stats()
+
+    def replica_pool_stats(self) -> dict[str, PoolStats]:
+        """
+        Pool stats of every replica engine, keyed by its URL without the password.
+        """
+        return {engine.url.render_as_string(hide_password=True): engine.pool.stats() for engine in self.replicas}
+
+    @asynccontextmanager
+    async def lifespan(self, app=None):
+        """
+        Runs the replica health checks while the app is up and disposes the engines after.
+        """
+        checks = asyncio.create_task(self.router.run_checks(self.replica_check_seconds)) if self.replicas else None
+        try:
+            yield
+        finally:
+            if checks is not None:
+                checks.cancel()
+                await asyncio.gather(checks, return_exceptions=True)
+            await self.dispose()
+
+    async def dispose(self) -> None:
+        for engine in (self.engine, *self.replicas):
+            await engine.dispose()
+        if self.slow_query_log is not None:
+            await self.slow_query_log.close()
+
     def get_scoped_session(self):
         session = async_scoped_session(
             session_factory=self.session_factory,
@@ -44,4 +128,19 @@ class DatabaseHelper:
 db_helper = DatabaseHelper(
     url=settings.db.url,
     echo=settings.db.echo,
+    replica_urls=settings.db.replica_urls,
+    sticky_seconds=settings.db.sticky_seconds,
+    replica_eject_seconds=settings.db.replica_eject_seconds,
+    replica_check_seconds=settings.db.replica_check_seconds,
+    pool_size=settings.db.pool_size,
+    max_overflow=settings.db.max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    statement_cache_size=settings.db.statement_cache_size,
+    slow_query_log=SlowQueryLog(
+        threshold=settings.db.slow_query_ms / 1000,
+        explain_sample_rate=settings.db.slow_query_explain_sample_rate,
+        explains_per_minute=settings.db.slow_query_explains_per_minute,
+    ),
 )
@@ -0,0 +1,204 @@
+"""
+Index audit: seeds the database with synthetic users, posts, teams, memberships,
+subscriptions and articles, runs the repository queries against them, EXPLAINs every
+statement they issue and fails when a plan sequentially scans a table of more than
+--min-rows rows. Everything happens in one transaction that is rolled back.
+
+Run from the repository root against a migrated Postgres (alembic upgrade head):
+    python -m src.database.index_audit --rows 20000 --min-rows 1000
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator
+from uuid import uuid4
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
+
+from src.config.config import settings
+from src.database.models.article.article import Article
+from src.database.models.post.post import Post
+from src.database.models.subscription.subscription import Subscription
+from src.database.models.team.team import Team
+from src.database.models.team_member.team_member import TeamMember
+from src.database.models.user.user import User
+from src.repositories.article.article_repository import ArticleRepository
+from src.repositories.post.post_repository import PostRepository
+from src.repositories.subscription.subscription_repository import SubscriptionRepository
+from src.repositories.team.team_repository import TeamRepository
+from src.repositories.team_members.team_members_repository import TeamMemberRepository
+from src.repositories.user.user_repository import UserRepository
+
+AUDITED = ('select', 'with', 'update', 'delete')
+SEED_BATCH = 5000
+
+
+@dataclass
+class SeqScan:
+    query: str
+    relation: str
+    rows: int
+    statement: str
+
+
+def seq_scans(plan: dict) -> Iterator[dict]:
+    """
+    Yields every Seq Scan node of an EXPLAIN (FORMAT JSON) plan tree.
+    """
+    if plan.get('Node Type') == 'Seq Scan':
+        yield plan
+    for child in plan.get('Plans', []):
+        yield from seq_scans(child)
+
+
+@contextmanager
+def capture_statements(connection: AsyncConnection):
+    """
+    Collects the (statement, parameters) of the auditable statements run on connection.
+    """
+    statements: list[tuple[str, tuple]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().lower().startswith(AUDITED):
+            statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, 'before_cursor_execute', before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(connection.sync_connection, 'before_cursor_execute', before_cursor_execute)
+
+
+async def seed(session: AsyncSession, rows: int) -> dict:
+    """
+    Inserts rows posts and proportionate numbers of the other entities, then ANALYZEs the
+    tables so the planner sees their real sizes.
+
+    :return: Sample ids for the parameterised queries
+    """
+    users = max(rows // 10, 10)
+    user_ids = [uuid4() for _ in range(users)]
+    now = datetime.now(timezone.utc)
+    team_ids = [uuid4() for _ in range(max(users // 10, 1))]
+    tables = {
+        User: [
+            dict(id=_id, first_name='Audit', last_name=f'User{i}', email=f'audit-{i}-{_id.hex[:8]}@x.io', hashed_password=b'x')
+            for i, _id in enumerate(user_ids)
+        ],
+        Team: [dict(id=_id, name=f'Team {i}', owner_id=random.choice(user_ids), created_at=now) for i, _id in enumerate(team_ids)],
+        TeamMember: [dict(id=uuid4(), user_id=_id, team_id=random.choice(team_ids), joined_at=now) for _id in user_ids],
+        Subscription: [dict(id=uuid4(), access=1, created_at=now, end_at=now + timedelta(days=30), user_id=_id) for _id in user_ids],
+        Post: [
+            dict(id=uuid4(), title=f'Post {i}', body='Audit', user_id=random.choice(user_ids), event_id=uuid4(), track_id=None)
+            for i in range(rows)
+        ],
+        Article: [
+            dict(id=uuid4(), title=f'Article {i}', content='Audit', author_id=random.choice(user_ids), created_at=now)
+            for i in range(rows // 2)
+        ],
+    }
+    for model, values in tables.items():
+        for start in range(0, len(values), SEED_BATCH):
+            await session.execute(insert(model.__table__), values[start:start + SEED_BATCH])
+        await session.execute(text(f'ANALYZE {model.__tablename__}'))
+    return {
+        'user_id': user_ids[0],
+        'email': tables[User][0]['email'],
+        'team_id': tables[TeamMember][0]['team_id'],
+        'owner_id': tables[Team][0]['owner_id'],
+        'post_id': tables[Post][0]['id'],
+        'deleted_user_id': user_ids[-1],
+    }
+
+
+def queries(session: AsyncSession, ids: dict) -> dict:
+    """
+    The audited repository calls by name. Listings fetch a second page to cover the
+    cursor seek; the user delete covers the cascade deletes by foreign key.
+    """
+    posts, users, teams = PostRepository(session), UserRepository(session), TeamRepository(session)
+    members, subscriptions, articles = TeamMemberRepository(session), SubscriptionRepository(session), ArticleRepository(session)
+
+    def two_pages(get_all):
+        async def run():
+            page = await get_all()
+            if page.next_cursor:
+                await get_all(cursor=page.next_cursor)
+        return run
+
+    return {
+        'PostRepository.get_all': two_pages(posts.get_all),
+        'PostRepository.get_post': lambda: posts.get_post(ids['post_id']),
+        'UserRepository.get_all': two_pages(users.get_all),
+        'UserRepository.user_exists_by_email': lambda: users.user_exists_by_email(ids['email']),
+        'TeamRepository.get_all': two_pages(teams.get_all),
+        'TeamRepository.get_teams_by_owner_id': lambda: teams.get_teams_by_owner_id(ids['owner_id']),
+        'TeamMemberRepository.get_all_members': two_pages(members.get_all_members),
+        'TeamMemberRepository.get_team_members': lambda: members.get_team_members(ids['team_id']),
+        'TeamMemberRepository.get_user_teams': lambda: members.get_user_teams(ids['user_id']),
+        'TeamMemberRepository.team_member_exists_by_ids': lambda: members.team_member_exists_by_ids(ids['user_id'], ids['team_id']),
+        'SubscriptionRepository.get_all': two_pages(subscriptions.get_all),
+        'ArticleRepository.get_all': two_pages(articles.get_all),
+        'UserRepository.delete': lambda: users.delete(ids['deleted_user_id']),
+    }
+
+
+async def table_rows(connection: AsyncConnection, relation: str) -> int:
+    result = await connection.execute(
+        text('SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:relation)'), {'relation': relation}
+    )
+    return max(result.scalar() or 0, 0)
+
+
+async def audit(connection: AsyncConnection, rows: int, min_rows: int) -> list[SeqScan]:
+    session = AsyncSession(bind=connection, join_transaction_mode='create_savepoint', expire_on_commit=False)
+    ids = await seed(session, rows)
+    found = []
+    for name, query in queries(session, ids).items():
+        with capture_statements(connection) as statements:
+            await query()
+        for statement, parameters in statements:
+            result = await connection.exec_driver_sql(f'EXPLAIN (FORMAT JSON) {statement}', parameters)
+            plan = result.scalar()
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            for node in seq_scans(plan[0]['Plan']):
+                relation_rows = await table_rows(connection, node['Relation Name'])
+                if relation_rows > min_rows:
+                    found.append(SeqScan(name, node['Relation Name'], relation_rows, statement))
+    await session.close()
+    return found
+
+
+async def run(rows: int, min_rows: int) -> int:
+    engine = create_async_engine(settings.db.url)
+    try:
+        async with engine.connect() as connection:
+            transaction = await connection.begin()
+            try:
+                found = await audit(connection, rows, min_rows)
+            finally:
+                await transaction.rollback()
+    finally:
+        await engine.dispose()
+    for scan in found:
+        print(f'{scan.query}: Seq Scan on {scan.relation} ({scan.rows} rows)\n    {" ".join(scan.statement.split())[:300]}')
+    print(f'{len(found)} sequential scan(s) over {min_rows} rows' if found else 'No sequential scans over the threshold')
+    return 1 if found else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=20_000, help='Posts to seed; other tables are seeded in proportion')
+    parser.add_argument('--min-rows', type=int, default=1000, help='Fail on sequential scans of tables larger than this')
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args.rows, args.min_rows)))
+
+
+if __name__ == '__main__':
+    main()
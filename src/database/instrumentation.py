@@ -0,0 +1,105 @@
+import logging
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from fastapi import Request
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """
+    SQL issued within one request or task. Statements are compared by their SQL text,
+    which carries bind placeholders rather than values, so repeats of one shape with
+    different parameters count together.
+    """
+    n_plus_one_threshold: int = 10
+    slowest_kept: int = 5
+    statements: int = 0
+    total_seconds: float = 0.0
+    slowest: list[tuple[float, str]] = field(default_factory=list)
+    shapes: Counter = field(default_factory=Counter)
+    n_plus_one: list[str] = field(default_factory=list)
+
+    def record(self, statement: str, seconds: float) -> None:
+        self.statements += 1
+        self.total_seconds += seconds
+        self.slowest.append((seconds, statement))
+        self.slowest.sort(key=lambda item: item[0], reverse=True)
+        del self.slowest[self.slowest_kept:]
+        self.shapes[statement] += 1
+        if self.shapes[statement] == self.n_plus_one_threshold + 1:
+            self.n_plus_one.append(statement)
+            logger.warning('Possible N+1: statement repeated more than %d times: %s', self.n_plus_one_threshold, statement)
+
+    def summary(self) -> str:
+        slowest = '; '.join(f'{seconds * 1000:.1f}ms {statement[:120]}' for seconds, statement in self.slowest[:3])
+        return f'{self.statements} statements in {self.total_seconds * 1000:.1f}ms, slowest: {slowest}'
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar('current_query_stats', default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info['query_start'].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, time.perf_counter() - start)
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute
+    if context.connection is not None and context.connection.info.get('query_start'):
+        context.connection.info['query_start'].pop()
+
+
+def instrument_engine(engine: Engine | AsyncEngine) -> None:
+    """
+    Times every statement the engine runs and records it in the current QueryStats.
+    """
+    engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+    event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+    event.listen(engine, 'handle_error', _handle_error)
+
+
+@contextmanager
+def track_queries(label: str = 'task', n_plus_one_threshold: int | None = None):
+    """
+    Collects the SQL run in this context into a fresh QueryStats and logs a summary under
+    label at the end. Tasks created inside the context record into the same stats.
+    """
+    stats = QueryStats(n_plus_one_threshold=n_plus_one_threshold or settings.db.n_plus_one_threshold)
+    token = current_query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        current_query_stats.reset(token)
+        if stats.statements:
+            logger.info('SQL for %s: %s', label, stats.summary())
+
+
+async def query_stats_middleware(request: Request, call_next):
+    """
+    HTTP middleware (app.middleware('http')(query_stats_middleware)) tracking the SQL of
+    each request. In debug mode the numbers are also returned as X-DB-* headers.
+    """
+    with track_queries(f'{request.method} {request.url.path}') as stats:
+        response = await call_next(request)
+    if settings.debug:
+        response.headers['X-DB-Statements'] = str(stats.statements)
+        response.headers['X-DB-Time-Ms'] = f'{stats.total_seconds * 1000:.1f}'
+        response.headers['X-DB-N-Plus-One'] = str(len(stats.n_plus_one))
+    return response
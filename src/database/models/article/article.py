@@ -1,7 +1,7 @@
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import String, TEXT, ForeignKey, DATETIME, DateTime
+from sqlalchemy import String, TEXT, ForeignKey, DATETIME, DateTime, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID as UUID_2
 from src.database import Base
@@ -9,11 +9,12 @@ from src.database.models.user.user import User
 
 
 class Article(Base):
+    __table_args__ = (Index("ix_articles_created_at_id", "created_at", "id"), {"extend_existing": True})
 
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     content: Mapped[str] = mapped_column(TEXT, nullable=False)
 
-    author_id: Mapped[UUID_2] = mapped_column(ForeignKey('users.id'), nullable=False)
+    author_id: Mapped[UUID_2] = mapped_column(ForeignKey('users.id'), nullable=False, index=True)
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), default=sqlalchemy.func.now())
 
     # Relations
@@ -1,7 +1,7 @@
 import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID as UUID_2
-from sqlalchemy import String, JSON, DateTime, func, ForeignKey, UUID
+from sqlalchemy import String, JSON, DateTime, func, ForeignKey, UUID, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.base import Base
@@ -10,14 +10,16 @@ if TYPE_CHECKING:
 
 
 class Post(Base):
+    __table_args__ = (Index("ix_posts_created_at_id", "created_at", "id"), {"extend_existing": True})
+
     title: Mapped[str] = mapped_column(String(100), unique=False, nullable=False)
     body: Mapped[dict] = mapped_column(JSON, nullable=False, server_default='{}')
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), index=True)
     user: Mapped["User"] = relationship(back_populates="posts")
 
     # ForestLab relations
-    event_id: Mapped[UUID_2] = mapped_column(UUID, nullable=False)
+    event_id: Mapped[UUID_2] = mapped_column(UUID, nullable=False, index=True)
     track_id: Mapped[UUID_2] = mapped_column(UUID, nullable=True)
 
@@ -0,0 +1,15 @@
+import sqlalchemy
+from sqlalchemy import String, BigInteger, DateTime
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class StoredFile(Base):
+    __tablename__ = "stored_files"
+
+    filename: Mapped[str] = mapped_column(String(500), unique=True, nullable=False)
+    content_key: Mapped[str] = mapped_column(String(200), nullable=False, index=True)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    content_type: Mapped[str] = mapped_column(String(100), nullable=True)
+    created_at: Mapped[str] = mapped_column(DateTime(timezone=True), server_default=sqlalchemy.func.now())
@@ -1,7 +1,7 @@
 from uuid import UUID
 
 import sqlalchemy
-from sqlalchemy import INTEGER, DateTime, ForeignKey
+from sqlalchemy import INTEGER, DateTime, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID as UUID_2
 from src.database import Base
@@ -9,10 +9,12 @@ from src.database.models.user.user import User
 
 
 class Subscription(Base):
+    __table_args__ = (Index("ix_subscriptions_created_at_id", "created_at", "id"), {"extend_existing": True})
+
     access: Mapped[float] = mapped_column(INTEGER, nullable=False)
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), default=sqlalchemy.func.now(), nullable=False)
     end_at: Mapped[str] = mapped_column(DateTime(timezone=True), nullable=False)
 
     # Relations
-    user_id: Mapped[UUID_2] = mapped_column(ForeignKey('users.id'), nullable=False)
+    user_id: Mapped[UUID_2] = mapped_column(ForeignKey('users.id'), nullable=False, index=True)
     user: Mapped["User"] = relationship("User", back_populates="subscription")
@@ -2,7 +2,7 @@ from typing import TYPE_CHECKING
 
 import sqlalchemy
 import uuid
-from sqlalchemy import String, DateTime, UUID
+from sqlalchemy import String, DateTime, UUID, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from uuid import UUID as UUID_2
 from src.database import Base
@@ -12,9 +12,11 @@ if TYPE_CHECKING:
 
 
 class Team(Base):
+    __table_args__ = (Index("ix_teams_created_at_id", "created_at", "id"), {"extend_existing": True})
+
     name: Mapped[str] = mapped_column(String(100), nullable=False)
     description: Mapped[str] = mapped_column(String(255), nullable=True)
     created_at: Mapped[str] = mapped_column(DateTime(timezone=True), default=sqlalchemy.func.now())
-    owner_id: Mapped[UUID_2] = mapped_column(UUID(as_uuid=True), primary_key=False)
+    owner_id: Mapped[UUID_2] = mapped_column(UUID(as_uuid=True), primary_key=False, index=True)
     # Relations
     members: Mapped[list["TeamMember"]] = relationship("TeamMember", back_populates="team", cascade="all, delete")
@@ -1,7 +1,7 @@
 from uuid import UUID as UUID_2
 
 import sqlalchemy
-from sqlalchemy import ForeignKey, DateTime
+from sqlalchemy import ForeignKey, DateTime, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database import Base
@@ -11,9 +11,15 @@ from src.database.models.user.user import User
 
 class TeamMember(Base):
     __tablename__ = "team_members"
+    # unique_membership also serves as the index for lookups by user_id
+    __table_args__ = (
+        UniqueConstraint("user_id", "team_id", name="unique_membership"),
+        Index("ix_team_members_joined_at_id", "joined_at", "id"),
+        {"extend_existing": True},
+    )
 
     user_id: Mapped[UUID_2] = mapped_column(ForeignKey('users.id'), nullable=False)
-    team_id: Mapped[UUID_2] = mapped_column(ForeignKey('teams.id'), nullable=False)
+    team_id: Mapped[UUID_2] = mapped_column(ForeignKey('teams.id'), nullable=False, index=True)
     joined_at: Mapped[str] = mapped_column(DateTime(timezone=True), default=sqlalchemy.func.now())
 
     # Relations
@@ -1,7 +1,7 @@
 from typing import TYPE_CHECKING
 
 import sqlalchemy
-from sqlalchemy import String, Boolean, DateTime
+from sqlalchemy import String, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import BYTEA
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class User(Base):
+    __table_args__ = (Index("ix_users_last_name_id", "last_name", "id"), {"extend_existing": True})
+
     first_name: Mapped[str] = mapped_column(String(20), unique=False)
     last_name: Mapped[str] = mapped_column(String(20), unique=False)
     hashed_password: Mapped[bytes] = mapped_column(BYTEA, nullable=False)
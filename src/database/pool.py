@@ -0,0 +1,92 @@
+import bisect
+import time
+from dataclasses import dataclass, field
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram; counts() is cumulative per upper bound in seconds,
+    Prometheus style, with '+Inf' as the last bucket.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def counts(self) -> dict[str, int]:
+        result, running = {}, 0
+        for bound, count in zip((*map(str, self.buckets), '+Inf'), self.bucket_counts):
+            running += count
+            result[bound] = running
+        return result
+
+
+@dataclass
+class PoolStats:
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts_in_progress: int
+    checkouts: int
+    timeouts: int
+    checkout_seconds_total: float
+    checkout_latency: dict[str, int] = field(default_factory=dict)
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    AsyncAdaptedQueuePool that times every checkout: waiting for a free connection,
+    opening a new one and the pre-ping all count towards the checkout latency.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkout_latency = LatencyHistogram()
+        self.checkouts_in_progress = 0
+        self.timeouts = 0
+
+    def connect(self):
+        self.checkouts_in_progress += 1
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.checkouts_in_progress -= 1
+            self.checkout_latency.observe(time.perf_counter() - start)
+
+    def recreate(self) -> 'InstrumentedPool':
+        # engine.dispose() swaps in a fresh pool; keep the counters across it
+        pool = super().recreate()
+        pool.checkout_latency = self.checkout_latency
+        pool.timeouts = self.timeouts
+        return pool
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            # QueuePool counts unopened pool slots as negative overflow
+            overflow=max(self.overflow(), 0),
+            checkouts_in_progress=self.checkouts_in_progress,
+            checkouts=self.checkout_latency.count,
+            timeouts=self.timeouts,
+            checkout_seconds_total=self.checkout_latency.total,
+            checkout_latency=self.checkout_latency.counts(),
+        )
@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Delete, Insert, Update
+from sqlalchemy.sql.elements import TextClause
+
+logger = logging.getLogger(__name__)
+
+# Scope of read-your-writes stickiness, set per request by sticky_key_middleware. Commits
+# made without a key (e.g. background jobs) make nobody's reads sticky.
+sticky_key: ContextVar[str | None] = ContextVar('sticky_key', default=None)
+
+
+@dataclass
+class Replica:
+    engine: AsyncEngine
+    ejected_until: float = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        return time.monotonic() >= self.ejected_until
+
+
+class ReplicaRouter:
+    """
+    Picks the engine for each session: the primary for writes, and for reads a healthy
+    replica round-robin, unless the current sticky_key committed within the last
+    sticky_seconds. A replica whose connection fails is ejected for eject_seconds.
+    """
+
+    def __init__(
+            self,
+            primary: AsyncEngine,
+            replicas: list[AsyncEngine],
+            sticky_seconds: float = 5,
+            eject_seconds: float = 30,
+    ):
+        self.primary = primary
+        self.replicas = [Replica(engine) for engine in replicas]
+        self.sticky_seconds = sticky_seconds
+        self.eject_seconds = eject_seconds
+        self.last_writes: dict[str, float] = {}
+        self._next = 0
+        for replica in self.replicas:
+            event.listen(replica.engine.sync_engine, 'handle_error', self._on_error(replica))
+
+    def _on_error(self, replica: Replica):
+        def handle_error(context: ExceptionContext) -> None:
+            # Disconnects and failed connects eject; ordinary SQL errors do not
+            if context.is_disconnect or context.connection is None:
+                self.eject(replica)
+        return handle_error
+
+    def eject(self, replica: Replica) -> None:
+        replica.ejected_until = time.monotonic() + self.eject_seconds
+
+    def record_write(self) -> None:
+        key = sticky_key.get()
+        if key is None:
+            return
+        now = time.monotonic()
+        if len(self.last_writes) > 10000:
+            self.last_writes = {
+                key: at for key, at in self.last_writes.items() if now - at < self.sticky_seconds
+            }
+        self.last_writes[key] = now
+
+    def is_sticky(self) -> bool:
+        key = sticky_key.get()
+        return key in self.last_writes and time.monotonic() - self.last_writes[key] < self.sticky_seconds
+
+    def reader(self) -> AsyncEngine:
+        healthy = [replica for replica in self.replicas if replica.healthy]
+        if not healthy or self.is_sticky():
+            return self.primary
+        self._next = (self._next + 1) % len(healthy)
+        return healthy[self._next].engine
+
+    async def check_replicas(self) -> dict[str, bool]:
+        """
+        Probes every replica with SELECT 1, ejecting failing ones and readmitting
+        recovered ones. Meant to be run periodically.
+        """
+        result = {}
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as connection:
+                    await connection.execute(text('SELECT 1'))
+                replica.ejected_until = 0.0
+            except Exception:
+                self.eject(replica)
+            result[replica.engine.url.render_as_string(hide_password=True)] = replica.healthy
+        return result
+
+    async def run_checks(self, interval: float) -> None:
+        """
+        Runs check_replicas every interval seconds until cancelled.
+        """
+        while True:
+            try:
+                await self.check_replicas()
+            except Exception:
+                logger.exception('Replica health check failed')
+            await asyncio.sleep(interval)
+
+
+async def sticky_key_middleware(request: Request, call_next):
+    """
+    HTTP middleware (app.middleware('http')(sticky_key_middleware)) scoping read-your-writes
+    stickiness to the client: its Authorization header, hashed, or else its address.
+    """
+    authorization = request.headers.get('authorization')
+    if authorization:
+        key = hashlib.sha256(authorization.encode()).hexdigest()
+    else:
+        key = request.client.host if request.client else None
+    token = sticky_key.set(key)
+    try:
+        return await call_next(request)
+    finally:
+        sticky_key.reset(token)
+
+
+class RoutingSession(Session):
+    """
+    Session that reads from a replica and writes to the primary. Once a session has
+    flushed or run a write statement (or raw SQL, which cannot be classified) it stays on
+    the primary, so it reads its own uncommitted writes. The replica is chosen once per
+    session, so all its reads see one snapshot source.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._use_primary = False
+        self._reader = None
+
+    @property
+    def router(self) -> ReplicaRouter | None:
+        return self.info.get('router')
+
+    def use_primary(self) -> None:
+        self._use_primary = True
+
+    def get_bind(self, mapper=None, *, clause=None, **kw):
+        router = self.router
+        if router is None or not router.replicas:
+            return super().get_bind(mapper, clause=clause, **kw)
+        if (
+                self._flushing
+                or isinstance(clause, (Insert, Update, Delete, TextClause))
+                or getattr(clause, '_for_update_arg', None) is not None
+        ):
+            self._use_primary = True
+        if self._use_primary:
+            return router.primary.sync_engine
+        if self._reader is None:
+            self._reader = router.reader()
+        return self._reader.sync_engine
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+def _record_write(session: RoutingSession) -> None:
+    if session.router is not None and session._use_primary:
+        session.router.record_write()
@@ -0,0 +1,154 @@
+import asyncio
+import json
+import logging
+import random
+import time
+
+from sqlalchemy import Engine, event
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql import CompoundSelect, Select, visitors
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+
+def is_read_only(context: ExecutionContext) -> bool:
+    """
+    Whether the executed statement was compiled from a plain SELECT: not INSERT, UPDATE
+    or DELETE, not FOR UPDATE/SHARE, and without data-modifying CTEs or subqueries.
+    Raw SQL (text() or driver SQL) cannot be classified and is not read-only.
+    """
+    if context.isinsert or context.isupdate or context.isdelete or context.compiled is None:
+        return False
+    statement = context.compiled.statement
+    if not isinstance(statement, (Select, CompoundSelect)) or statement._for_update_arg is not None:
+        return False
+    return not any(isinstance(element, UpdateBase) for element in visitors.iterate(statement))
+
+
+def redact(parameters) -> object:
+    """
+    Replaces bound values by their type, keeping the shape (and lengths of strings and
+    sequences) so a plan can be reasoned about without leaking data into logs.
+    """
+    if isinstance(parameters, dict):
+        return {key: redact(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [redact(value) for value in parameters]
+    if parameters is None or isinstance(parameters, bool):
+        return parameters
+    if isinstance(parameters, (str, bytes)):
+        return f'<{type(parameters).__name__} len={len(parameters)}>'
+    return f'<{type(parameters).__name__}>'
+
+
+class RateLimiter:
+    """
+    Token bucket allowing `per_minute` events per minute with bursts of the same size.
+    """
+
+    def __init__(self, per_minute: int):
+        self.rate = per_minute / 60
+        self.capacity = per_minute
+        self.tokens = float(per_minute)
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class SlowQueryLog:
+    """
+    Logs statements slower than threshold as structured 'slow_query' records with
+    redacted parameters. A sampled, rate-limited share of slow SELECTs also gets an
+    EXPLAIN (ANALYZE, BUFFERS) plan, taken in the background on a dedicated connection
+    outside the engine's pool, so neither the request nor the pool waits for it.
+
+    Only plain SELECTs are explained (see is_read_only), as EXPLAIN ANALYZE executes the
+    statement: a write or locking read would run again, waiting on the request's locks.
+    """
+
+    def __init__(
+            self,
+            threshold: float = 0.5,
+            explain_sample_rate: float = 0.1,
+            explains_per_minute: int = 6,
+            explain_timeout: float = 10,
+    ):
+        self.threshold = threshold
+        self.explain_sample_rate = explain_sample_rate
+        self.limiter = RateLimiter(explains_per_minute)
+        self.explain_timeout = explain_timeout
+        self.explain_engines: dict[str, AsyncEngine] = {}
+        self.pending: set[asyncio.Task] = set()
+
+    def attach(self, engine: Engine | AsyncEngine) -> None:
+        engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        event.listen(engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine, 'after_cursor_execute', self._after_cursor_execute)
+        event.listen(engine, 'handle_error', self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('slow_query_start', []).append(time.perf_counter())
+
+    def _handle_error(self, context):
+        if context.connection is not None and context.connection.info.get('slow_query_start'):
+            context.connection.info['slow_query_start'].pop()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        duration = time.perf_counter() - conn.info['slow_query_start'].pop()
+        if duration < self.threshold:
+            return
+        record = {
+            'statement': statement,
+            'parameters': redact(parameters),
+            'duration_ms': round(duration * 1000, 1),
+            'database': conn.engine.url.render_as_string(hide_password=True),
+        }
+        logger.warning('slow_query %s', json.dumps(record, default=str), extra={'slow_query': record})
+        if self._should_explain(conn, context, executemany):
+            task = asyncio.get_running_loop().create_task(self.explain(conn.engine.url, statement, parameters, record))
+            self.pending.add(task)
+            task.add_done_callback(self.pending.discard)
+
+    def _should_explain(self, conn, context: ExecutionContext, executemany: bool) -> bool:
+        if executemany or conn.dialect.name != 'postgresql' or not is_read_only(context):
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        return random.random() < self.explain_sample_rate and self.limiter.allow()
+
+    async def explain(self, url, statement: str, parameters, record: dict) -> dict | None:
+        key = url.render_as_string(hide_password=False)
+        engine = self.explain_engines.get(key)
+        if engine is None:
+            engine = self.explain_engines[key] = create_async_engine(url, poolclass=NullPool)
+        try:
+            async with engine.connect() as connection:
+                await connection.exec_driver_sql(f'SET LOCAL statement_timeout = {int(self.explain_timeout * 1000)}')
+                result = await connection.exec_driver_sql(
+                    f'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}', parameters
+                )
+                plan = result.scalar()
+                await connection.rollback()
+        except Exception as err:
+            logger.info('slow_query_explain_failed %s: %s', record['statement'][:200], err)
+            return None
+        explained = {**record, 'plan': plan}
+        logger.warning('slow_query_plan %s', json.dumps(explained, default=str), extra={'slow_query': explained})
+        return explained
+
+    async def close(self) -> None:
+        await asyncio.gather(*self.pending, return_exceptions=True)
+        for engine in self.explain_engines.values():
+            await engine.dispose()
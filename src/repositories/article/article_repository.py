@@ -1,11 +1,15 @@
 from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.database.models.article.article import Article
 from src.schemas.article.article_schema import ArticleInput, ArticleOutput, ArticleEndpoint
+from src.schemas.pagination.pagination_schema import Page
+from src.repositories.pagination import paginate
+from src.repositories.utils import columns, delete_by_id, update_by_id
 
 
 class ArticleRepository:
@@ -28,32 +32,24 @@ class ArticleRepository:
         :param data: The input data to create the article
         :return: The created article as ArticleOutput
         """
-        article = Article(
+        stmt = insert(Article).values(
             title=data.title,
             content=data.content,
             author_id=data.author_id
-        )
-        self.session.add(article)
+        ).returning(*columns(Article))
+        row = (await self.session.execute(stmt)).mappings().one()
         await self.session.commit()
-        await self.session.refresh(article)
-        return ArticleOutput(
-            id=article.id,
-            title=article.title,
-            content=article.content,
-            author_id=article.author_id,
-            created_at=article.created_at
-        )
-
-    async def get_all(self) -> List[Optional[ArticleOutput]]:
+        return ArticleOutput(**row)
+
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[ArticleOutput]:
         """
-        Retrieves all articles from the database, ordered by creation date.
+        Retrieves one page of articles, ordered by creation date.
 
-        :return: A list of ArticleOutput objects representing all articles
+        :param limit: The page size, capped by the configured maximum
+        :param cursor: The next_cursor of the previous page, None for the first page
+        :return: A page of ArticleOutput objects with the cursor of the next page
         """
-        stmt = select(Article).order_by(Article.created_at)
-        result = await self.session.execute(stmt)
-        articles = result.scalars().all()
-        return [ArticleOutput(**article.__dict__) for article in articles]
+        return await paginate(self.session, Article, Article.created_at, ArticleOutput, limit, cursor)
 
     async def get_article(self, _id: UUID) -> ArticleOutput:
         """
@@ -73,36 +69,25 @@ class ArticleRepository:
             )
         return None
 
-    async def update(self, article: Article, data: ArticleEndpoint) -> ArticleOutput:
+    async def update(self, _id: UUID, data: ArticleEndpoint) -> Optional[ArticleOutput]:
         """
         Updates an existing article with the given data.
 
-        :param article: The article instance to update
+        :param _id: The ID of the article to update
         :param data: The new data for updating the article
-        :return: The updated article as ArticleOutput
+        :return: The updated article as ArticleOutput, or None if the article does not exist
         """
-        for key, value in data.model_dump(exclude_none=True).items():
-            setattr(article, key, value)
-        await self.session.commit()
-        await self.session.refresh(article)
-        return ArticleOutput(
-            id=article.id,
-            title=article.title,
-            content=article.content,
-            author_id=article.author_id,
-            created_at=article.created_at
-        )
-
-    async def delete(self, article: Article) -> bool:
+        row = await update_by_id(self.session, Article, _id, data.model_dump(exclude_none=True))
+        return ArticleOutput(**row) if row else None
+
+    async def delete(self, _id: UUID) -> bool:
         """
         Deletes an article from the database.
 
-        :param article: The article to delete
-        :return: True if the article was successfully deleted, otherwise False
+        :param _id: The ID of the article to delete
+        :return: True if the article was deleted, False if it does not exist
         """
-        await self.session.delete(article)
-        await self.session.commit()
-        return True
+        return await delete_by_id(self.session, Article, _id)
 
     async def article_exists_by_id(self, _id: UUID) -> bool:
         """
@@ -0,0 +1,86 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.config import settings
+from src.repositories.utils import output_columns, to_outputs
+from src.schemas.pagination.pagination_schema import Page
+
+
+class InvalidCursorError(ValueError):
+    pass
+
+
+def encode_cursor(sort_value, _id: UUID) -> str:
+    """
+    Encodes the position after a row, its (sort key, id), as an opaque URL-safe token.
+    """
+    value = sort_value.isoformat() if isinstance(sort_value, datetime) else sort_value
+    raw = json.dumps([value, str(_id)], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b'=').decode()
+
+
+def decode_cursor(cursor: str, sort_column) -> tuple:
+    """
+    Decodes a token of encode_cursor back to (sort key, id), typed for sort_column.
+
+    :raises InvalidCursorError: If the token was not produced by encode_cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        value, _id = json.loads(raw)
+        if value is not None and sort_column.type.python_type is datetime:
+            value = datetime.fromisoformat(value)
+        return value, UUID(_id)
+    except (ValueError, TypeError) as err:
+        raise InvalidCursorError(f'Invalid page cursor: {cursor!r}') from err
+
+
+def page_limit(limit: Optional[int]) -> int:
+    if limit is None:
+        return settings.db.page_size
+    return max(1, min(limit, settings.db.max_page_size))
+
+
+async def paginate(
+        session: AsyncSession,
+        model,
+        sort_column,
+        output,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        where: tuple = (),
+) -> Page:
+    """
+    Reads one page of model rows in (sort_column, id) order with keyset (seek)
+    pagination: the page starts after the cursor's row through a row-value comparison, so
+    with an index on (sort_column, id) every page costs the same however deep it is, and
+    rows inserted meanwhile neither repeat nor shift later pages. Only the columns output
+    needs are read, as plain rows.
+
+    :param limit: Page size, defaulting to and capped by the configured page sizes
+    :param cursor: next_cursor of the previous page, None for the first page
+    :param where: Extra filter criteria
+    :return: The page with the next_cursor to continue from
+    :raises InvalidCursorError: If cursor is not a valid cursor
+    """
+    limit = page_limit(limit)
+    stmt = (
+        select(*output_columns(model, output, sort_column, model.id))
+        .where(*where)
+        .order_by(sort_column, model.id)
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        stmt = stmt.where(tuple_(sort_column, model.id) > tuple_(*decode_cursor(cursor, sort_column), types=[sort_column.type, model.id.type]))
+    rows = (await session.execute(stmt)).mappings().all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1][sort_column.key], rows[-1]['id'])
+    return Page[output](items=to_outputs(output, rows), next_cursor=next_cursor, limit=limit)
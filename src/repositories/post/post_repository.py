@@ -1,10 +1,16 @@
-from typing import List, Optional
-from uuid import UUID
+from typing import AsyncIterator, List, Optional
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.database.models.post.post import Post
+from src.repositories.pagination import paginate
+from src.repositories.streaming import stream_all
+from src.repositories.utils import columns, delete_by_id, insert_many, update_by_id
+from src.schemas.bulk.bulk_schema import BulkResult
+from src.schemas.pagination.pagination_schema import Page
 from src.schemas.post.post_schema import PostInput, PostOutput, PostEndpoint
 
 
@@ -28,36 +34,52 @@ class PostRepository:
         :param data: The input data to create the post
         :return: The created post as PostOutput
         """
-        post = Post(
+        stmt = insert(Post).values(
             title=data.title,
             body=data.body,
             user_id=data.user_id,
             event_id=data.event_id,
             track_id=data.track_id
-        )
-        self.session.add(post)
+        ).returning(*columns(Post))
+        row = (await self.session.execute(stmt)).mappings().one()
         await self.session.commit()
-        await self.session.refresh(post)
-        return PostOutput(
-            id=post.id,
-            title=post.title,
-            body=post.body,
-            user_id=post.user_id,
-            event_id=post.event_id,
-            track_id=post.track_id,
-            created_at=post.created_at
-        )
+        return PostOutput(**row)
 
-    async def get_all(self) -> List[Optional[PostOutput]]:
+    async def create_many(self, data: List[PostInput]) -> BulkResult[PostOutput]:
         """
-        Retrieves all posts from the database, ordered by creation date.
+        Creates many posts in a single transaction with batched multi-row INSERTs.
 
-        :return: A list of PostOutput objects representing all posts
+        :param data: The input data of the posts to create
+        :return: The created post or the error for every input row, in input order
         """
-        stmt = select(Post).order_by(Post.created_at)
-        result = await self.session.execute(stmt)
-        posts = result.scalars().all()
-        return [PostOutput(**post.__dict__) for post in posts]
+        rows = [
+            dict(id=uuid4(), title=post.title, body=post.body, user_id=post.user_id,
+                 event_id=post.event_id, track_id=post.track_id)
+            for post in data
+        ]
+        stmt = insert(Post).returning(*columns(Post))
+        return await insert_many(self.session, stmt, rows, PostOutput)
+
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[PostOutput]:
+        """
+        Retrieves one page of posts, ordered by creation date.
+
+        :param limit: The page size, capped by the configured maximum
+        :param cursor: The next_cursor of the previous page, None for the first page
+        :return: A page of PostOutput objects with the cursor of the next page
+        """
+        return await paginate(self.session, Post, Post.created_at, PostOutput, limit, cursor)
+
+    async def stream_all(self, fetch_size: Optional[int] = None) -> AsyncIterator[PostOutput]:
+        """
+        Yields every post, ordered by creation date, through a server-side cursor, for
+        exports that need the whole table without holding it in memory.
+
+        :param fetch_size: The number of rows fetched per round trip
+        :return: An async iterator of PostOutput objects
+        """
+        async for item in stream_all(self.session, Post, Post.created_at, PostOutput, fetch_size):
+            yield item
 
     async def get_post(self, _id: UUID) -> PostOutput:
         """
@@ -79,35 +101,22 @@ class PostRepository:
             )
         return None
 
-    async def update(self, post: Post, data: PostEndpoint) -> PostOutput:
+    async def update(self, _id: UUID, data: PostEndpoint) -> Optional[PostOutput]:
         """
         Updates an existing post with the given data.
 
-        :param post: The post instance to update
+        :param _id: The ID of the post to update
         :param data: The new data for updating the post
-        :return: The updated post as PostOutput
+        :return: The updated post as PostOutput, or None if the post does not exist
         """
-        for key, value in data.model_dump(exclude_none=True).items():
-            setattr(post, key, value)
-        await self.session.commit()
-        await self.session.refresh(post)
-        return PostOutput(
-            id=post.id,
-            title=post.title,
-            body=post.body,
-            user_id=post.user_id,
-            event_id=post.event_id,
-            track_id=post.track_id,
-            created_at=post.created_at
-        )
-
-    async def delete(self, post: Post) -> bool:
+        row = await update_by_id(self.session, Post, _id, data.model_dump(exclude_none=True))
+        return PostOutput(**row) if row else None
+
+    async def delete(self, _id: UUID) -> bool:
         """
         Deletes a post from the database.
 
-        :param post: The post to delete
-        :return: True if the post was successfully deleted, otherwise False
+        :param _id: The ID of the post to delete
+        :return: True if the post was deleted, False if it does not exist
         """
-        await self.session.delete(post)
-        await self.session.commit()
-        return True
+        return await delete_by_id(self.session, Post, _id)
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.stored_file.stored_file import StoredFile
+from src.repositories.utils import columns
+from src.schemas.stored_file.stored_file_schema import StoredFileInput, StoredFileOutput
+
+
+class StoredFileRepository:
+    """
+    Repository for the filename -> content key references of deduplicated uploads.
+    """
+
+    def __init__(self, session: AsyncSession):
+        """
+        Initializes the repository with a database session.
+
+        :param session: The AsyncSession to interact with the database
+        """
+        self.session = session
+
+    async def set_reference(self, data: StoredFileInput) -> StoredFileOutput:
+        """
+        Points a filename at a content key, replacing any previous reference.
+
+        :param data: The filename and the content it refers to
+        :return: The stored reference as StoredFileOutput
+        """
+        values = data.model_dump()
+        stmt = (
+            insert(StoredFile)
+            .values(**values)
+            .on_conflict_do_update(index_elements=[StoredFile.filename], set_=values)
+            .returning(*columns(StoredFile))
+        )
+        row = (await self.session.execute(stmt)).mappings().one()
+        await self.session.commit()
+        return StoredFileOutput(**row)
+
+    async def get_by_filename(self, filename: str) -> Optional[StoredFileOutput]:
+        """
+        Retrieves the reference for a filename.
+
+        :param filename: The name the file was uploaded under
+        :return: The reference as StoredFileOutput if found, otherwise None
+        """
+        stored_file = await self.session.scalar(select(StoredFile).where(StoredFile.filename == filename))
+        if stored_file:
+            return StoredFileOutput(
+                id=stored_file.id,
+                filename=stored_file.filename,
+                content_key=stored_file.content_key,
+                size=stored_file.size,
+                content_type=stored_file.content_type,
+                created_at=stored_file.created_at
+            )
+        return None
+
+    async def count_references(self, content_key: str) -> int:
+        """
+        Counts the filenames that point at a content key.
+
+        :param content_key: The content-addressed storage key
+        :return: The number of references
+        """
+        stmt = select(func.count()).select_from(StoredFile).where(StoredFile.content_key == content_key)
+        return await self.session.scalar(stmt)
@@ -0,0 +1,57 @@
+from typing import AsyncIterable, AsyncIterator, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config.config import settings
+from src.repositories.utils import output_columns, to_outputs
+
+
+async def stream_all(
+        session: AsyncSession,
+        model,
+        sort_column,
+        output,
+        fetch_size: Optional[int] = None,
+        where: tuple = (),
+) -> AsyncIterator:
+    """
+    Yields every model row matching where as output, in (sort_column, id) order, read
+    through a server-side cursor fetch_size rows at a time. Only one fetch is held in
+    memory however large the table is.
+
+    The cursor lives in the session's transaction, so the session must stay open (and
+    not commit) until the iteration ends.
+
+    :param fetch_size: Rows per round trip, defaulting to the configured stream fetch size
+    """
+    stmt = (
+        select(*output_columns(model, output))
+        .where(*where)
+        .order_by(sort_column, model.id)
+        .execution_options(yield_per=fetch_size or settings.db.stream_fetch_size)
+    )
+    result = await session.stream(stmt)
+    try:
+        async for partition in result.mappings().partitions():
+            for item in to_outputs(output, partition):
+                yield item
+    finally:
+        await result.close()
+
+
+async def ndjson(items: AsyncIterable[BaseModel], lines_per_chunk: int = 100) -> AsyncIterator[bytes]:
+    """
+    Serialises items as newline-delimited JSON, one object per line, yielding chunks of
+    up to lines_per_chunk lines, e.g. as the body of a StreamingResponse with media type
+    application/x-ndjson.
+    """
+    lines = []
+    async for item in items:
+        lines.append(item.model_dump_json())
+        if len(lines) >= lines_per_chunk:
+            yield ('\n'.join(lines) + '\n').encode()
+            lines = []
+    if lines:
+        yield ('\n'.join(lines) + '\n').encode()
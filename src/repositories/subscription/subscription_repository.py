@@ -1,11 +1,16 @@
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from src.database.models.subscription.subscription import Subscription
 from src.schemas.subscription.subscription_schema import SubscriptionOutput, SubscriptionEndpoint, SubscriptionInput
+from src.schemas.pagination.pagination_schema import Page
+from src.schemas.bulk.bulk_schema import BulkResult
+from src.repositories.pagination import paginate
+from src.repositories.utils import columns, delete_by_id, insert_many, update_by_id
 
 
 class SubscriptionRepository:
@@ -28,32 +33,38 @@ class SubscriptionRepository:
         :param data: The input data to create the subscription
         :return: The created subscription as SubscriptionOutput
         """
-        subscription = Subscription(
+        stmt = insert(Subscription).values(
             access=data.access,
             end_at=data.end_at,
             user_id=data.user_id
-        )
-        self.session.add(subscription)
+        ).returning(*columns(Subscription))
+        row = (await self.session.execute(stmt)).mappings().one()
         await self.session.commit()
-        await self.session.refresh(subscription)
-        return SubscriptionOutput(
-            id=subscription.id,
-            access=subscription.access,
-            created_at=subscription.created_at,
-            end_at=subscription.end_at,
-            user_id=subscription.user_id
-        )
+        return SubscriptionOutput(**row)
 
-    async def get_all(self) -> List[Optional[SubscriptionOutput]]:
+    async def create_many(self, data: List[SubscriptionInput]) -> BulkResult[SubscriptionOutput]:
         """
-        Retrieves all subscriptions from the database, ordered by creation date.
+        Creates many subscriptions in a single transaction with batched multi-row INSERTs.
 
-        :return: A list of SubscriptionOutput objects representing all subscriptions
+        :param data: The input data of the subscriptions to create
+        :return: The created subscription or the error for every input row, in input order
         """
-        stmt = select(Subscription).order_by(Subscription.created_at)
-        result = await self.session.execute(stmt)
-        subscriptions = result.scalars().all()
-        return [SubscriptionOutput(**subscription.__dict__) for subscription in subscriptions]
+        rows = [
+            dict(id=uuid4(), access=subscription.access, end_at=subscription.end_at, user_id=subscription.user_id)
+            for subscription in data
+        ]
+        stmt = insert(Subscription).returning(*columns(Subscription))
+        return await insert_many(self.session, stmt, rows, SubscriptionOutput)
+
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[SubscriptionOutput]:
+        """
+        Retrieves one page of subscriptions, ordered by creation date.
+
+        :param limit: The page size, capped by the configured maximum
+        :param cursor: The next_cursor of the previous page, None for the first page
+        :return: A page of SubscriptionOutput objects with the cursor of the next page
+        """
+        return await paginate(self.session, Subscription, Subscription.created_at, SubscriptionOutput, limit, cursor)
 
     async def get_subscription(self, _id: UUID) -> SubscriptionOutput:
         """
@@ -73,36 +84,25 @@ class SubscriptionRepository:
             )
         return None
 
-    async def update(self, subscription: Subscription, data: SubscriptionEndpoint) -> SubscriptionOutput:
+    async def update(self, _id: UUID, data: SubscriptionEndpoint) -> Optional[SubscriptionOutput]:
         """
         Updates an existing subscription with the given data.
 
-        :param subscription: The subscription instance to update
+        :param _id: The ID of the subscription to update
         :param data: The new data for updating the subscription
-        :return: The updated subscription as SubscriptionOutput
+        :return: The updated subscription as SubscriptionOutput, or None if the subscription does not exist
         """
-        for key, value in data.model_dump(exclude_none=True).items():
-            setattr(subscription, key, value)
-        await self.session.commit()
-        await self.session.refresh(subscription)
-        return SubscriptionOutput(
-            id=subscription.id,
-            access=subscription.access,
-            created_at=subscription.created_at,
-            end_at=subscription.end_at,
-            user_id=subscription.user_id
-        )
+        row = await update_by_id(self.session, Subscription, _id, data.model_dump(exclude_none=True))
+        return SubscriptionOutput(**row) if row else None
 
-    async def delete(self, subscription: Subscription) -> bool:
+    async def delete(self, _id: UUID) -> bool:
         """
         Deletes a subscription from the database.
 
-        :param subscription: The subscription to delete
-        :return: True if the subscription was successfully deleted, otherwise False
+        :param _id: The ID of the subscription to delete
+        :return: True if the subscription was deleted, False if it does not exist
         """
-        await self.session.delete(subscription)
-        await self.session.commit()
-        return True
+        return await delete_by_id(self.session, Subscription, _id)
 
     async def subscription_exists_by_id(self, _id: UUID) -> bool:
         """
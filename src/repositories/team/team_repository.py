@@ -1,11 +1,14 @@
 from typing import List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.team.team import Team
 from src.schemas.team.team_schema import TeamInput, TeamOutput, TeamEndpoint
+from src.schemas.pagination.pagination_schema import Page
+from src.repositories.pagination import paginate
+from src.repositories.utils import columns, delete_by_id, output_columns, to_outputs, update_by_id
 
 
 class TeamRepository:
@@ -28,32 +31,24 @@ class TeamRepository:
         :param data: The input data to create the team
         :return: The created team as TeamOutput
         """
-        team = Team(
+        stmt = insert(Team).values(
             name=data.name,
             description=data.description,
             owner_id=data.owner_id
-        )
-        self.session.add(team)
+        ).returning(*columns(Team))
+        row = (await self.session.execute(stmt)).mappings().one()
         await self.session.commit()
-        await self.session.refresh(team)
-        return TeamOutput(
-            id=team.id,
-            name=team.name,
-            description=team.description,
-            owner_id=team.owner_id,
-            created_at=team.created_at
-        )
+        return TeamOutput(**row)
 
-    async def get_all(self) -> List[Optional[TeamOutput]]:
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[TeamOutput]:
         """
-        Retrieves all teams from the database, ordered by creation date.
+        Retrieves one page of teams, ordered by creation date.
 
-        :return: A list of TeamOutput objects representing all teams
+        :param limit: The page size, capped by the configured maximum
+        :param cursor: The next_cursor of the previous page, None for the first page
+        :return: A page of TeamOutput objects with the cursor of the next page
         """
-        stmt = select(Team).order_by(Team.created_at)
-        result = await self.session.execute(stmt)
-        teams = result.scalars().all()
-        return [TeamOutput(**team.__dict__) for team in teams]
+        return await paginate(self.session, Team, Team.created_at, TeamOutput, limit, cursor)
 
     async def get_team(self, _id: UUID) -> TeamOutput:
         """
@@ -80,41 +75,29 @@ class TeamRepository:
         :param owner_id: The ID of the team owner
         :return: A list of teams owned by the given user as TeamOutput
         """
-        stmt = select(Team).where(Team.owner_id == owner_id).order_by(Team.created_at)
-        result = await self.session.execute(stmt)
-        teams = result.scalars().all()
-        return [TeamOutput(**team.__dict__) for team in teams]
+        stmt = select(*output_columns(Team, TeamOutput)).where(Team.owner_id == owner_id).order_by(Team.created_at)
+        teams = (await self.session.execute(stmt)).mappings().all()
+        return to_outputs(TeamOutput, teams)
 
-    async def update(self, team: Team, data: TeamEndpoint) -> TeamOutput:
+    async def update(self, _id: UUID, data: TeamEndpoint) -> Optional[TeamOutput]:
         """
         Updates an existing team with the given data.
 
-        :param team: The team instance to update
+        :param _id: The ID of the team to update
         :param data: The new data for updating the team
-        :return: The updated team as TeamOutput
+        :return: The updated team as TeamOutput, or None if the team does not exist
         """
-        for key, value in data.model_dump(exclude_none=True).items():
-            setattr(team, key, value)
-        await self.session.commit()
-        await self.session.refresh(team)
-        return TeamOutput(
-            id=team.id,
-            name=team.name,
-            description=team.description,
-            owner_id=team.owner_id,
-            created_at=team.created_at
-        )
+        row = await update_by_id(self.session, Team, _id, data.model_dump(exclude_none=True))
+        return TeamOutput(**row) if row else None
 
-    async def delete(self, team: Team) -> bool:
+    async def delete(self, _id: UUID) -> bool:
         """
         Deletes a team from the database.
 
-        :param team: The team to delete
-        :return: True if the team was successfully deleted, otherwise False
+        :param _id: The ID of the team to delete
+        :return: True if the team was deleted, False if it does not exist
         """
-        await self.session.delete(team)
-        await self.session.commit()
-        return True
+        return await delete_by_id(self.session, Team, _id)
 
     async def team_exists_by_id(self, _id: UUID) -> bool:
         """
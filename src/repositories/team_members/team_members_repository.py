@@ -1,11 +1,16 @@
-from typing import List
-from uuid import UUID
+from typing import List, Optional
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.team_member.team_member import TeamMember
 from src.schemas.team_member.team_member_schema import TeamMemberOutput, TeamMemberInput, TeamMemberEndpoint
+from src.schemas.pagination.pagination_schema import Page
+from src.schemas.bulk.bulk_schema import BulkResult
+from src.repositories.pagination import paginate
+from src.repositories.utils import columns, delete_by_id, insert_many, output_columns, to_outputs, update_by_id
 
 
 class TeamMemberRepository:
@@ -28,30 +33,40 @@ class TeamMemberRepository:
         :param data: The input data to add a user to a team
         :return: The added team member as TeamMemberOutput
         """
-        team_member = TeamMember(
+        stmt = insert(TeamMember).values(
             user_id=data.user_id,
             team_id=data.team_id
-        )
-        self.session.add(team_member)
+        ).returning(*columns(TeamMember))
+        row = (await self.session.execute(stmt)).mappings().one()
         await self.session.commit()
-        await self.session.refresh(team_member)
-        return TeamMemberOutput(
-            id=team_member.id,
-            user_id=team_member.user_id,
-            team_id=team_member.team_id,
-            joined_at=team_member.joined_at
+        return TeamMemberOutput(**row)
+
+    async def add_members(self, data: List[TeamMemberInput]) -> BulkResult[TeamMemberOutput]:
+        """
+        Adds many users to teams in a single transaction with batched multi-row INSERTs.
+        Memberships that already exist (or repeat within data) are skipped through
+        ON CONFLICT on the unique_membership constraint and reported as errors.
+
+        :param data: The input data of the memberships to add
+        :return: The added team member or the error for every input row, in input order
+        """
+        rows = [dict(id=uuid4(), user_id=member.user_id, team_id=member.team_id) for member in data]
+        stmt = (
+            pg_insert(TeamMember)
+            .on_conflict_do_nothing(constraint='unique_membership')
+            .returning(*columns(TeamMember))
         )
+        return await insert_many(self.session, stmt, rows, TeamMemberOutput, duplicate_error='Already a member of this team')
 
-    async def get_all_members(self) -> List[TeamMemberOutput]:
+    async def get_all_members(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[TeamMemberOutput]:
         """
-        Retrieves all team members.
+        Retrieves one page of team members, ordered by join date.
 
-        :return: A list of all team members as TeamMemberOutput
+        :param limit: The page size, capped by the configured maximum
+        :param cursor: The next_cursor of the previous page, None for the first page
+        :return: A page of TeamMemberOutput objects with the cursor of the next page
         """
-        stmt = select(TeamMember).order_by(TeamMember.joined_at)
-        result = await self.session.execute(stmt)
-        members = result.scalars().all()
-        return [TeamMemberOutput(**member.__dict__) for member in members]
+        return await paginate(self.session, TeamMember, TeamMember.joined_at, TeamMemberOutput, limit, cursor)
 
     async def get_team_members(self, team_id: UUID) -> List[TeamMemberOutput]:
         """
@@ -60,10 +75,13 @@ class TeamMemberRepository:
         :param team_id: The ID of the team
         :return: A list of team members for the given team as TeamMemberOutput
         """
-        stmt = select(TeamMember).where(TeamMember.team_id == team_id).order_by(TeamMember.joined_at)
-        result = await self.session.execute(stmt)
-        members = result.scalars().all()
-        return [TeamMemberOutput(**member.__dict__) for member in members]
+        stmt = (
+            select(*output_columns(TeamMember, TeamMemberOutput))
+            .where(TeamMember.team_id == team_id)
+            .order_by(TeamMember.joined_at)
+        )
+        members = (await self.session.execute(stmt)).mappings().all()
+        return to_outputs(TeamMemberOutput, members)
 
     async def get_user_teams(self, user_id: UUID) -> List[TeamMemberOutput]:
         """
@@ -72,40 +90,33 @@ class TeamMemberRepository:
         :param user_id: The ID of the user
         :return: A list of teams the user belongs to as TeamMemberOutput
         """
-        stmt = select(TeamMember).where(TeamMember.user_id == user_id).order_by(TeamMember.joined_at)
-        result = await self.session.execute(stmt)
-        members = result.scalars().all()
-        return [TeamMemberOutput(**member.__dict__) for member in members]
+        stmt = (
+            select(*output_columns(TeamMember, TeamMemberOutput))
+            .where(TeamMember.user_id == user_id)
+            .order_by(TeamMember.joined_at)
+        )
+        members = (await self.session.execute(stmt)).mappings().all()
+        return to_outputs(TeamMemberOutput, members)
 
-    async def update(self, team_member: TeamMember, data: TeamMemberEndpoint) -> TeamMemberOutput:
+    async def update(self, _id: UUID, data: TeamMemberEndpoint) -> Optional[TeamMemberOutput]:
         """
         Updates a team member's details (e.g., changing the team).
 
-        :param team_member: The team member instance to update
+        :param _id: The ID of the team member to update
         :param data: The new data for updating the team member
-        :return: The updated team member as TeamMemberOutput
+        :return: The updated team member as TeamMemberOutput, or None if the team member does not exist
         """
-        for key, value in data.model_dump(exclude_none=True).items():
-            setattr(team_member, key, value)
-        await self.session.commit()
-        await self.session.refresh(team_member)
-        return TeamMemberOutput(
-            id=team_member.id,
-            user_id=team_member.user_id,
-            team_id=team_member.team_id,
-            joined_at=team_member.joined_at
-        )
+        row = await update_by_id(self.session, TeamMember, _id, data.model_dump(exclude_none=True))
+        return TeamMemberOutput(**row) if row else None
 
-    async def delete(self, team_member: TeamMember) -> bool:
+    async def delete(self, _id: UUID) -> bool:
         """
         Removes a user from a team.
 
-        :param team_member: The team member to remove
-        :return: True if the team member was successfully removed, otherwise False
+        :param _id: The ID of the team member to delete
+        :return: True if the team member was deleted, False if it does not exist
         """
-        await self.session.delete(team_member)
-        await self.session.commit()
-        return True
+        return await delete_by_id(self.session, TeamMember, _id)
 
     async def team_member_exists_by_ids(self, user_id: UUID, team_id: UUID) -> bool:
         """
@@ -1,12 +1,16 @@
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from pydantic import UUID4
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.user.user import User
 from src.repositories.user.utils import hash_password
+from src.repositories.pagination import paginate
+from src.repositories.streaming import stream_all
+from src.repositories.utils import columns, delete_by_id, update_by_id
 from src.schemas.user.user_schema import UserInput, UserOutput
+from src.schemas.pagination.pagination_schema import Page
 
 
 class UserRepository:
@@ -29,35 +33,37 @@ class UserRepository:
         :param data: The input data to create a user.
         :return: The created user as UserOutput.
         """
-        user = User(
+        stmt = insert(User).values(
             first_name=data.first_name,
             last_name=data.last_name,
             email=data.email,
             hashed_password=hash_password(data.password),
-            access=data.access,
             is_active=data.is_active
-        )
-        self.session.add(user)
+        ).returning(*columns(User))
+        row = (await self.session.execute(stmt)).mappings().one()
         await self.session.commit()
-        await self.session.refresh(user)
-        return UserOutput(
-            id=user.id,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            email=user.email,
-            is_active=user.is_active
-        )
+        return UserOutput(**row)
 
-    async def get_all(self) -> List[Optional[UserOutput]]:
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[UserOutput]:
         """
-        Retrieves all users from the database, ordered by last name.
+        Retrieves one page of users, ordered by last name.
 
-        :return: A list of UserOutput objects.
+        :param limit: The page size, capped by the configured maximum
+        :param cursor: The next_cursor of the previous page, None for the first page
+        :return: A page of UserOutput objects with the cursor of the next page
         """
-        stmt = select(User).order_by(User.last_name)
-        result = await self.session.execute(stmt)
-        users = result.scalars().all()
-        return [UserOutput(**user.__dict__) for user in users]
+        return await paginate(self.session, User, User.last_name, UserOutput, limit, cursor)
+
+    async def stream_all(self, fetch_size: Optional[int] = None) -> AsyncIterator[UserOutput]:
+        """
+        Yields every user, ordered by last name, through a server-side cursor, for
+        exports that need the whole table without holding it in memory.
+
+        :param fetch_size: The number of rows fetched per round trip
+        :return: An async iterator of UserOutput objects
+        """
+        async for item in stream_all(self.session, User, User.last_name, UserOutput, fetch_size):
+            yield item
 
     async def get_user(self, _id: UUID4) -> UserOutput:
         """
@@ -98,27 +104,26 @@ class UserRepository:
         user = await self.session.scalar(select(User).where(User.email == email))
         return user is not None
 
-    async def update(self, user: User, data: UserInput) -> UserOutput:
+    async def update(self, _id: UUID4, data: UserInput) -> Optional[UserOutput]:
         """
         Updates the user with the given data.
 
-        :param user: The user instance to update.
+        :param _id: The ID of the user to update.
         :param data: The new data to update the user with.
-        :return: The updated user as UserOutput.
+        :return: The updated user as UserOutput, or None if the user is not found.
         """
-        for key, value in data.model_dump(exclude_none=True).items():
-            setattr(user, key, value)
-        await self.session.commit()
-        await self.session.refresh(user)
-        return UserOutput(**user.__dict__)
+        values = data.model_dump(exclude_none=True)
+        if 'password' in values:
+            values['hashed_password'] = hash_password(values.pop('password'))
+        row = await update_by_id(self.session, User, _id, values)
+        return UserOutput(**row) if row else None
 
-    async def delete(self, user: User) -> bool:
+    async def delete(self, _id: UUID4) -> bool:
         """
-        Deletes a user from the database.
+        Deletes a user from the database, together with their posts, team memberships,
+        subscription and articles.
 
-        :param user: The user instance to delete.
-        :return: True if the user was successfully deleted, otherwise False.
+        :param _id: The ID of the user to delete.
+        :return: True if the user was deleted, False if the user is not found.
         """
-        await self.session.delete(user)
-        await self.session.commit()
-        return True
+        return await delete_by_id(self.session, User, _id)
@@ -0,0 +1,134 @@
+from functools import lru_cache
+from typing import Iterable, Optional
+from uuid import UUID
+
+from pydantic import TypeAdapter
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ONETOMANY
+
+from src.schemas.bulk.bulk_schema import BulkItem, BulkResult
+
+
+def columns(model) -> list:
+    """
+    All table columns of a model, for RETURNING / SELECT lists that build output schemas
+    straight from rows instead of loading ORM instances.
+    """
+    return list(model.__table__.c)
+
+
+def output_columns(model, output, *required) -> list:
+    """
+    The model's columns that the output schema has fields for, plus required ones (such
+    as sort keys), so a list query reads only what it returns.
+    """
+    table = model.__table__
+    names = [name for name in output.model_fields if name in table.c]
+    names += [column.key for column in required if column.key not in names]
+    return [table.c[name] for name in names]
+
+
+@lru_cache(maxsize=None)
+def output_adapter(output) -> TypeAdapter:
+    return TypeAdapter(list[output])
+
+
+def to_outputs(output, rows: Iterable, trusted: bool = False) -> list:
+    """
+    Builds output schemas from plain row mappings. The rows are validated by one call of
+    a cached list[output] validator, instead of a model constructor call per row.
+
+    With trusted=True validation is skipped altogether (model_construct); only for rows
+    whose column types already are the schema's field types.
+    """
+    if trusted:
+        return [output.model_construct(**row) for row in rows]
+    return output_adapter(output).validate_python(rows if isinstance(rows, list) else list(rows))
+
+
+async def update_by_id(session: AsyncSession, model, _id: UUID, values: dict) -> Optional[RowMapping]:
+    """
+    Conditionally updates one row with a single UPDATE ... RETURNING and commits.
+
+    :return: The updated row, or None when no row has this id
+    """
+    if values:
+        stmt = update(model).where(model.id == _id).values(**values).returning(*columns(model))
+    else:
+        stmt = select(*columns(model)).where(model.id == _id)
+    row = (await session.execute(stmt)).mappings().one_or_none()
+    await session.commit()
+    return row
+
+
+async def delete_by_id(session: AsyncSession, model, _id: UUID) -> bool:
+    """
+    Deletes one row with a single DELETE ... RETURNING and commits. Rows the model's
+    relationships cascade-delete in the ORM are removed in the same statement through
+    data-modifying CTEs, as the schema has no ON DELETE CASCADE.
+
+    :return: True if the row existed
+    """
+    stmt = delete(model).where(model.id == _id).returning(model.id)
+    for relationship in model.__mapper__.relationships:
+        if relationship.cascade.delete and relationship.direction is ONETOMANY:
+            (foreign_key,) = relationship.remote_side
+            stmt = stmt.add_cte(
+                delete(foreign_key.table).where(foreign_key == _id).returning(foreign_key).cte(f'deleted_{foreign_key.table.name}')
+            )
+    deleted = (await session.execute(stmt)).scalar_one_or_none()
+    await session.commit()
+    return deleted is not None
+
+
+async def _insert_batch(session: AsyncSession, stmt, rows: list[dict], start: int, returned: dict, errors: dict) -> None:
+    """
+    Inserts rows, which begin at input position start, in a savepoint. A failing batch is rolled back and bisected, so
+    the valid rows are still written and each failing row is isolated in O(log n) rounds.
+    """
+    try:
+        async with session.begin_nested():
+            result = await session.execute(stmt, rows)
+            returned.update((row['id'], row) for row in result.mappings())
+    except DBAPIError as err:
+        if len(rows) == 1:
+            errors[start] = str(err.orig).splitlines()[0]
+            return
+        middle = len(rows) // 2
+        await _insert_batch(session, stmt, rows[:middle], start, returned, errors)
+        await _insert_batch(session, stmt, rows[middle:], start + middle, returned, errors)
+
+
+async def insert_many(session: AsyncSession, stmt, rows: list[dict], output, duplicate_error: str = 'Duplicate row') -> BulkResult:
+    """
+    Inserts rows with one executemany of stmt (an INSERT ... RETURNING the model's
+    columns), which SQLAlchemy sends as batched multi-row INSERT ... VALUES statements,
+    and commits once. Every row carries its own id, so returned rows are matched back to
+    their input position.
+
+    If the batch fails (a constraint violation, or a value the column rejects) it is
+    bisected, so the valid rows are still written and every failing row gets its own
+    error. A row the statement skips (ON CONFLICT DO NOTHING) is reported with
+    duplicate_error. The results are built before the commit, so a row that does not
+    fit the output schema fails the call before anything is committed.
+
+    :return: The per-row results, in input order
+    """
+    returned: dict[UUID, RowMapping] = {}
+    errors: dict[int, str] = {}
+    if rows:
+        await _insert_batch(session, stmt, rows, 0, returned, errors)
+
+    items = []
+    for index, values in enumerate(rows):
+        if values['id'] in returned:
+            items.append(BulkItem[output](index=index, result=output(**returned[values['id']])))
+        else:
+            items.append(BulkItem[output](index=index, error=errors.get(index, duplicate_error)))
+    result = BulkResult[output](items=items, created=len(returned), failed=len(rows) - len(returned))
+    await session.commit()
+    return result
@@ -0,0 +1,17 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+# Schema for the outcome of one row of a bulk write, by its position in the input
+class BulkItem(BaseModel, Generic[T]):
+    index: int
+    result: Optional[T] = None
+    error: Optional[str] = None
+
+# Schema for output data (per-row results of a bulk write)
+class BulkResult(BaseModel, Generic[T]):
+    items: list[BulkItem[T]]
+    created: int
+    failed: int
@@ -0,0 +1,12 @@
+from typing import Generic, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar('T')
+
+# Schema for output data (one page of a keyset-paginated listing)
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    # Opaque cursor of the next page, None on the last page
+    next_cursor: Optional[str] = None
+    limit: int
@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
@@ -17,7 +19,7 @@ class PostOutput(BaseModel):
     body: str
     user_id: UUID
     event_id: UUID
-    track_id: UUID
+    track_id: Optional[UUID] = None
     created_at: datetime
 
 # Schema for endpoints (updating a post)
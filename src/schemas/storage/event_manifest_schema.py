@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+# Schema for one published artifact of an event bundle, e.g. its splits
+class BundleArtifact(BaseModel):
+    key: str
+    formats: list[str]
+
+# Schema for the manifest that makes a published event bundle visible to readers
+class EventManifest(BaseModel):
+    event: str
+    version: int
+    published_at: datetime
+    artifacts: dict[str, BundleArtifact]
@@ -0,0 +1,34 @@
+from pydantic import BaseModel, Field
+
+# Schema for a presigned single-request transfer
+class PresignedUrl(BaseModel):
+    key: str
+    url: str
+    method: str
+    expires_in: int
+
+# Schema for one presigned part of a multipart upload
+class PresignedPart(BaseModel):
+    part_number: int
+    url: str
+
+# Schema for a presigned multipart upload handed to the client
+class PresignedMultipartUpload(BaseModel):
+    key: str
+    upload_id: str
+    part_size: int
+    expires_in: int
+    parts: list[PresignedPart]
+
+# Schema for a part the client reports as uploaded
+class CompletedPart(BaseModel):
+    part_number: int = Field(ge=1, le=10000)
+    etag: str
+
+# Schema for the client's completion callback
+class PresignedUploadComplete(BaseModel):
+    key: str
+    size: int | None = None
+    content_type: str | None = None
+    upload_id: str | None = None
+    parts: list[CompletedPart] = []
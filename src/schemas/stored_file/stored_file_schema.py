@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from uuid import UUID
+
+# Schema for input data (pointing a filename at stored content)
+class StoredFileInput(BaseModel):
+    filename: str = Field(min_length=1, max_length=500)
+    content_key: str = Field(min_length=1, max_length=200)
+    size: int
+    content_type: str | None = None
+
+# Schema for output data (displaying a file reference)
+class StoredFileOutput(BaseModel):
+    id: UUID
+    filename: str
+    content_key: str
+    size: int
+    content_type: str | None
+    created_at: datetime
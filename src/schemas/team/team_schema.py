@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 from uuid import UUID
 from datetime import datetime
@@ -12,7 +14,7 @@ class TeamInput(BaseModel):
 class TeamOutput(BaseModel):
     id: UUID
     name: str
-    description: str
+    description: Optional[str] = None
     owner_id: UUID
     created_at: datetime
 
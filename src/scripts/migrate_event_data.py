@@ -0,0 +1,48 @@
+"""
+Writes Parquet copies of every event whose splits/routes are only stored as JSON.
+
+Run from the repository root:
+    python -m src.scripts.migrate_event_data [--dry-run]
+"""
+import argparse
+import asyncio
+
+from src.config import settings
+from src.services.storage.s3_helper import s3_helper
+from src.services.storage.storage_service import INDEX_SUFFIX, PARQUET_SUFFIX, StorageService
+
+
+async def json_only_events(storage: StorageService) -> list[str]:
+    client = await storage.s3.get_client()
+    paginator = client.get_paginator('list_objects_v2')
+    events = set()
+    for path in (settings.aws.AWS_SPLITS_PATH, settings.aws.AWS_ROUTES_PATH):
+        keys = set()
+        async for page in paginator.paginate(Bucket=storage.bucket, Prefix=path):
+            keys.update(obj['Key'] for obj in page.get('Contents', []))
+        for key in keys:
+            if key.endswith((PARQUET_SUFFIX, INDEX_SUFFIX)):
+                continue
+            if key + PARQUET_SUFFIX not in keys:
+                events.add(key[len(path):])
+    return sorted(events)
+
+
+async def main(dry_run: bool):
+    storage = StorageService()
+    try:
+        for event in await json_only_events(storage):
+            if dry_run:
+                print(event)
+                continue
+            outputs = await storage.migrate_event_data(event)
+            errors = [output.error for output in outputs if not output.status]
+            print(f'{event}: {"; ".join(errors) if errors else "ok"}')
+    finally:
+        await s3_helper.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--dry-run', action='store_true', help='Only list events that would be migrated')
+    asyncio.run(main(parser.parse_args().dry_run))
@@ -0,0 +1,136 @@
+import json
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterable, Callable, Iterable
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.post.post_schema import PostInput
+
+logger = logging.getLogger(__name__)
+
+STAGING_PREFIX = 'posts_import_staging'
+STAGING_COLUMNS = ('id', 'title', 'body', 'user_id', 'event_id', 'track_id')
+
+
+@dataclass
+class ImportProgress:
+    read: int = 0
+    staged: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.read / self.seconds if self.seconds else 0.0
+
+
+@dataclass
+class ImportReport(ImportProgress):
+    inserted: int = 0
+    # Staged rows the merge left out because their user does not exist
+    skipped: int = 0
+    # (input index, message) of the first max_errors rejected rows
+    errors: list[tuple[int, str]] = field(default_factory=list)
+
+
+class PostImportService:
+    """
+    Imports posts in bulk, e.g. the results of a whole event. Rows are validated as they
+    are read and streamed in batches into a temporary staging table with asyncpg's binary
+    COPY, then written to posts by one INSERT ... SELECT when the input ends. Only one
+    batch is held in memory, so the input can be an iterator or async iterator of any size.
+
+    The import is one transaction: the staging table is dropped on commit, and a failure
+    leaves posts untouched. Each import stages into its own uniquely named table, so
+    imports can run one after another inside an enclosing transaction.
+    """
+
+    def __init__(
+            self,
+            session: AsyncSession,
+            batch_size: int = 5000,
+            max_errors: int = 100,
+            on_progress: Callable[[ImportProgress], None] | None = None,
+    ):
+        self.session = session
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.on_progress = on_progress
+
+    async def import_posts(self, rows: Iterable[PostInput | dict] | AsyncIterable[PostInput | dict]) -> ImportReport:
+        """
+        :param rows: Posts as PostInput or dicts in the PostInput shape
+        :return: Counts of read, staged, rejected, inserted and skipped rows with timing
+        """
+        report = ImportReport()
+        start = time.perf_counter()
+        staging = f'{STAGING_PREFIX}_{uuid4().hex}'
+        await self.session.execute(text(
+            f'CREATE TEMPORARY TABLE {staging} '
+            f'(id uuid, title varchar(100), body json, user_id uuid, event_id uuid, track_id uuid) ON COMMIT DROP'
+        ))
+        connection = await self.session.connection()
+        driver = (await connection.get_raw_connection()).driver_connection
+
+        batch: list[tuple] = []
+        async for index, row in _enumerate(rows):
+            report.read += 1
+            try:
+                batch.append(_record(row if isinstance(row, PostInput) else PostInput.model_validate(row)))
+            except ValidationError as err:
+                report.rejected += 1
+                if len(report.errors) < self.max_errors:
+                    report.errors.append((index, str(err)))
+            if len(batch) >= self.batch_size:
+                await self._copy(driver, staging, batch, report, start)
+                batch = []
+        if batch:
+            await self._copy(driver, staging, batch, report, start)
+
+        result = await self.session.execute(text(
+            f'INSERT INTO posts ({", ".join(STAGING_COLUMNS)}) '
+            f'SELECT {", ".join(f"s.{column}" for column in STAGING_COLUMNS)} FROM {staging} s '
+            f'JOIN users u ON u.id = s.user_id'
+        ))
+        report.inserted = result.rowcount
+        await self.session.execute(text(f'DROP TABLE {staging}'))
+        report.skipped = report.staged - report.inserted
+        await self.session.commit()
+
+        report.seconds = time.perf_counter() - start
+        logger.info(
+            'Imported %d posts (%d rejected, %d skipped) in %.1fs, %.0f rows/s',
+            report.inserted, report.rejected, report.skipped, report.seconds, report.rows_per_s,
+        )
+        return report
+
+    async def _copy(self, driver, staging: str, batch: list[tuple], report: ImportReport, start: float) -> None:
+        await driver.copy_records_to_table(staging, records=batch, columns=STAGING_COLUMNS)
+        report.staged += len(batch)
+        report.seconds = time.perf_counter() - start
+        progress = ImportProgress(read=report.read, staged=report.staged, rejected=report.rejected, seconds=report.seconds)
+        logger.debug('Post import: %d rows staged, %.0f rows/s', progress.staged, progress.rows_per_s)
+        if self.on_progress is not None:
+            self.on_progress(progress)
+
+
+def _record(post: PostInput) -> tuple[UUID, str, str, UUID, UUID, UUID | None]:
+    # The JSON column holds the serialised body, as SQLAlchemy's JSON type writes it
+    return uuid4(), post.title, json.dumps(post.body), post.user_id, post.event_id, post.track_id
+
+
+async def _enumerate(rows):
+    index = 0
+    if hasattr(rows, '__aiter__'):
+        async for row in rows:
+            yield index, row
+            index += 1
+    else:
+        for row in rows:
+            yield index, row
+            index += 1
@@ -1,9 +1,12 @@
-from typing import List
+from typing import AsyncIterator, Optional
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
+from src.repositories.pagination import InvalidCursorError
+from src.repositories.streaming import ndjson
 from src.repositories.post.post_repository import PostRepository
+from src.schemas.pagination.pagination_schema import Page
 from src.schemas.post.post_schema import PostInput, PostOutput, PostRequest
 from src.services.event.event_service import EventService
 from src.services.statistics.statistics_service import StatisticsService
@@ -29,8 +32,17 @@ class PostService:
 
         return await self.repository.create(data)
 
-    async def get_all(self) -> List[PostOutput]:
-        return await self.repository.get_all()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[PostOutput]:
+        try:
+            return await self.repository.get_all(limit, cursor)
+        except InvalidCursorError as err:
+            raise HTTPException(status_code=400, detail=str(err))
+
+    def export_ndjson(self, fetch_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        :return: Every post as NDJSON chunks, for a StreamingResponse(media_type="application/x-ndjson")
+        """
+        return ndjson(self.repository.stream_all(fetch_size))
 
     async def get_post(self, _id: UUID4) -> PostOutput:
         post = await self.repository.get_by_id(_id)
@@ -39,14 +51,12 @@ class PostService:
         return post
 
     async def update(self, _id: UUID4, data: PostInput) -> PostOutput:
-        post = await self.repository.get_by_id(_id)
-        if not post:
+        updated_post = await self.repository.update(_id, data)
+        if not updated_post:
             raise HTTPException(status_code=404, detail="Post not found")
-        updated_post = await self.repository.update(post, data)
         return updated_post
 
     async def delete(self, _id: UUID4) -> bool:
-        post = await self.repository.get_by_id(_id)
-        if not post:
+        if not await self.repository.delete(_id):
             raise HTTPException(status_code=404, detail="Post not found")
-        return await self.repository.delete(post)
+        return True
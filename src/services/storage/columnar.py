@@ -0,0 +1,230 @@
+import json
+from io import BytesIO
+from typing import Awaitable, Callable, Iterable
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+# Reserved columns use the RESERVED_PREFIX namespace. Record keys starting with the prefix
+# are stored with it doubled, so no record field can collide with a reserved column.
+RESERVED_PREFIX = '__'
+RUNNER_COLUMN = '__runner__'
+CLASS_COLUMN = '__class__'
+VALUE_COLUMN = '__value__'
+RESERVED_COLUMNS = (RUNNER_COLUMN, CLASS_COLUMN, VALUE_COLUMN)
+CLASS_KEYS = ('class_name', 'class', 'group')
+JSON_COLUMNS_KEY = b'forestbook.json_columns'
+FOOTER_PREFETCH = 64 * 1024
+
+
+def field_column(key) -> str:
+    key = str(key)
+    return RESERVED_PREFIX + key if key.startswith(RESERVED_PREFIX) else key
+
+
+def column_field(column: str) -> str:
+    return column[len(RESERVED_PREFIX):] if column.startswith(RESERVED_PREFIX) else column
+
+
+def event_data_to_table(data: dict) -> pa.Table:
+    """
+    Flattens an event data dict ({runner: record}) into one row per runner, sorted by
+    class and runner so row group statistics can prune reads for either. Records that
+    are not dicts are stored in VALUE_COLUMN.
+    """
+    rows = []
+    for runner, record in data.items():
+        if isinstance(record, dict):
+            row = {field_column(key): value for key, value in record.items()}
+            class_name = next((record[key] for key in CLASS_KEYS if record.get(key) is not None), None)
+        else:
+            row, class_name = {VALUE_COLUMN: record}, None
+        row[RUNNER_COLUMN] = str(runner)
+        row[CLASS_COLUMN] = None if class_name is None else str(class_name)
+        rows.append(row)
+    rows.sort(key=lambda row: (row[CLASS_COLUMN] or '', row[RUNNER_COLUMN]))
+
+    # The runner and class columns exist even for an event without runners
+    columns = {RUNNER_COLUMN: None, CLASS_COLUMN: None, **{key: None for row in rows for key in row}}
+    json_columns = []
+    arrays = {}
+    for column in columns:
+        values = [row.get(column) for row in rows]
+        try:
+            arrays[column] = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            arrays[column] = pa.array([None if v is None else json.dumps(v, default=str) for v in values])
+            json_columns.append(column)
+    table = pa.table(arrays)
+    return table.replace_schema_metadata({JSON_COLUMNS_KEY: json.dumps(json_columns).encode()})
+
+
+def table_to_event_data(table: pa.Table) -> dict:
+    """
+    Inverse of event_data_to_table: rebuilds the {runner: record} dict. Columns are the
+    union of every record's keys, so nulls are dropped per row and each record gets back
+    only the fields it had; a field explicitly set to None is not restored.
+    """
+    metadata = table.schema.metadata or {}
+    json_columns = set(json.loads(metadata.get(JSON_COLUMNS_KEY, b'[]')))
+    data = {}
+    for row in table.to_pylist():
+        runner = row[RUNNER_COLUMN]
+        value = row.get(VALUE_COLUMN)
+        if value is not None:
+            data[runner] = json.loads(value) if VALUE_COLUMN in json_columns else value
+            continue
+        record = {}
+        for column, value in row.items():
+            if column in RESERVED_COLUMNS or value is None:
+                continue
+            record[column_field(column)] = json.loads(value) if column in json_columns else value
+        data[runner] = record
+    return data
+
+
+def write_parquet(data: dict, row_group_size: int) -> bytes:
+    buffer = BytesIO()
+    pq.write_table(
+        event_data_to_table(data),
+        buffer,
+        row_group_size=row_group_size,
+        compression='zstd',
+        write_statistics=True,
+    )
+    return buffer.getvalue()
+
+
+class SparseFile:
+    """
+    Read-only file object over a remote object of known size, backed only by the byte
+    ranges fetched so far. Lets pyarrow parse metadata and selected column chunks
+    without the rest of the object ever being downloaded.
+    """
+
+    closed = False
+
+    def __init__(self, size: int):
+        self.size = size
+        self.position = 0
+        self.ranges: list[tuple[int, bytes]] = []
+
+    def add(self, start: int, data: bytes) -> None:
+        self.ranges.append((start, data))
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        if whence == 0:
+            self.position = offset
+        elif whence == 1:
+            self.position += offset
+        else:
+            self.position = self.size + offset
+        return self.position
+
+    def read(self, n: int = -1) -> bytes:
+        if n is None or n < 0:
+            n = self.size - self.position
+        n = min(n, self.size - self.position)
+        for start, data in self.ranges:
+            if start <= self.position and self.position + n <= start + len(data):
+                offset = self.position - start
+                self.position += n
+                return data[offset:offset + n]
+        raise IOError(f'Range {self.position}-{self.position + n} was not fetched')
+
+    def close(self) -> None:
+        pass
+
+
+def _may_contain(statistics, values: set[str] | None) -> bool:
+    if not values or statistics is None or not statistics.has_min_max:
+        return True
+    return any(statistics.min <= value <= statistics.max for value in values)
+
+
+def select_row_groups(metadata: pq.FileMetaData, runners: set[str] | None, classes: set[str] | None) -> list[int]:
+    names = [metadata.schema.column(j).path for j in range(metadata.num_columns)]
+    runner_index = names.index(RUNNER_COLUMN)
+    class_index = names.index(CLASS_COLUMN)
+    groups = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        if (_may_contain(row_group.column(runner_index).statistics, runners)
+                and _may_contain(row_group.column(class_index).statistics, classes)):
+            groups.append(i)
+    return groups
+
+
+def column_chunk_ranges(metadata: pq.FileMetaData, groups: list[int], columns: set[str] | None) -> list[tuple[int, int]]:
+    """
+    Returns (start, end) byte ranges of the column chunks needed for the given row groups
+    and top-level columns, merging neighbours into single requests.
+    """
+    ranges = []
+    for i in groups:
+        row_group = metadata.row_group(i)
+        for j in range(row_group.num_columns):
+            chunk = row_group.column(j)
+            if columns is not None and chunk.path_in_schema.split('.')[0] not in columns:
+                continue
+            start = chunk.data_page_offset
+            if chunk.has_dictionary_page and chunk.dictionary_page_offset:
+                start = min(start, chunk.dictionary_page_offset)
+            ranges.append((start, start + chunk.total_compressed_size))
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+async def read_parquet_ranges(
+        fetch_range: Callable[[int | None, int], Awaitable[tuple[bytes, int]]],
+        fetch_ranges: Callable[[list[tuple[int, int]]], Awaitable[list[bytes]]],
+        runners: Iterable[str] | None = None,
+        classes: Iterable[str] | None = None,
+        columns: Iterable[str] | None = None,
+) -> pa.Table:
+    """
+    Reads a filtered, projected table from a remote Parquet object using range requests.
+
+    :param fetch_range: fetch_range(None, n) returns the last n bytes and the object size
+    :param fetch_ranges: Fetches a list of (start, end) ranges concurrently
+    """
+    runners = set(runners) if runners else None
+    classes = set(classes) if classes else None
+    tail, size = await fetch_range(None, FOOTER_PREFETCH)
+    footer_length = int.from_bytes(tail[-8:-4], 'little') + 8
+    if footer_length > len(tail):
+        tail, size = await fetch_range(None, footer_length)
+    sparse = SparseFile(size)
+    sparse.add(size - len(tail), tail)
+    parquet_file = pq.ParquetFile(sparse)
+    metadata = parquet_file.metadata
+
+    wanted = None
+    if columns is not None:
+        wanted = ({field_column(column) for column in columns} | set(RESERVED_COLUMNS)) & set(parquet_file.schema_arrow.names)
+    groups = select_row_groups(metadata, runners, classes)
+    ranges = column_chunk_ranges(metadata, groups, wanted)
+    for (start, _), data in zip(ranges, await fetch_ranges(ranges)):
+        sparse.add(start, data)
+
+    table = parquet_file.read_row_groups(groups, columns=sorted(wanted) if wanted else None)
+    if runners:
+        table = table.filter(pc.is_in(table[RUNNER_COLUMN], pa.array(sorted(runners))))
+    if classes:
+        table = table.filter(pc.is_in(table[CLASS_COLUMN], pa.array(sorted(classes))))
+    return table.replace_schema_metadata(parquet_file.schema_arrow.metadata)
@@ -0,0 +1,50 @@
+import gzip
+import zlib
+
+import zstandard
+
+CODECS = ('zstd', 'gzip')
+# What decompress raises on a truncated or misaligned body
+DECODE_ERRORS = (ValueError, EOFError, OSError, zlib.error, zstandard.ZstdError)
+
+
+def compress(body: bytes, encoding: str | None, level: int | None = None) -> bytes:
+    """
+    Compresses body as one self-contained zstd frame or gzip member. Concatenated frames
+    still form a valid stream, which lets each piece also be decoded on its own.
+    """
+    if encoding in (None, '', 'identity', 'none'):
+        return body
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level or 3).compress(body)
+    if encoding == 'gzip':
+        return gzip.compress(body, compresslevel=level or 6)
+    raise ValueError(f'Unsupported content encoding: {encoding}')
+
+
+def decompress(body: bytes, encoding: str | None) -> bytes:
+    """
+    Decodes a body according to its object's Content-Encoding. Objects written without an
+    encoding are returned unchanged.
+    """
+    if encoding in (None, '', 'identity'):
+        return body
+    if encoding == 'zstd':
+        return zstandard.ZstdDecompressor().stream_reader(body, read_across_frames=True).readall()
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    raise ValueError(f'Unsupported content encoding: {encoding}')
+
+
+def compressor(encoding: str | None, level: int | None = None):
+    """
+    Returns a streaming compressor with compress(chunk) and flush() for the given
+    Content-Encoding, or None when no compression is requested.
+    """
+    if encoding in (None, '', 'identity', 'none'):
+        return None
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level or 3).compressobj()
+    if encoding == 'gzip':
+        return zlib.compressobj(level or 6, zlib.DEFLATED, 31)
+    raise ValueError(f'Unsupported content encoding: {encoding}')
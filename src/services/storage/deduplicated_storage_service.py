@@ -0,0 +1,189 @@
+import asyncio
+import base64
+import hashlib
+from uuid import uuid4
+
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.config import settings
+from src.repositories.stored_file.stored_file_repository import StoredFileRepository
+from src.schemas.stored_file.stored_file_schema import StoredFileInput
+from src.schemas.storage.presign_schema import PresignedUploadComplete
+from src.schemas.storage.storage_schema import FileOutput
+from src.services.storage.multipart import MultipartUploadError
+from src.services.storage.storage_service import StorageService
+
+HASH_CHUNK_SIZE = 1024 * 1024
+MAX_COPY_SIZE = 5 * 1024 * 1024 * 1024
+
+
+class HashingReader:
+    """
+    Reader over an UploadFile that hashes and counts the bytes as the upload consumes them.
+    """
+
+    def __init__(self, file: UploadFile):
+        self.file = file
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    async def read(self, n: int = -1) -> bytes:
+        chunk = await self.file.read(n)
+        await asyncio.to_thread(self.digest.update, chunk)
+        self.size += len(chunk)
+        return chunk
+
+
+class DeduplicatedStorageService(StorageService):
+    """
+    Stores every file once under the SHA-256 of its content and records which filenames
+    point at it in the stored_files table.
+
+    Files up to multipart_threshold are read once, hashed and only sent when their content
+    key is not stored yet, so re-uploading identical bytes costs a HEAD and a row upsert.
+    Larger files are hashed while they stream to a staging key, which is then copied to
+    the content key inside the bucket, or just deleted when the content was already there.
+    """
+
+    def __init__(self, session: AsyncSession, config: dict | None = None, **kwargs):
+        super().__init__(config, **kwargs)
+        self.repository = StoredFileRepository(session)
+        self.content_path = self.config.get('content_path', settings.aws.AWS_CONTENT_PATH)
+
+    def content_key(self, digest: str) -> str:
+        return f'{self.content_path}{digest[:2]}/{digest}'
+
+    async def _store_small(self, file: UploadFile) -> tuple[str, int, bool]:
+        async with self.limiter.files:
+            body = await file.read()
+            digest = await asyncio.to_thread(lambda: hashlib.sha256(body).hexdigest())
+            content_key = self.content_key(digest)
+            if await self.object_exists(content_key):
+                return content_key, len(body), True
+            await self._put(body=body, key=content_key)
+        return content_key, len(body), False
+
+    async def _store_streamed(self, file: UploadFile) -> tuple[str, int, bool]:
+        reader = HashingReader(file)
+        staging_key = f'{self.content_path}staging/{uuid4()}'
+        async with self.limiter.files:
+            try:
+                await self.multipart.upload(reader, staging_key)
+            except MultipartUploadError as err:
+                # Staging keys are never resumed
+                await self.multipart.abort(staging_key, err.upload_id)
+                raise
+        try:
+            content_key = self.content_key(reader.digest.hexdigest())
+            stored = await self.object_exists(content_key)
+            if not stored:
+                await self._copy(staging_key, content_key, reader.size)
+        finally:
+            await self._delete(staging_key)
+        return content_key, reader.size, stored
+
+    async def _copy(self, source: str, key: str, size: int) -> None:
+        """
+        Copies an object inside the bucket, part by part above the 5 GiB copy_object limit.
+        """
+        client = await self.s3.get_client()
+        copy_source = {'Bucket': self.bucket, 'Key': source}
+        if size <= MAX_COPY_SIZE:
+            await client.copy_object(Bucket=self.bucket, Key=key, CopySource=copy_source)
+        else:
+            upload_id = (await client.create_multipart_upload(Bucket=self.bucket, Key=key))['UploadId']
+            part_size = max(self.multipart.part_size, -(-size // 10000))
+
+            async def copy_part(part_number: int, start: int) -> dict:
+                async with self.limiter.parts:
+                    response = await client.upload_part_copy(
+                        Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=part_number, CopySource=copy_source,
+                        CopySourceRange=f'bytes={start}-{min(start + part_size, size) - 1}',
+                    )
+                return {'PartNumber': part_number, 'ETag': response['CopyPartResult']['ETag']}
+
+            try:
+                parts = await asyncio.gather(*(
+                    copy_part(number, start) for number, start in enumerate(range(0, size, part_size), start=1)
+                ))
+            except Exception:
+                await self.multipart.abort(key, upload_id)
+                raise
+            await client.complete_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={'Parts': parts}
+            )
+        if self.cache is not None:
+            self.cache.invalidate(f'{self.bucket}/{key}')
+
+    async def upload(self, *, file: UploadFile, key: str | None = None) -> FileOutput:
+        filename = key or file.filename
+        try:
+            await file.seek(0)
+            if file.size is not None and file.size <= self.multipart_threshold:
+                content_key, size, stored = await self._store_small(file)
+            else:
+                content_key, size, stored = await self._store_streamed(file)
+            await self.repository.set_reference(StoredFileInput(
+                filename=filename,
+                content_key=content_key,
+                size=size,
+                content_type=file.content_type
+            ))
+            message = f'{filename} already stored, reference updated' if stored else f'{filename} uploaded successfully'
+            url = self.s3.object_url(self.bucket, content_key)
+            return FileOutput(url=url, message=message, filename=filename, content_type=file.content_type, size=size)
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+
+    async def _content_matches(self, key: str) -> bool:
+        """
+        Checks an object's bytes hash to the digest its content key names. The stored
+        ChecksumSHA256 is used when the object has a full-object one; multipart objects
+        only carry a checksum of their part checksums, so those are read and hashed.
+        """
+        digest = key.rsplit('/', 1)[-1]
+        if key != self.content_key(digest):
+            return False
+        client = await self.s3.get_client()
+        head = await client.head_object(Bucket=self.bucket, Key=key, ChecksumMode='ENABLED')
+        checksum = head.get('ChecksumSHA256')
+        if checksum and '-' not in checksum:
+            return base64.b64decode(checksum).hex() == digest
+        response = await client.get_object(Bucket=self.bucket, Key=key)
+        sha256 = hashlib.sha256()
+        async with response['Body'] as stream:
+            async for chunk in stream.iter_chunks(HASH_CHUNK_SIZE):
+                await asyncio.to_thread(sha256.update, chunk)
+        return sha256.hexdigest() == digest
+
+    async def complete_presigned_upload(self, data: PresignedUploadComplete) -> FileOutput:
+        """
+        Verifies a presigned upload and registers it in stored_files. Presigned objects
+        are written by the client under their own key, which has to be the content key of
+        the uploaded bytes; an object whose content does not match is deleted.
+        """
+        result = await super().complete_presigned_upload(data)
+        if result.status:
+            try:
+                if not await self._content_matches(data.key):
+                    await self._delete(data.key)
+                    return FileOutput(status=False, error=f'{data.key} does not match its content', message='File upload was unsuccessful')
+                await self.repository.set_reference(StoredFileInput(
+                    filename=data.key,
+                    content_key=data.key,
+                    size=result.size,
+                    content_type=result.content_type
+                ))
+            except Exception as err:
+                return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+        return result
+
+    async def download_file(self, filename: str) -> bytes:
+        """
+        Downloads a file by the name it was uploaded under.
+        """
+        stored_file = await self.repository.get_by_filename(filename)
+        if stored_file is None:
+            return b''
+        return await self.download(stored_file.content_key)
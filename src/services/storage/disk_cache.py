@@ -0,0 +1,186 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+import weakref
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from src.config import settings
+
+# get_object(etag) -> (body, etag); body is None when the object still matches etag
+ConditionalGet = Callable[[str | None], Awaitable[tuple[bytes | None, str | None]]]
+
+
+@dataclass
+class CacheEntry:
+    etag: str | None
+    size: int
+    validated_at: float
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+
+
+class DiskCache:
+    """
+    Size-bounded LRU cache of bucket objects on local disk.
+
+    Entries younger than revalidate_after seconds are served without touching the bucket;
+    older ones are revalidated with a conditional GET on their ETag, which costs a round
+    trip but no body transfer when the object is unchanged.
+    """
+
+    def __init__(self, directory: Path | str, max_bytes: int, revalidate_after: float = 60):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.revalidate_after = revalidate_after
+        self.entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.total_bytes = 0
+        self.stats = CacheStats()
+        # Puts of one key are serialised so the index is updated once per completed write
+        self.locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
+        # Keys with a fetch in flight, and how often each was invalidated since. A fetch
+        # whose key was invalidated meanwhile does not cache its possibly stale body.
+        self.fetching: Counter[str] = Counter()
+        self.generations: dict[str, int] = {}
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / hashlib.sha256(key.encode()).hexdigest()
+
+    def _load(self) -> None:
+        found = []
+        for meta_path in self.directory.glob('*.meta'):
+            data_path = meta_path.with_suffix('')
+            try:
+                meta = json.loads(meta_path.read_text())
+                found.append((data_path.stat().st_mtime, meta['key'], CacheEntry(meta['etag'], data_path.stat().st_size, 0)))
+            except (OSError, ValueError, KeyError):
+                meta_path.unlink(missing_ok=True)
+                data_path.unlink(missing_ok=True)
+        for _, key, entry in sorted(found, key=lambda item: item[0]):
+            self.entries[key] = entry
+            self.total_bytes += entry.size
+        self._evict()
+
+    def _write(self, key: str, body: bytes, etag: str | None) -> None:
+        path = self._path(key)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, path)
+        path.with_suffix('.meta').write_text(json.dumps({'key': key, 'etag': etag}))
+
+    def _remove(self, key: str) -> None:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.size
+        path = self._path(key)
+        path.unlink(missing_ok=True)
+        path.with_suffix('.meta').unlink(missing_ok=True)
+
+    def _evict(self) -> None:
+        while self.total_bytes > self.max_bytes and self.entries:
+            self._remove(next(iter(self.entries)))
+            self.stats.evictions += 1
+
+    def _lock(self, key: str) -> asyncio.Lock:
+        lock = self.locks.get(key)
+        if lock is None:
+            lock = self.locks[key] = asyncio.Lock()
+        return lock
+
+    async def put(self, key: str, body: bytes, etag: str | None, generation: int | None = None) -> None:
+        """
+        Stores body under key. With a generation from the start of a fetch, the body is
+        dropped when the key was invalidated in the meantime.
+        """
+        async with self._lock(key):
+            if len(body) > self.max_bytes or (generation is not None and self.generations.get(key, 0) != generation):
+                self._remove(key)
+                return
+            await asyncio.to_thread(self._write, key, body, etag)
+            if generation is not None and self.generations.get(key, 0) != generation:
+                # Invalidated while the file was written
+                self._remove(key)
+                return
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous.size
+            self.entries[key] = CacheEntry(etag, len(body), time.monotonic())
+            self.total_bytes += len(body)
+            self._evict()
+
+    async def read(self, key: str) -> bytes | None:
+        if key not in self.entries:
+            return None
+        try:
+            body = await asyncio.to_thread(self._path(key).read_bytes)
+        except OSError:
+            self._remove(key)
+            return None
+        self.entries.move_to_end(key)
+        return body
+
+    def invalidate(self, key: str) -> None:
+        if key in self.fetching:
+            self.generations[key] = self.generations.get(key, 0) + 1
+        self._remove(key)
+
+    async def fetch(self, key: str, get_object: ConditionalGet) -> bytes:
+        """
+        Returns the object body from disk when possible, otherwise from get_object.
+        """
+        self.fetching[key] += 1
+        try:
+            return await self._fetch(key, get_object, self.generations.get(key, 0))
+        finally:
+            self.fetching[key] -= 1
+            if not self.fetching[key]:
+                del self.fetching[key]
+                self.generations.pop(key, None)
+
+    async def _fetch(self, key: str, get_object: ConditionalGet, generation: int) -> bytes:
+        entry = self.entries.get(key)
+        if entry is not None:
+            if time.monotonic() - entry.validated_at > self.revalidate_after:
+                body, etag = await get_object(entry.etag)
+                self.stats.revalidations += 1
+                if body is not None:
+                    self.stats.misses += 1
+                    await self.put(key, body, etag, generation)
+                    return body
+                entry.validated_at = time.monotonic()
+            body = await self.read(key)
+            if body is not None:
+                self.stats.hits += 1
+                self.stats.bytes_saved += len(body)
+                return body
+
+        self.stats.misses += 1
+        body, etag = await get_object(None)
+        await self.put(key, body, etag, generation)
+        return body
+
+
+def create_disk_cache() -> DiskCache | None:
+    if not settings.aws.AWS_CACHE_DIR:
+        return None
+    return DiskCache(
+        directory=settings.aws.AWS_CACHE_DIR,
+        max_bytes=settings.aws.AWS_CACHE_MAX_BYTES,
+        revalidate_after=settings.aws.AWS_CACHE_REVALIDATE_AFTER,
+    )
+
+
+disk_cache = create_disk_cache()
@@ -0,0 +1,118 @@
+import asyncio
+import itertools
+import json
+from typing import Iterator
+
+from src.services.storage.compression import compress, compressor
+
+
+def iter_json(data) -> Iterator[tuple[str | None, str, str]]:
+    """
+    Yields the text of json.dumps(data, default=str) one top-level item at a time, so only
+    a single runner's record is ever encoded in memory at once.
+
+    Items come as (key, prefix, value): prefix is the separator and key written before the
+    value. Surrounding brackets are yielded with key None.
+    """
+    if isinstance(data, dict):
+        yield None, '{', ''
+        for i, (key, value) in enumerate(data.items()):
+            key = key if isinstance(key, str) else str(key)
+            yield key, f'{", " if i else ""}{json.dumps(key)}: ', json.dumps(value, default=str)
+        yield None, '}', ''
+    elif isinstance(data, list):
+        yield None, '[', ''
+        for i, value in enumerate(data):
+            yield None, ', ' if i else '', json.dumps(value, default=str)
+        yield None, ']', ''
+    else:
+        yield None, '', json.dumps(data, default=str)
+
+
+class JsonStreamReader:
+    """
+    File-like reader over the (optionally compressed) JSON encoding of data. Bytes are
+    produced on demand by read(n), so an upload holds at most one part in memory.
+
+    With index=True every top-level item is compressed as its own frame, and
+    self.index maps each key to (start, end, skip): the byte range of its frame in the
+    object and how many decoded bytes of separator and key precede the value. With
+    index_min_bytes, a document whose JSON text is shorter than that is not indexed after
+    all (self.index is None); the decision is made on the first read, from the items
+    serialized so far, so no item is serialized twice.
+    """
+
+    def __init__(
+            self,
+            data,
+            encoding: str | None = None,
+            level: int | None = None,
+            index: bool = False,
+            index_min_bytes: int = 0,
+    ):
+        self.items = iter_json(data)
+        self.encoding = encoding
+        self.level = level
+        self.compressor = None if index else compressor(encoding, level)
+        self.index: dict[str, tuple[int, int, int]] | None = {} if index else None
+        self.index_min_bytes = index_min_bytes if index else 0
+        self.buffer = bytearray()
+        self.position = 0
+        self.exhausted = False
+
+    def _append(self, body: bytes) -> None:
+        self.buffer += body
+        self.position += len(body)
+
+    def _choose_framing(self) -> None:
+        pending, size = [], 0
+        for item in self.items:
+            pending.append(item)
+            size += len(item[1]) + len(item[2])
+            if size >= self.index_min_bytes:
+                break
+        else:
+            # Too small to index: one stream, as without index
+            self.index = None
+            self.compressor = compressor(self.encoding, self.level)
+        self.items = itertools.chain(pending, self.items)
+        self.index_min_bytes = 0
+
+    def _fill(self, n: int) -> None:
+        if self.index_min_bytes:
+            self._choose_framing()
+        while len(self.buffer) < n and not self.exhausted:
+            item = next(self.items, None)
+            if item is None:
+                self.exhausted = True
+                if self.compressor is not None:
+                    self._append(self.compressor.flush())
+                break
+            key, prefix, value = item
+            body = (prefix + value).encode('UTF-8')
+            if self.compressor is not None:
+                self._append(self.compressor.compress(body))
+            elif self.index is not None:
+                start = self.position
+                self._append(compress(body, self.encoding, self.level))
+                if key is not None:
+                    self.index[key] = (start, self.position, len(prefix.encode('UTF-8')))
+            else:
+                self._append(body)
+
+    async def fill(self, n: int) -> bool:
+        """
+        Buffers up to n bytes ahead and returns True when that is the whole document.
+        """
+        await asyncio.to_thread(self._fill, n)
+        return self.exhausted and len(self.buffer) <= n
+
+    async def read(self, n: int = -1) -> bytes:
+        if n is None or n < 0:
+            n = float('inf')
+        if len(self.buffer) < n:
+            await asyncio.to_thread(self._fill, n)
+        size = int(min(n, len(self.buffer)))
+        chunk = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return chunk
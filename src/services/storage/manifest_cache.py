@@ -0,0 +1,39 @@
+import time
+
+from src.schemas.storage.event_manifest_schema import EventManifest
+
+
+class ManifestCache:
+    """
+    Remembers resolved event manifests for a few seconds, including events that have none,
+    so the splits and routes reads of a render resolve the manifest with one GET and
+    legacy events do not repeat a 404 on every read. A publish in this process drops the
+    event's entry; other processes see a new manifest once their entry expires.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.entries: dict[str, tuple[float, EventManifest | None]] = {}
+
+    def get(self, key: str) -> tuple[bool, EventManifest | None]:
+        """
+        :return: (found, manifest); manifest is None for a cached "no manifest"
+        """
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return False, None
+        return True, entry[1]
+
+    def put(self, key: str, manifest: EventManifest | None, ttl: float) -> None:
+        now = time.monotonic()
+        if len(self.entries) >= self.max_entries:
+            self.entries = {k: entry for k, entry in self.entries.items() if entry[0] > now}
+            if len(self.entries) >= self.max_entries:
+                self.entries.clear()
+        self.entries[key] = (now + ttl, manifest)
+
+    def invalidate(self, key: str) -> None:
+        self.entries.pop(key, None)
+
+
+manifest_cache = ManifestCache()
@@ -0,0 +1,195 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Callable
+
+import aiohttp
+from botocore.exceptions import ClientError, ConnectionError as BotoConnectionError, HTTPClientError
+from fastapi import UploadFile
+
+from src.config import settings
+from src.services.storage.json_stream import JsonStreamReader
+from src.services.storage.s3_helper import S3Helper
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+# Connection failures and timeouts, as raised by botocore, aiohttp and asyncio
+TRANSIENT_ERRORS = (
+    BotoConnectionError,
+    HTTPClientError,
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    ConnectionError,
+    TimeoutError,
+)
+THROTTLING_CODES = ('SlowDown', 'Throttling', 'ThrottlingException', 'RequestTimeout', 'TooManyRequestsException')
+
+
+@dataclass
+class PartProgress:
+    key: str
+    upload_id: str
+    part_number: int
+    part_size: int
+    uploaded_bytes: int
+
+
+class MultipartUploadError(Exception):
+    """
+    Raised when a multipart upload fails after retries. The upload is left open on the
+    bucket so it can be resumed by passing upload_id back to MultipartUploader.upload.
+    """
+
+    def __init__(self, key: str, upload_id: str, error: Exception):
+        self.key = key
+        self.upload_id = upload_id
+        super().__init__(f'Multipart upload of {key} failed, resume with upload_id={upload_id}: {error}')
+
+
+class TransferLimiter:
+    """
+    Process-wide limits on files and parts in flight, shared by every uploader so one
+    large event cannot take all sockets and memory.
+    """
+
+    def __init__(self, max_files: int, max_parts: int):
+        self.files = asyncio.Semaphore(max_files)
+        self.parts = asyncio.Semaphore(max_parts)
+
+
+transfer_limiter = TransferLimiter(
+    max_files=settings.aws.AWS_MAX_CONCURRENT_FILES,
+    max_parts=settings.aws.AWS_MAX_CONCURRENT_PARTS,
+)
+
+
+def is_transient(err: Exception) -> bool:
+    """
+    True for errors a retry can fix: connection failures, timeouts, 5xx responses and
+    throttling. Anything else, including bugs in the caller, is raised straight away.
+    """
+    if isinstance(err, ClientError):
+        status = err.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        code = err.response.get('Error', {}).get('Code')
+        return status >= 500 or status in (408, 429) or code in THROTTLING_CODES
+    return isinstance(err, TRANSIENT_ERRORS)
+
+
+class MultipartUploader:
+    """
+    Streams an UploadFile to S3 in parts. A chunk is only read once a part slot is free,
+    so memory stays bounded by part_size * max_parts across the whole process.
+    """
+
+    def __init__(
+            self,
+            s3: S3Helper,
+            bucket: str,
+            part_size: int = settings.aws.AWS_MULTIPART_PART_SIZE,
+            retries: int = settings.aws.AWS_PART_RETRIES,
+            limiter: TransferLimiter = transfer_limiter,
+            extra_args: dict | None = None,
+    ):
+        self.s3 = s3
+        self.bucket = bucket
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self.retries = retries
+        self.limiter = limiter
+        self.extra_args = extra_args or {}
+
+    async def upload(
+            self,
+            file: UploadFile | JsonStreamReader,
+            key: str,
+            progress: Callable[[PartProgress], None] | None = None,
+            upload_id: str | None = None,
+            extra_args: dict | None = None,
+    ) -> int:
+        """
+        Uploads the file under key and returns the number of bytes written.
+
+        :param file: An UploadFile or any reader with an async read(n)
+        :param progress: Called after every uploaded part
+        :param upload_id: An open upload to resume; parts already on the bucket are skipped
+        :param extra_args: create_multipart_upload arguments merged over the uploader's own
+        """
+        client = await self.s3.get_client()
+        if upload_id is None:
+            response = await client.create_multipart_upload(
+                Bucket=self.bucket, Key=key, **{**self.extra_args, **(extra_args or {})}
+            )
+            upload_id = response['UploadId']
+            completed = {}
+        else:
+            completed = await self.uploaded_parts(key, upload_id)
+
+        state = {'uploaded': sum(size for _, size in completed.values())}
+        tasks: list[asyncio.Task] = []
+        part_number = 0
+        try:
+            while True:
+                await self.limiter.parts.acquire()
+                try:
+                    chunk = await file.read(self.part_size)
+                except BaseException:
+                    # The permit only passes to the part task once the chunk is in hand
+                    self.limiter.parts.release()
+                    raise
+                if not chunk and part_number > 0:
+                    self.limiter.parts.release()
+                    break
+                part_number += 1
+                if part_number in completed:
+                    self.limiter.parts.release()
+                    continue
+                task = asyncio.create_task(
+                    self._upload_part(key, upload_id, part_number, chunk, completed, state, progress)
+                )
+                # A done callback also fires for a task cancelled before it started running
+                task.add_done_callback(lambda _: self.limiter.parts.release())
+                tasks.append(task)
+                if not chunk:
+                    break
+            await asyncio.gather(*tasks)
+        except Exception as err:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise MultipartUploadError(key, upload_id, err) from err
+
+        parts = [{'PartNumber': number, 'ETag': etag} for number, (etag, _) in sorted(completed.items())]
+        await client.complete_multipart_upload(
+            Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={'Parts': parts}
+        )
+        return state['uploaded']
+
+    async def _upload_part(self, key, upload_id, part_number, chunk, completed, state, progress):
+        client = await self.s3.get_client()
+        for attempt in range(self.retries + 1):
+            try:
+                response = await client.upload_part(
+                    Bucket=self.bucket, Key=key, UploadId=upload_id, PartNumber=part_number, Body=chunk
+                )
+                break
+            except Exception as err:
+                if attempt == self.retries or not is_transient(err):
+                    raise
+                await asyncio.sleep(0.2 * 2 ** attempt)
+        completed[part_number] = (response['ETag'], len(chunk))
+        state['uploaded'] += len(chunk)
+        if progress:
+            progress(PartProgress(key, upload_id, part_number, len(chunk), state['uploaded']))
+
+    async def uploaded_parts(self, key: str, upload_id: str) -> dict[int, tuple[str, int]]:
+        """
+        Returns {part_number: (etag, size)} for parts already stored under an open upload.
+        """
+        client = await self.s3.get_client()
+        parts = {}
+        paginator = client.get_paginator('list_parts')
+        async for page in paginator.paginate(Bucket=self.bucket, Key=key, UploadId=upload_id):
+            for part in page.get('Parts', []):
+                parts[part['PartNumber']] = (part['ETag'], part['Size'])
+        return parts
+
+    async def abort(self, key: str, upload_id: str) -> None:
+        client = await self.s3.get_client()
+        await client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
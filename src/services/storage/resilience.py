@@ -0,0 +1,200 @@
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from src.config import settings
+from src.services.storage.multipart import is_transient
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised without touching the bucket while the circuit breaker is open.
+    """
+
+
+@dataclass
+class ReadMetrics:
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    rejected: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    breaker_opened: int = 0
+
+
+class LatencyTracker:
+    """
+    Keeps the latest successful read latencies to derive the hedging delay.
+    """
+
+    def __init__(self, size: int = 500):
+        self.samples: deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float) -> None:
+        self.samples.append(seconds)
+
+    def percentile(self, p: float) -> float:
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))]
+
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive transient failures and rejects calls for
+    `reset_timeout` seconds. After that a single trial call is let through (half-open);
+    its outcome closes or reopens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == 'closed':
+            return True
+        if state == 'half-open' and not self.trial_running:
+            self.trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+
+    def record_failure(self) -> bool:
+        """
+        Returns True when this failure opened the circuit.
+        """
+        self.failures += 1
+        was_open = self.opened_at is not None
+        if was_open or self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+            self.trial_running = False
+            return not was_open
+        return False
+
+
+class ResilientReader:
+    """
+    Runs bucket reads with jittered exponential retries, a shared circuit breaker and
+    optional hedging: when an attempt is slower than the given latency percentile of
+    recent reads, a duplicate request is started and the first success wins.
+
+    Only transient errors (5xx, throttling, timeouts, connection errors) are retried or
+    count against the breaker; a missing key is a normal answer.
+    """
+
+    def __init__(
+            self,
+            retries: int = 2,
+            base_delay: float = 0.1,
+            max_delay: float = 2,
+            breaker: CircuitBreaker | None = None,
+            hedge_percentile: float = 0,
+            hedge_min_samples: int = 50,
+    ):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = breaker or CircuitBreaker(failure_threshold=5, reset_timeout=30)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self.latencies = LatencyTracker()
+        self.metrics = ReadMetrics()
+
+    def _hedge_delay(self) -> float | None:
+        if not self.hedge_percentile or len(self.latencies.samples) < self.hedge_min_samples:
+            return None
+        return self.latencies.percentile(self.hedge_percentile)
+
+    async def _timed(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.monotonic()
+        result = await fn()
+        self.latencies.add(time.monotonic() - start)
+        return result
+
+    async def _attempt(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        delay = self._hedge_delay()
+        primary = asyncio.create_task(self._timed(fn))
+        tasks = {primary}
+        try:
+            if delay is None:
+                return await primary
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+
+            self.metrics.hedges += 1
+            hedge = asyncio.create_task(self._timed(fn))
+            tasks.add(hedge)
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.metrics.hedge_wins += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # Also reached when the caller is cancelled, before or after the hedge started
+            for task in tasks:
+                task.cancel()
+
+    async def call(self, fn: Callable[[], Awaitable[Any]]) -> Any:
+        if not self.breaker.allow():
+            self.metrics.rejected += 1
+            raise CircuitOpenError('Storage circuit breaker is open')
+        for attempt in range(self.retries + 1):
+            try:
+                result = await self._attempt(fn)
+            except asyncio.CancelledError:
+                self.breaker.trial_running = False
+                raise
+            except Exception as err:
+                if not is_transient(err):
+                    self.breaker.record_success()
+                    raise
+                if attempt == self.retries or self.breaker.state != 'closed':
+                    self.metrics.failures += 1
+                    if self.breaker.record_failure():
+                        self.metrics.breaker_opened += 1
+                    raise
+                self.metrics.retries += 1
+                await asyncio.sleep(random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt)))
+                continue
+            self.metrics.successes += 1
+            self.breaker.record_success()
+            return result
+
+
+storage_reader = ResilientReader(
+    retries=settings.aws.AWS_READ_RETRIES,
+    base_delay=settings.aws.AWS_RETRY_BASE_DELAY,
+    max_delay=settings.aws.AWS_RETRY_MAX_DELAY,
+    breaker=CircuitBreaker(
+        failure_threshold=settings.aws.AWS_BREAKER_FAILURES,
+        reset_timeout=settings.aws.AWS_BREAKER_RESET_TIMEOUT,
+    ),
+    hedge_percentile=settings.aws.AWS_HEDGE_PERCENTILE,
+    hedge_min_samples=settings.aws.AWS_HEDGE_MIN_SAMPLES,
+)
@@ -0,0 +1,78 @@
+import asyncio
+from contextlib import AsyncExitStack
+from urllib.parse import quote
+
+from aiobotocore.config import AioConfig
+from aiobotocore.session import get_session
+
+from src.config import settings
+
+
+class S3Helper:
+    """
+    Owns a single aiobotocore S3 client per process, so every StorageService
+    instance shares one HTTP connection pool instead of building its own client.
+    """
+
+    def __init__(
+            self,
+            endpoint_url: str,
+            region_name: str,
+            max_pool_connections: int = 10,
+            connect_timeout: float = 5,
+            read_timeout: float = 30,
+    ):
+        self.endpoint_url = endpoint_url.rstrip('/')
+        self.region_name = region_name
+        self.config = AioConfig(
+            max_pool_connections=max_pool_connections,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+        )
+        self.session = get_session()
+        self._client = None
+        self._exit_stack: AsyncExitStack | None = None
+        self._lock: asyncio.Lock | None = None
+
+    async def get_client(self):
+        """
+        Returns the shared client, opening it on first use.
+        """
+        if self._client is not None:
+            return self._client
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._client is None:
+                exit_stack = AsyncExitStack()
+                self._client = await exit_stack.enter_async_context(
+                    self.session.create_client(
+                        's3',
+                        endpoint_url=self.endpoint_url,
+                        region_name=self.region_name,
+                        config=self.config,
+                    )
+                )
+                self._exit_stack = exit_stack
+        return self._client
+
+    async def close(self):
+        """
+        Closes the shared client and releases its connection pool.
+        """
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._client = None
+        self._exit_stack = None
+
+    def object_url(self, bucket: str, key: str) -> str:
+        return f"{self.endpoint_url}/{bucket}/{quote(key)}"
+
+
+s3_helper = S3Helper(
+    endpoint_url=settings.aws.AWS_ENDPOINT_URL,
+    region_name=settings.aws.AWS_DEFAULT_REGION,
+    max_pool_connections=settings.aws.AWS_MAX_POOL_CONNECTIONS,
+    connect_timeout=settings.aws.AWS_CONNECT_TIMEOUT,
+    read_timeout=settings.aws.AWS_READ_TIMEOUT,
+)
@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls for the same key into one in-flight task.
+
+    Every caller awaits the shared task through asyncio.shield, so one caller timing out
+    or being cancelled does not abort the fetch for the others. The task itself is bounded
+    by timeout, so a hung request cannot pin its key. Results and exceptions are delivered
+    to every waiter, and the key is released as soon as the task finishes, so the next
+    call after a failure starts a fresh attempt.
+
+    Waiters share the same result object, so callers must not mutate it.
+    """
+
+    def __init__(self):
+        self.in_flight: dict[str, asyncio.Task] = {}
+
+    def _release(self, key: str, task: asyncio.Task) -> None:
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]], timeout: float | None = None) -> Any:
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(asyncio.wait_for(fn(), timeout))
+            self.in_flight[key] = task
+            task.add_done_callback(lambda done: self._release(key, done))
+        return await asyncio.wait_for(asyncio.shield(task), timeout)
+
+
+storage_flights = SingleFlight()
@@ -1,17 +1,35 @@
 import asyncio
 import json
+import logging
+from datetime import datetime, timedelta, timezone
 from abc import abstractmethod, ABC
-from functools import cache
-from io import BytesIO
-from urllib.parse import urlencode
-from uuid import UUID
+from functools import partial
+from typing import Callable, Iterable
+from uuid import UUID, uuid4
 
-import boto3
+from botocore.exceptions import ClientError
 from fastapi import UploadFile
 
 from src.config import settings
 from src.schemas.event.event_schema import EventData
+from src.schemas.storage.event_manifest_schema import BundleArtifact, EventManifest
+from src.schemas.storage.presign_schema import PresignedMultipartUpload, PresignedPart, PresignedUploadComplete, PresignedUrl
 from src.schemas.storage.storage_schema import FileOutput
+from src.services.storage.columnar import CLASS_KEYS, read_parquet_ranges, table_to_event_data, write_parquet
+from src.services.storage.compression import CODECS, DECODE_ERRORS, decompress
+from src.services.storage.disk_cache import CacheStats, DiskCache, disk_cache
+from src.services.storage.json_stream import JsonStreamReader
+from src.services.storage.manifest_cache import ManifestCache, manifest_cache
+from src.services.storage.multipart import MultipartUploader, MultipartUploadError, PartProgress, TransferLimiter, transfer_limiter
+from src.services.storage.resilience import ReadMetrics, ResilientReader, storage_reader
+from src.services.storage.s3_helper import S3Helper, s3_helper
+from src.services.storage.single_flight import SingleFlight, storage_flights
+
+logger = logging.getLogger(__name__)
+
+PARQUET_SUFFIX = '.parquet'
+INDEX_SUFFIX = '.index'
+MANIFEST_NAME = 'manifest.json'
 
 
 class CloudUpload(ABC):
@@ -53,61 +71,552 @@ class CloudUpload(ABC):
 
 
 class StorageService(CloudUpload):
-    @property
-    @cache
-    def client(self):
-        region_name = settings.aws.AWS_DEFAULT_REGION
-        return boto3.client('s3', endpoint_url='https://storage.yandexcloud.net', region_name=region_name)
+    """
+    S3 storage backed by the process-wide async client from S3Helper.
+    Reads go through a shared ResilientReader (retries, circuit breaker, hedging), whose
+    outcome counters are exposed by read_metrics().
 
+    Keyword Args (config):
+        extra_args (dict): Extra put_object arguments, e.g. ContentType or ACL
+        bucket (str): Bucket to use instead of settings.aws.AWS_BUCKET_NAME
+        multipart_threshold (int): Files larger than this are streamed as multipart uploads
+        part_size (int): Multipart part size in bytes
+        row_group_size (int): Runners per Parquet row group
+        event_data_format (str): 'json', 'parquet' or 'both'
+        bundle_retention (float): Seconds a superseded event bundle is kept for readers
+        manifest_cache_ttl (float): Seconds a resolved event manifest is reused, 0 to disable
+        json_compression (str): Content-Encoding for upload_to_json: 'zstd', 'gzip' or 'none'
+        json_compression_level (int): Codec level, 0 for the codec default
+        json_index_min_bytes (int): Shortest JSON text upload_to_json(index=True) indexes
+        download_timeout (float): Upper bound in seconds for a shared download
+        presign_expires_in (int): Lifetime in seconds of presigned URLs
+    """
 
-    async def upload(self, *, file: UploadFile) -> FileOutput:
+    def __init__(
+            self,
+            config: dict | None = None,
+            s3: S3Helper = s3_helper,
+            limiter: TransferLimiter = transfer_limiter,
+            cache: DiskCache | None = disk_cache,
+            flights: SingleFlight = storage_flights,
+            reader: ResilientReader = storage_reader,
+            manifests: ManifestCache = manifest_cache,
+    ):
+        super().__init__(config)
+        self.s3 = s3
+        self.limiter = limiter
+        self.cache = cache
+        self.flights = flights
+        self.reader = reader
+        self.manifests = manifests
+        self.manifest_cache_ttl = self.config.get('manifest_cache_ttl', settings.aws.AWS_MANIFEST_CACHE_TTL)
+        self.presign_expires_in = self.config.get('presign_expires_in', settings.aws.AWS_PRESIGN_EXPIRES_IN)
+        self.download_timeout = self.config.get('download_timeout', settings.aws.AWS_DOWNLOAD_TIMEOUT)
+        self.bucket = self.config.get('bucket', settings.aws.AWS_BUCKET_NAME)
+        self.multipart_threshold = self.config.get('multipart_threshold', settings.aws.AWS_MULTIPART_THRESHOLD)
+        self.multipart = MultipartUploader(
+            s3=s3,
+            bucket=self.bucket,
+            part_size=self.config.get('part_size', settings.aws.AWS_MULTIPART_PART_SIZE),
+            limiter=limiter,
+            extra_args=self.config.get('extra_args', {}),
+        )
+
+    async def _put(self, *, body: bytes, key: str, **kwargs) -> None:
+        extra_args = {**self.config.get('extra_args', {}), **kwargs}
+        client = await self.s3.get_client()
+        await client.put_object(Bucket=self.bucket, Key=key, Body=body, **extra_args)
+        if self.cache is not None:
+            self.cache.invalidate(f'{self.bucket}/{key}')
+
+    async def _delete(self, key: str) -> None:
+        client = await self.s3.get_client()
+        await client.delete_object(Bucket=self.bucket, Key=key)
+        if self.cache is not None:
+            self.cache.invalidate(f'{self.bucket}/{key}')
+
+    async def upload(self, *, file: UploadFile, key: str | None = None) -> FileOutput:
+        """
+        Uploads a file under key, which defaults to the file's name.
+        """
+        if file.size is None or file.size > self.multipart_threshold:
+            return await self.upload_multipart(file=file, key=key)
+        key = key or file.filename
         try:
-            extra_args = self.config.get('extra_args', {})
-            bucket = settings.aws.AWS_BUCKET_NAME
-            await asyncio.to_thread(self.client.upload_fileobj, file.file, bucket, file.filename, ExtraArgs=extra_args)
-            url = f"https://storage.yandexcloud.net/{bucket}/{urlencode(file.filename.encode('utf8'))}"
-            file = FileOutput(url=url, message=f'{file.filename} uploaded successfully', filename=file.filename, content_type=file.content_type, size=file.size)
+            async with self.limiter.files:
+                body = await file.read()
+                await self._put(body=body, key=key)
+            url = self.s3.object_url(self.bucket, key)
+            file = FileOutput(url=url, message=f'{file.filename} uploaded successfully', filename=file.filename, content_type=file.content_type, size=len(body))
             return file
         except Exception as err:
             return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
 
+    async def upload_multipart(
+            self,
+            *,
+            file: UploadFile,
+            progress: Callable[[PartProgress], None] | None = None,
+            upload_id: str | None = None,
+            key: str | None = None,
+    ) -> FileOutput:
+        """
+        Streams a file to the bucket part by part. On failure the error names the open
+        upload_id, which can be passed back in to resume from the last stored part.
+        """
+        key = key or file.filename
+        try:
+            async with self.limiter.files:
+                size = await self.multipart.upload(file, key, progress=progress, upload_id=upload_id)
+            if self.cache is not None:
+                self.cache.invalidate(f'{self.bucket}/{key}')
+            url = self.s3.object_url(self.bucket, key)
+            file = FileOutput(url=url, message=f'{file.filename} uploaded successfully', filename=file.filename, content_type=file.content_type, size=size)
+            return file
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+
+
+    async def upload_to_json(self, *, data: dict, filename: str, index: bool = False, new_key: bool = False) -> FileOutput:
+        """
+        Serializes data straight into the upload body. Documents that fit in one part are
+        sent with a single put; larger ones are streamed as a multipart upload, so memory
+        use does not grow with the size of the event.
 
-    async def upload_to_json(self, *, data: dict, filename: str) -> FileOutput:
-        file = UploadFile(file=BytesIO(json.dumps(data, default=str).encode('UTF-8')), filename=filename)
+        :param index: Also write filename + INDEX_SUFFIX with the byte range of every
+            top-level item, for download_json_item. Documents whose JSON text is shorter
+            than json_index_min_bytes are not indexed: per-item framing would grow them
+            more than a range read saves. An index left by an earlier write of filename
+            is deleted first.
+        :param new_key: filename has never been written (e.g. it is under a bundle prefix
+            unique to this publish), so there is no earlier index to delete
+        """
         try:
-            extra_args = self.config.get('extra_args', {})
-            bucket = settings.aws.AWS_BUCKET_NAME
-            await asyncio.to_thread(self.client.upload_fileobj, file.file, bucket, file.filename, ExtraArgs=extra_args)
-            url = f"https://storage.yandexcloud.net/{bucket}/{urlencode(file.filename.encode('utf8'))}"
-            file = FileOutput(url=url, message=f'{file.filename} uploaded successfully', filename=file.filename, content_type=file.content_type, size=file.size)
+            encoding = self.config.get('json_compression', settings.aws.AWS_JSON_COMPRESSION)
+            encoding = encoding if encoding in CODECS else None
+            level = self.config.get('json_compression_level', settings.aws.AWS_JSON_COMPRESSION_LEVEL)
+            extra_args = {'ContentType': 'application/json'}
+            if encoding:
+                extra_args['ContentEncoding'] = encoding
+            min_bytes = self.config.get('json_index_min_bytes', settings.aws.AWS_JSON_INDEX_MIN_BYTES)
+            reader = JsonStreamReader(data, encoding, level, index=index, index_min_bytes=min_bytes)
+            if index and not new_key:
+                # An index left from an earlier write would point into the new body
+                await self._delete(filename + INDEX_SUFFIX)
+            if await reader.fill(self.multipart.part_size):
+                body = await reader.read()
+                size = len(body)
+                await self._put(body=body, key=filename, **extra_args)
+            else:
+                async with self.limiter.files:
+                    try:
+                        size = await self.multipart.upload(reader, filename, extra_args=extra_args)
+                    except MultipartUploadError as err:
+                        # A serialized stream cannot be resumed, so do not leave the parts behind
+                        await self.multipart.abort(filename, err.upload_id)
+                        raise
+                if self.cache is not None:
+                    self.cache.invalidate(f'{self.bucket}/{filename}')
+            if reader.index is not None:
+                offsets = json.dumps({'encoding': encoding, 'entries': reader.index}).encode('UTF-8')
+                await self._put(body=offsets, key=filename + INDEX_SUFFIX, ContentType='application/json')
+            url = self.s3.object_url(self.bucket, filename)
+            file = FileOutput(url=url, message=f'{filename} uploaded successfully', filename=filename, content_type='application/json', size=size)
             return file
         except Exception as err:
             return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
 
 
     async def multi_upload(self, *, files: list[UploadFile]):
-        tasks = [asyncio.create_task(self.upload(file=file)) for file in files]
-        return await asyncio.gather(*tasks)
+        # Each upload waits on the shared file/part semaphores, so the batch size does not
+        # change how many sockets or buffers are in use at once.
+        return await asyncio.gather(*(self.upload(file=file) for file in files))
+
+    async def upload_to_parquet(self, *, data: dict, filename: str) -> FileOutput:
+        try:
+            row_group_size = self.config.get('row_group_size', settings.aws.AWS_PARQUET_ROW_GROUP_SIZE)
+            body = await asyncio.to_thread(write_parquet, data, row_group_size)
+            await self._put(body=body, key=filename)
+            url = self.s3.object_url(self.bucket, filename)
+            file = FileOutput(url=url, message=f'{filename} uploaded successfully', filename=filename, content_type='application/vnd.apache.parquet', size=len(body))
+            return file
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+
+    async def presign_upload(self, key: str, content_type: str | None = None, expires_in: int | None = None) -> PresignedUrl:
+        """
+        Returns a URL the client can PUT the file to directly, bypassing the API.
+        """
+        expires_in = expires_in or self.presign_expires_in
+        params = {'Bucket': self.bucket, 'Key': key}
+        if content_type:
+            params['ContentType'] = content_type
+        client = await self.s3.get_client()
+        url = await client.generate_presigned_url('put_object', Params=params, ExpiresIn=expires_in)
+        return PresignedUrl(key=key, url=url, method='PUT', expires_in=expires_in)
+
+    async def presign_download(self, key: str, expires_in: int | None = None) -> PresignedUrl:
+        expires_in = expires_in or self.presign_expires_in
+        client = await self.s3.get_client()
+        url = await client.generate_presigned_url(
+            'get_object', Params={'Bucket': self.bucket, 'Key': key}, ExpiresIn=expires_in
+        )
+        return PresignedUrl(key=key, url=url, method='GET', expires_in=expires_in)
+
+    async def presign_multipart_upload(
+            self,
+            key: str,
+            size: int,
+            content_type: str | None = None,
+            expires_in: int | None = None,
+    ) -> PresignedMultipartUpload:
+        """
+        Opens a multipart upload and presigns a PUT URL for every part of a file of the
+        given size. The client reports the part ETags back to complete_presigned_upload.
+        """
+        expires_in = expires_in or self.presign_expires_in
+        part_size = self.multipart.part_size
+        client = await self.s3.get_client()
+        extra_args = {'ContentType': content_type} if content_type else {}
+        response = await client.create_multipart_upload(Bucket=self.bucket, Key=key, **extra_args)
+        upload_id = response['UploadId']
+        parts = []
+        for part_number in range(1, max(1, -(-size // part_size)) + 1):
+            url = await client.generate_presigned_url(
+                'upload_part',
+                Params={'Bucket': self.bucket, 'Key': key, 'UploadId': upload_id, 'PartNumber': part_number},
+                ExpiresIn=expires_in,
+            )
+            parts.append(PresignedPart(part_number=part_number, url=url))
+        return PresignedMultipartUpload(key=key, upload_id=upload_id, part_size=part_size, expires_in=expires_in, parts=parts)
+
+    async def complete_presigned_upload(self, data: PresignedUploadComplete) -> FileOutput:
+        """
+        Completion callback for presigned uploads: completes the multipart upload if there
+        is one, then checks the object exists with the size the client announced.
+        """
+        try:
+            client = await self.s3.get_client()
+            if data.upload_id:
+                parts = [{'PartNumber': part.part_number, 'ETag': part.etag} for part in sorted(data.parts, key=lambda p: p.part_number)]
+                await client.complete_multipart_upload(
+                    Bucket=self.bucket, Key=data.key, UploadId=data.upload_id, MultipartUpload={'Parts': parts}
+                )
+            head = await client.head_object(Bucket=self.bucket, Key=data.key)
+            size = head['ContentLength']
+            if data.size is not None and size != data.size:
+                return FileOutput(status=False, error=f'Expected {data.size} bytes, found {size}', message='File upload was unsuccessful')
+            if self.cache is not None:
+                self.cache.invalidate(f'{self.bucket}/{data.key}')
+            url = self.s3.object_url(self.bucket, data.key)
+            return FileOutput(url=url, message=f'{data.key} uploaded successfully', filename=data.key, content_type=head.get('ContentType', data.content_type), size=size)
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+
+    async def object_exists(self, key: str) -> bool:
+        client = await self.s3.get_client()
+        try:
+            await client.head_object(Bucket=self.bucket, Key=key)
+            return True
+        except ClientError as err:
+            if err.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 404:
+                return False
+            raise
+
+    async def _get_object(self, key: str, etag: str | None = None) -> tuple[bytes | None, str | None]:
+        """
+        GETs an object, conditionally on etag when given.
+
+        :return: The body and its ETag; the body is None when the object still matches etag
+        """
+        client = await self.s3.get_client()
+        kwargs = {'IfNoneMatch': etag} if etag else {}
+
+        async def get():
+            try:
+                response = await client.get_object(Bucket=self.bucket, Key=key, **kwargs)
+            except ClientError as err:
+                if etag and err.response.get('ResponseMetadata', {}).get('HTTPStatusCode') == 304:
+                    return None, etag
+                raise
+            async with response['Body'] as stream:
+                return await stream.read(), response
+
+        body, response = await self.reader.call(get)
+        if body is None:
+            return None, etag
+        # Objects written before compression was enabled carry no Content-Encoding. Like the
+        # compression on upload, decoding runs off the event loop.
+        body = await asyncio.to_thread(decompress, body, response.get('ContentEncoding'))
+        return body, response.get('ETag')
+
+    async def _download(self, key: str) -> bytes:
+        if self.cache is not None:
+            return await self.cache.fetch(f'{self.bucket}/{key}', partial(self._get_object, key))
+        body, _ = await self._get_object(key)
+        return body
+
+    async def fetch(self, key: str) -> bytes:
+        """
+        Like download, but a missing object or a failed GET raises instead of returning b''.
+        """
+        return await self.flights.do(f'bytes:{self.bucket}/{key}', partial(self._download, key), self.download_timeout)
 
     async def download(self, key: str) -> bytes:
         try:
-            bucket = settings.aws.AWS_BUCKET_NAME
-            response = await asyncio.to_thread(self.client.get_object, Bucket=bucket, Key=key)
-            return await asyncio.to_thread(response['Body'].read)
+            return await self.fetch(key)
         except Exception as err:
             return b''
 
+    def cache_stats(self) -> CacheStats | None:
+        return self.cache.stats if self.cache is not None else None
+
+    def read_metrics(self) -> ReadMetrics:
+        return self.reader.metrics
+
+    async def download_range(self, key: str, start: int | None, end: int) -> tuple[bytes, int]:
+        """
+        Fetches bytes [start, end) of an object, or its last `end` bytes when start is None.
+
+        :return: The requested bytes and the full object size
+        """
+        client = await self.s3.get_client()
+        byte_range = f'bytes=-{end}' if start is None else f'bytes={start}-{end - 1}'
+
+        async def get():
+            response = await client.get_object(Bucket=self.bucket, Key=key, Range=byte_range)
+            async with response['Body'] as stream:
+                return await stream.read(), response
+
+        body, response = await self.reader.call(get)
+        content_range = response.get('ContentRange')
+        size = int(content_range.rsplit('/', 1)[1]) if content_range else len(body)
+        return body, size
+
+
+    async def _download_json(self, key: str):
+        return json.loads(await self._download(key))
 
     async def download_json(self, key: str) -> bytes:
+        # Concurrent readers of the same key share one GET and one parsed document
         try:
-            bucket = settings.aws.AWS_BUCKET_NAME
-            response = await asyncio.to_thread(self.client.get_object, Bucket=bucket, Key=key)
-            body = await asyncio.to_thread(response['Body'].read)
-            return json.loads(body)
+            return await self.flights.do(f'json:{self.bucket}/{key}', partial(self._download_json, key), self.download_timeout)
         except Exception as err:
             return b''
 
-    async def upload_event_data(self, results: EventData, filename: UUID):
+    async def download_json_item(self, key: str, item: str):
+        """
+        Reads one top-level item of a JSON object, e.g. a single runner's route, with a
+        range request driven by the object's offset index. Objects without an index, or
+        whose index does not match the body, fall back to downloading and parsing the
+        whole document.
+
+        :return: The item's value, or None when it is not in the document
+        """
+        index = await self.download_json(key + INDEX_SUFFIX)
+        if isinstance(index, dict):
+            entry = index['entries'].get(item)
+            if entry is None:
+                return None
+            start, end, skip = entry
+            try:
+                body, _ = await self.download_range(key, start, end)
+                body = await asyncio.to_thread(decompress, body, index['encoding'])
+                return json.loads(body[skip:])
+            except (ClientError, *DECODE_ERRORS):
+                # The body was rewritten after the index was read
+                pass
+        data = await self.download_json(key)
+        return data.get(item) if isinstance(data, dict) else None
+
+    async def download_event_data(
+            self,
+            path: str,
+            filename: UUID | str,
+            runners: Iterable[str] | None = None,
+            classes: Iterable[str] | None = None,
+            columns: Iterable[str] | None = None,
+    ) -> dict:
+        """
+        Reads {runner: record} event data, optionally only for some runners/classes and
+        only some record fields. Parquet objects are read with range requests so only the
+        matching row groups and columns are downloaded; events stored before the Parquet
+        format fall back to the JSON object, read runner by runner through its offset
+        index when only some runners are wanted. Published bundles are resolved through
+        the event's manifest, older events are read directly from path.
+
+        :param path: settings.aws.AWS_SPLITS_PATH or settings.aws.AWS_ROUTES_PATH
+        """
+        key = f'{path}{filename}'
+        formats = ('parquet', 'json')
+        manifest = await self.get_event_manifest(filename)
+        if manifest is not None and path in manifest.artifacts:
+            key, formats = manifest.artifacts[path].key, manifest.artifacts[path].formats
+
+        async def fetch_range(start, end):
+            return await self.download_range(key + PARQUET_SUFFIX, start, end)
+
+        async def fetch_ranges(ranges):
+            return [body for body, _ in await asyncio.gather(*(fetch_range(start, end) for start, end in ranges))]
+
+        if 'parquet' in formats:
+            try:
+                table = await read_parquet_ranges(fetch_range, fetch_ranges, runners=runners, classes=classes, columns=columns)
+                return table_to_event_data(table)
+            except ClientError as err:
+                if err.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                    raise
+        if runners and not classes:
+            runners = list(dict.fromkeys(str(runner) for runner in runners))
+            items = await asyncio.gather(*(self.download_json_item(key, runner) for runner in runners))
+            data = {runner: item for runner, item in zip(runners, items) if item is not None}
+            return filter_event_data(data, columns=columns)
+        data = await self.download_json(key)
+        return filter_event_data(data or {}, runners, classes, columns)
+
+    def manifest_key(self, filename: UUID | str) -> str:
+        return f'{settings.aws.AWS_BUNDLES_PATH}{filename}/{MANIFEST_NAME}'
+
+    async def get_event_manifest(self, filename: UUID | str, cached: bool = True) -> EventManifest | None:
+        """
+        Returns the event's current manifest, or None for events stored before bundles
+        were published, whose data still lives directly under the splits/routes paths.
+        Either answer is reused for manifest_cache_ttl seconds unless cached is False.
+        """
+        key = self.manifest_key(filename)
+        cache_key = f'{self.bucket}/{key}'
+        if cached and self.manifest_cache_ttl > 0:
+            found, manifest = self.manifests.get(cache_key)
+            if found:
+                return manifest
+        try:
+            data = await self.flights.do(f'json:{cache_key}', partial(self._download_json, key), self.download_timeout)
+            manifest = EventManifest(**data)
+        except ClientError as err:
+            if err.response.get('Error', {}).get('Code') not in ('NoSuchKey', '404'):
+                raise
+            manifest = None
+        if self.manifest_cache_ttl > 0:
+            self.manifests.put(cache_key, manifest, self.manifest_cache_ttl)
+        return manifest
+
+    async def upload_event_data(self, results: EventData, filename: UUID) -> FileOutput:
+        return await self.publish_event_data(results, filename)
+
+    async def publish_event_data(self, results: EventData, filename: UUID | str) -> FileOutput:
+        """
+        Publishes an event's splits and routes as one bundle. Every artifact is uploaded in
+        parallel under a prefix unique to this publish, and only when all of them succeeded
+        is the manifest pointing at that prefix written. The manifest is a single PUT, so
+        readers see either the previous bundle or the complete new one, never a mix, and
+        concurrent publishes never write into each other's bundle; the last manifest wins.
+
+        A failed publish leaves the current manifest untouched. Its partial artifacts, like
+        superseded bundles, are deleted by a later publish once bundle_retention has passed.
+
+        :return: The manifest's FileOutput, or a failed FileOutput listing the artifact errors
+        """
+        aws_paths = settings.aws
+        data_format = self.config.get('event_data_format', aws_paths.AWS_EVENT_DATA_FORMAT)
+        formats = ['json', 'parquet'] if data_format == 'both' else [data_format]
+        try:
+            current = await self.get_event_manifest(filename, cached=False)
+            version = current.version + 1 if current else 1
+            root = f'{aws_paths.AWS_BUNDLES_PATH}{filename}/'
+            bundle = f'{root}v{version}-{uuid4().hex}/'
+
+            artifacts, uploads = {}, []
+            for path, data in ((aws_paths.AWS_SPLITS_PATH, results.splits), (aws_paths.AWS_ROUTES_PATH, results.routes)):
+                key = bundle + path.rstrip('/').rsplit('/', 1)[-1].lower()
+                artifacts[path] = BundleArtifact(key=key, formats=formats)
+                if 'json' in formats:
+                    uploads.append(self.upload_to_json(data=data, filename=key, index=True, new_key=True))
+                if 'parquet' in formats:
+                    uploads.append(self.upload_to_parquet(data=data, filename=key + PARQUET_SUFFIX))
+            errors = [output.error for output in await asyncio.gather(*uploads) if not output.status]
+            if errors:
+                return FileOutput(status=False, error='; '.join(errors), message='Event data publish was unsuccessful')
+
+            manifest = EventManifest(
+                event=str(filename), version=version, published_at=datetime.now(timezone.utc), artifacts=artifacts
+            )
+            output = await self.upload_to_json(data=manifest.model_dump(mode='json'), filename=self.manifest_key(filename))
+            self.manifests.invalidate(f'{self.bucket}/{self.manifest_key(filename)}')
+            if output.status:
+                await self._remove_superseded_bundles(root, bundle)
+            return output
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='Event data publish was unsuccessful')
+
+    async def _remove_superseded_bundles(self, root: str, keep: str) -> None:
+        """
+        Deletes the bundle prefixes under root other than keep whose newest object is older
+        than bundle_retention. The grace period covers readers that resolved the previous
+        manifest and publishes still uploading their own bundle. Failures are logged and
+        left for the next publish to retry.
+        """
+        retention = self.config.get('bundle_retention', settings.aws.AWS_BUNDLE_RETENTION)
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=retention)
+        try:
+            client = await self.s3.get_client()
+            bundles: dict[str, list[str]] = {}
+            fresh = set()
+            paginator = client.get_paginator('list_objects_v2')
+            async for page in paginator.paginate(Bucket=self.bucket, Prefix=root):
+                for item in page.get('Contents', []):
+                    name, separator, _ = item['Key'][len(root):].partition('/')
+                    prefix = f'{root}{name}/'
+                    if not separator or prefix == keep:
+                        continue
+                    bundles.setdefault(prefix, []).append(item['Key'])
+                    if item['LastModified'] > cutoff:
+                        fresh.add(prefix)
+            keys = [key for prefix, keys in bundles.items() if prefix not in fresh for key in keys]
+            for start in range(0, len(keys), 1000):
+                objects = [{'Key': key} for key in keys[start:start + 1000]]
+                await client.delete_objects(Bucket=self.bucket, Delete={'Objects': objects, 'Quiet': True})
+        except Exception as err:
+            logger.warning('remove_superseded_bundles_failed %s: %s', root, err)
+
+    async def migrate_event_data(self, filename: UUID | str) -> list[FileOutput]:
+        """
+        Writes Parquet copies of an event's JSON splits and routes. The JSON objects are
+        left in place so older readers keep working.
+        """
         aws_paths = settings.aws
-        await self.upload_to_json(data=results.splits, filename=aws_paths.AWS_SPLITS_PATH + filename)
-        await self.upload_to_json(data=results.routes, filename=aws_paths.AWS_ROUTES_PATH + filename)
+        outputs = []
+        for path in (aws_paths.AWS_SPLITS_PATH, aws_paths.AWS_ROUTES_PATH):
+            data = await self.download_json(f'{path}{filename}')
+            if not isinstance(data, dict):
+                outputs.append(FileOutput(status=False, error=f'{path}{filename} is missing or not a JSON object', message='Migration was unsuccessful'))
+                continue
+            outputs.append(await self.upload_to_parquet(data=data, filename=f'{path}{filename}{PARQUET_SUFFIX}'))
+        return outputs
+
+
+def filter_event_data(
+        data: dict,
+        runners: Iterable[str] | None = None,
+        classes: Iterable[str] | None = None,
+        columns: Iterable[str] | None = None,
+) -> dict:
+    """
+    Applies download_event_data's runner/class/column selection to a JSON event document.
+    """
+    runners = set(runners) if runners else None
+    classes = set(classes) if classes else None
+    columns = set(columns) if columns is not None else None
+    selected = {}
+    for runner, record in data.items():
+        if runners and str(runner) not in runners:
+            continue
+        if classes:
+            if not isinstance(record, dict):
+                continue
+            class_name = next((record[key] for key in CLASS_KEYS if record.get(key) is not None), None)
+            if class_name is None or str(class_name) not in classes:
+                continue
+        if columns is not None and isinstance(record, dict):
+            record = {key: value for key, value in record.items() if key in columns}
+        selected[runner] = record
+    return selected
@@ -0,0 +1,245 @@
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+from fastapi import UploadFile
+
+from src.config import settings
+from src.schemas.storage.storage_schema import FileOutput
+from src.services.storage.json_stream import JsonStreamReader
+from src.services.storage.storage_service import CloudUpload, StorageService
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class HotEntry:
+    size: int
+    stored_at: float
+    accessed_at: float
+    mapping: mmap.mmap | None = None
+
+
+class MmapStore:
+    """
+    Local file store whose reads are memoryviews over mmap'd files, so a hot object is
+    served from the page cache without being copied into the Python heap.
+    """
+
+    def __init__(self, directory: Path | str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.entries: OrderedDict[str, HotEntry] = OrderedDict()
+        self.total_bytes = 0
+        for path in sorted(self.directory.glob('*.key'), key=lambda p: p.stat().st_mtime):
+            data_path = path.with_suffix('')
+            if data_path.exists():
+                size = data_path.stat().st_size
+                mtime = data_path.stat().st_mtime
+                self.entries[path.read_text()] = HotEntry(size, mtime, mtime)
+                self.total_bytes += size
+
+    def path(self, key: str) -> Path:
+        return self.directory / hashlib.sha256(key.encode()).hexdigest()
+
+    def _write(self, key: str, body: bytes) -> None:
+        path = self.path(key)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, path)
+        path.with_suffix('.key').write_text(key)
+
+    def _copy(self, key: str, source) -> int:
+        path = self.path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as target:
+            shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+        size = tmp_path.stat().st_size
+        os.replace(tmp_path, path)
+        path.with_suffix('.key').write_text(key)
+        return size
+
+    def _add(self, key: str, size: int) -> None:
+        self._release(key)
+        now = time.time()
+        self.entries[key] = HotEntry(size, now, now)
+        self.total_bytes += size
+
+    async def put(self, key: str, body: bytes) -> None:
+        await asyncio.to_thread(self._write, key, body)
+        self._add(key, len(body))
+
+    async def put_file(self, key: str, source) -> int:
+        """
+        Copies a binary file object into the store in chunks and returns its size.
+        """
+        size = await asyncio.to_thread(self._copy, key, source)
+        self._add(key, size)
+        return size
+
+    def get(self, key: str) -> memoryview | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if entry.size == 0:
+            view = memoryview(b'')
+        else:
+            if entry.mapping is None:
+                with open(self.path(key), 'rb') as file:
+                    entry.mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            view = memoryview(entry.mapping)
+        entry.accessed_at = time.time()
+        self.entries.move_to_end(key)
+        return view
+
+    def _release(self, key: str) -> HotEntry | None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        self.total_bytes -= entry.size
+        if entry.mapping is not None:
+            try:
+                entry.mapping.close()
+            except BufferError:
+                # A reader still holds a view; the mapping is freed once it is dropped
+                pass
+        return entry
+
+    def remove(self, key: str) -> None:
+        if self._release(key) is not None:
+            path = self.path(key)
+            path.unlink(missing_ok=True)
+            path.with_suffix('.key').unlink(missing_ok=True)
+
+    def expired(self, max_bytes: int, max_age: float) -> list[str]:
+        """
+        Keys to drop so that nothing is idle longer than max_age and the store fits in
+        max_bytes, least recently used first.
+        """
+        now = time.time()
+        keys = [key for key, entry in self.entries.items() if now - entry.accessed_at > max_age]
+        total = self.total_bytes - sum(self.entries[key].size for key in keys)
+        for key, entry in self.entries.items():
+            if total <= max_bytes:
+                break
+            if key not in keys:
+                keys.append(key)
+                total -= entry.size
+        return keys
+
+
+class TieredStorageService(CloudUpload):
+    """
+    CloudUpload backend with a local mmap hot tier in front of the S3 cold tier.
+
+    Writes go to both tiers, so the bucket stays the source of truth and demotion only
+    drops the hot copy. Reads are served from the hot tier and promote cold objects on a
+    miss. Without a cold tier (local_only) it is a network-free store for dev and tests,
+    and nothing is ever demoted.
+
+    Keyword Args (config):
+        hot_dir (str): Directory of the hot tier
+        hot_max_bytes (int): Size the hot tier is demoted down to
+        hot_max_age (float): Seconds since last access after which objects are demoted
+        local_only (bool): Run without the S3 tier
+    """
+
+    def __init__(self, config: dict | None = None, cold: StorageService | None = None):
+        super().__init__(config)
+        self.local_only = self.config.get('local_only', settings.aws.AWS_STORAGE_LOCAL_ONLY)
+        self.cold = None if self.local_only else (cold or StorageService(self.config))
+        self.hot = MmapStore(self.config.get('hot_dir', settings.aws.AWS_HOT_TIER_DIR))
+        self.hot_max_bytes = self.config.get('hot_max_bytes', settings.aws.AWS_HOT_TIER_MAX_BYTES)
+        self.hot_max_age = self.config.get('hot_max_age', settings.aws.AWS_HOT_TIER_MAX_AGE)
+
+    def _output(self, key: str, size: int, content_type: str | None = None) -> FileOutput:
+        url = self.cold.s3.object_url(self.cold.bucket, key) if self.cold else self.hot.path(key).as_uri()
+        return FileOutput(url=url, message=f'{key} uploaded successfully', filename=key, content_type=content_type, size=size)
+
+    async def upload(self, *, file: UploadFile, key: str | None = None) -> FileOutput:
+        """
+        Streams the file to the cold tier first, as a multipart upload when it is large,
+        then copies it from its spooled file into the hot tier, so it is never held in
+        memory whole.
+        """
+        key = key or file.filename
+        try:
+            if self.cold is not None:
+                result = await self.cold.upload(file=file, key=key)
+                if not result.status:
+                    return result
+            await file.seek(0)
+            size = await self.hot.put_file(key, file.file)
+            self.demote()
+            return self._output(key, size, file.content_type)
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+
+    async def multi_upload(self, *, files: list[UploadFile]) -> list[FileOutput]:
+        return await asyncio.gather(*(self.upload(file=file) for file in files))
+
+    async def upload_to_json(self, *, data: dict, filename: str) -> FileOutput:
+        try:
+            body = await JsonStreamReader(data).read()
+            await self.hot.put(filename, body)
+            if self.cold is not None:
+                result = await self.cold.upload_to_json(data=data, filename=filename)
+                if not result.status:
+                    self.hot.remove(filename)
+                    return result
+            self.demote()
+            return self._output(filename, len(body), 'application/json')
+        except Exception as err:
+            return FileOutput(status=False, error=str(err), message='File upload was unsuccessful')
+
+    async def read(self, key: str) -> memoryview | None:
+        """
+        Zero-copy read: a memoryview over the hot copy, promoting the object from the
+        cold tier first if needed. Returns None when neither tier has it; any other cold
+        tier failure is raised, so nothing but a fetched body is promoted.
+        """
+        view = self.hot.get(key)
+        if view is not None or self.cold is None:
+            return view
+        try:
+            body = await self.cold.fetch(key)
+        except ClientError as err:
+            if err.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+                return None
+            raise
+        await self.hot.put(key, body)
+        self.demote(keep=key)
+        return self.hot.get(key)
+
+    async def download(self, key: str) -> bytes:
+        try:
+            view = await self.read(key)
+        except Exception as err:
+            return b''
+        return b'' if view is None else bytes(view)
+
+    async def download_json(self, key: str):
+        try:
+            view = await self.read(key)
+            return json.loads(str(view, 'UTF-8'))
+        except Exception as err:
+            return b''
+
+    def demote(self, keep: str | None = None) -> list[str]:
+        """
+        Drops hot copies past the age/size policy; the cold tier still has them.
+        """
+        if self.cold is None:
+            return []
+        keys = [key for key in self.hot.expired(self.hot_max_bytes, self.hot_max_age) if key != keep]
+        for key in keys:
+            self.hot.remove(key)
+        return keys
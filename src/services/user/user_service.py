@@ -1,10 +1,13 @@
-from typing import List
+from typing import AsyncIterator, Optional
 from pydantic import UUID4
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 
+from src.repositories.pagination import InvalidCursorError
+from src.repositories.streaming import ndjson
 from src.repositories.user.user_repository import UserRepository
+from src.schemas.pagination.pagination_schema import Page
 from src.schemas.user.user_schema import UserInput, UserOutput
 
 
@@ -24,8 +27,17 @@ class UserService:
         except IntegrityError:
             raise HTTPException(status_code=400, detail="Error creating user")
 
-    async def get_all(self) -> List[UserOutput]:
-        return await self.repository.get_all()
+    async def get_all(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[UserOutput]:
+        try:
+            return await self.repository.get_all(limit, cursor)
+        except InvalidCursorError as err:
+            raise HTTPException(status_code=400, detail=str(err))
+
+    def export_ndjson(self, fetch_size: Optional[int] = None) -> AsyncIterator[bytes]:
+        """
+        :return: Every user as NDJSON chunks, for a StreamingResponse(media_type="application/x-ndjson")
+        """
+        return ndjson(self.repository.stream_all(fetch_size))
 
     async def get_user(self, _id: UUID4) -> UserOutput:
         user = await self.repository.get_by_id(_id)
@@ -35,14 +47,12 @@ class UserService:
 
 
     async def update(self, _id: UUID4, data: UserInput) -> UserOutput:
-        user = await self.repository.get_by_id(_id)
-        if not user:
+        updated_user = await self.repository.update(_id, data)
+        if not updated_user:
             raise HTTPException(status_code=404, detail="User not found")
-        updated_user = await self.repository.update(user, data)
         return updated_user
 
     async def delete(self, _id: UUID4) -> bool:
-        user = await self.repository.get_by_id(_id)
-        if not user:
+        if not await self.repository.delete(_id):
             raise HTTPException(status_code=404, detail="User not found")
-        return await self.repository.delete(user)
+        return True
@@ -0,0 +1,50 @@
+import pytest
+from sqlalchemy import exc, text
+
+from src.config import settings
+from src.database.db_helper import DatabaseHelper
+
+
+@pytest.mark.anyio
+class TestPoolTelemetry:
+    @pytest.fixture
+    async def helper(self):
+        helper = DatabaseHelper(url=settings.db.url, pool_size=1, max_overflow=0, pool_timeout=0.2)
+        yield helper
+        await helper.engine.dispose()
+
+    async def test_checkouts_are_counted(self, helper: DatabaseHelper):
+        """Test a checkout shows up in the pool stats and latency histogram."""
+        async with helper.session_factory() as session:
+            await session.execute(text("SELECT 1"))
+            assert helper.pool_stats().checked_out == 1
+
+        stats = helper.pool_stats()
+        assert stats.checked_out == 0
+        assert stats.checked_in == 1
+        assert stats.checkouts == 1
+        assert stats.checkout_latency["+Inf"] == 1
+
+    async def test_exhausted_pool_times_out(self, helper: DatabaseHelper):
+        """Test waiting on a full pool is recorded as a timeout."""
+        async with helper.engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                async with helper.engine.connect():
+                    pass
+
+        stats = helper.pool_stats()
+        assert stats.timeouts == 1
+        assert stats.checkout_seconds_total >= 0.2
+        assert stats.checkouts_in_progress == 0
+
+    async def test_replica_pools_are_instrumented(self):
+        """Test replica engines report their own pool stats."""
+        helper = DatabaseHelper(url=settings.db.url, replica_urls=[settings.db.url])
+        try:
+            async with helper.replicas[0].connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            (stats,) = helper.replica_pool_stats().values()
+            assert stats.checkouts == 1
+            assert helper.pool_stats().checkouts == 0
+        finally:
+            await helper.dispose()
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.database.index_audit import audit, capture_statements, seq_scans
+
+
+class FakeAsyncConnection:
+    def __init__(self, connection):
+        self.sync_connection = connection
+
+
+class TestIndexAudit:
+    def test_seq_scans_walks_nested_plans(self):
+        """Test that Seq Scan nodes are found at any depth of a plan."""
+        plan = {
+            "Node Type": "Limit",
+            "Plans": [{
+                "Node Type": "Nested Loop",
+                "Plans": [
+                    {"Node Type": "Index Scan", "Relation Name": "users"},
+                    {"Node Type": "Seq Scan", "Relation Name": "posts"},
+                ],
+            }],
+        }
+
+        assert [node["Relation Name"] for node in seq_scans(plan)] == ["posts"]
+
+    def test_capture_statements(self):
+        """Test that reads and writes are captured only inside the context."""
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER)"))
+            with capture_statements(FakeAsyncConnection(connection)) as statements:
+                connection.execute(text("INSERT INTO items VALUES (1)"))
+                connection.execute(text("SELECT id FROM items WHERE id = :id"), {"id": 1})
+                connection.execute(text("DELETE FROM items"))
+            connection.execute(text("SELECT 1"))
+        engine.dispose()
+
+        assert [statement for statement, _ in statements] == ["SELECT id FROM items WHERE id = ?", "DELETE FROM items"]
+
+
+@pytest.mark.anyio
+async def test_audit_runs_every_query(connection: AsyncConnection, session: AsyncSession):
+    """Test the audit seeds nullable columns as NULL and still runs every query end to end."""
+    assert await audit(connection, rows=100, min_rows=10 ** 9) == []
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.database.instrumentation import current_query_stats, instrument_engine, track_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    instrument_engine(engine)
+    yield engine
+    engine.dispose()
+
+
+class TestQueryInstrumentation:
+    def test_statements_are_counted_and_timed(self, engine):
+        """Test statement count, total time and slowest statements are recorded."""
+        with track_queries() as stats, engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        assert stats.statements == 2
+        assert stats.total_seconds > 0
+        assert {statement for _, statement in stats.slowest} == {"SELECT 1", "SELECT 2"}
+        assert current_query_stats.get() is None
+
+    def test_repeated_shape_is_flagged_as_n_plus_one(self, engine, caplog):
+        """Test one statement shape repeated past the threshold is reported once."""
+        with track_queries(n_plus_one_threshold=3) as stats, engine.connect() as connection:
+            for i in range(6):
+                connection.execute(text("SELECT :id"), {"id": i})
+
+        assert stats.n_plus_one == ["SELECT ?"]
+        assert "Possible N+1" in caplog.text
+
+    def test_untracked_statements_are_ignored(self, engine):
+        """Test statements outside a tracked context are not recorded anywhere."""
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert current_query_stats.get() is None
+
+    def test_tasks_share_the_request_stats(self, engine):
+        """Test statements run by tasks created inside the context are counted."""
+        async def run():
+            with track_queries() as stats:
+                await asyncio.gather(*(asyncio.to_thread(query) for _ in range(3)))
+            return stats
+
+        def query():
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+        assert asyncio.run(run()).statements == 3
@@ -0,0 +1,91 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, delete, func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.config import settings
+from src.database.models.post.post import Post
+from src.database.models.user.user import User
+
+from src.database.slow_queries import RateLimiter, SlowQueryLog, redact
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+class TestSlowQueryLog:
+    def test_slow_statements_are_logged_redacted(self, engine, caplog):
+        """Test a statement over the threshold is logged with its parameters redacted."""
+        SlowQueryLog(threshold=0).attach(engine)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT :email"), {"email": "runner@example.com"})
+
+        [record] = [record.slow_query for record in caplog.records if hasattr(record, "slow_query")]
+        assert record["statement"] == "SELECT ?"
+        assert record["parameters"] == ["<str len=18>"]
+        assert "runner@example.com" not in caplog.text
+
+    def test_fast_statements_are_not_logged(self, engine, caplog):
+        """Test statements under the threshold leave no record."""
+        SlowQueryLog(threshold=60).attach(engine)
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+
+        assert not [record for record in caplog.records if hasattr(record, "slow_query")]
+
+    def test_redact_keeps_shape(self):
+        """Test redaction keeps structure, None and booleans but hides values."""
+        assert redact({"id": 5, "tags": ["a", "bc"], "deleted": False, "note": None}) == {
+            "id": "<int>", "tags": ["<str len=1>", "<str len=2>"], "deleted": False, "note": None,
+        }
+
+    def test_rate_limiter(self):
+        """Test explains are capped at the configured rate."""
+        limiter = RateLimiter(per_minute=2)
+
+        assert [limiter.allow() for _ in range(3)] == [True, True, False]
+
+
+@pytest.mark.anyio
+class TestExplainCapture:
+    async def test_plan_is_captured_in_background(self):
+        """Test a sampled slow SELECT gets an EXPLAIN (ANALYZE, BUFFERS) plan."""
+        slow_query_log = SlowQueryLog(threshold=0, explain_sample_rate=1, explains_per_minute=60)
+        engine = create_async_engine(settings.db.url)
+        slow_query_log.attach(engine)
+        try:
+            async with engine.connect() as connection:
+                await connection.execute(select(func.pg_sleep(0.01)))
+            [task] = slow_query_log.pending
+            explained = await asyncio.wait_for(task, 10)
+        finally:
+            await slow_query_log.close()
+            await engine.dispose()
+
+        assert explained["plan"][0]["Plan"]["Actual Loops"] == 1
+
+    async def test_writes_and_locking_reads_are_not_explained(self):
+        """Test EXPLAIN ANALYZE never re-runs DML, data-modifying CTEs, FOR UPDATE or raw SQL."""
+        slow_query_log = SlowQueryLog(threshold=0, explain_sample_rate=1, explains_per_minute=60)
+        engine = create_async_engine(settings.db.url)
+        slow_query_log.attach(engine)
+        _id = uuid4()
+        deleted_posts = delete(Post).where(Post.user_id == _id).returning(Post.user_id).cte("deleted_posts")
+        try:
+            async with engine.connect() as connection:
+                # The shape of delete_by_id: WITH deleted_posts AS (DELETE ...) DELETE ...
+                await connection.execute(delete(User).where(User.id == _id).returning(User.id).add_cte(deleted_posts))
+                await connection.execute(select(User.id).add_cte(deleted_posts))
+                await connection.execute(select(User.id).where(User.id == _id).with_for_update())
+                await connection.execute(text("SELECT 1"))
+                await connection.rollback()
+            assert slow_query_log.pending == set()
+        finally:
+            await slow_query_log.close()
+            await engine.dispose()
@@ -60,7 +60,7 @@ class TestArticleRepository:
         await article_repo.create(data_1)
         await article_repo.create(data_2)
 
-        articles = await article_repo.get_all()
+        articles = (await article_repo.get_all()).items
 
         assert len(articles) == 2
         assert articles[0].title == "First Article"
@@ -96,7 +96,7 @@ class TestArticleRepository:
             content="Updated content.",
             author_id=create_user.id
         )
-        updated_article = await article_repo.update(article, update_data)
+        updated_article = await article_repo.update(article.id, update_data)
 
         assert updated_article.title == "Updated Title"
         assert updated_article.content == "Updated content."
@@ -113,6 +113,6 @@ class TestArticleRepository:
 
         assert await article_repo.get_by_id(article.id) is not None
 
-        await article_repo.delete(article)
+        await article_repo.delete(article.id)
 
         assert await article_repo.get_by_id(article.id) is None
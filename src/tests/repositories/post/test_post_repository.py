@@ -1,8 +1,10 @@
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models.user.user import User
 from src.repositories.post.post_repository import PostRepository
 from src.schemas.post.post_schema import PostInput, PostUpdate
 
@@ -13,6 +15,14 @@ class TestPostRepository:
     async def post_repo(self, session: AsyncSession):
         return PostRepository(session)
 
+    @pytest.fixture
+    async def user_id(self, session: AsyncSession):
+        user_id = uuid4()
+        await session.execute(insert(User).values(
+            id=user_id, first_name="Post", last_name="Test", hashed_password=b"x", email=f"{user_id.hex[:20]}@x.io"
+        ))
+        return user_id
+
     @pytest.fixture
     async def create_post(self, post_repo: PostRepository):
         post_data = PostInput(
@@ -39,14 +49,70 @@ class TestPostRepository:
         assert post.user_id is not None
         assert post.event_id is not None
 
+    async def test_create_many_posts(self, post_repo: PostRepository, user_id):
+        """Test creating many posts in one call, failing only the post of an unknown user."""
+        posts_data = [
+            PostInput(title=f"Bulk Post {i}", body="Bulk", user_id=user_id, event_id=uuid4())
+            for i in range(4)
+        ]
+        posts_data[2].user_id = uuid4()
+        result = await post_repo.create_many(posts_data)
+
+        assert result.created == 3
+        assert result.failed == 1
+        assert [item.index for item in result.items] == [0, 1, 2, 3]
+        assert [item.result.title for item in result.items if item.result] == ["Bulk Post 0", "Bulk Post 1", "Bulk Post 3"]
+        assert result.items[2].result is None and "posts_user_id_fkey" in result.items[2].error
+        assert await post_repo.get_post(result.items[1].result.id) is not None
+
     async def test_get_all_posts(self, post_repo: PostRepository, create_post):
         """Test retrieving all posts."""
         post = await create_post
-        posts = await post_repo.get_all()
+        posts = (await post_repo.get_all()).items
 
         assert len(posts) > 0
         assert posts[0].title == post.title
 
+    async def test_get_all_posts_pages(self, post_repo: PostRepository, user_id):
+        """Test walking all pages of posts with cursors."""
+        created = [
+            await post_repo.create(PostInput(title=f"Paged Post {i}", body="Paged", user_id=user_id, event_id=uuid4()))
+            for i in range(5)
+        ]
+        seen = []
+        cursor = None
+        while True:
+            page = await post_repo.get_all(limit=2, cursor=cursor)
+            assert len(page.items) <= 2
+            seen.extend(post.id for post in page.items)
+            if page.next_cursor is None:
+                break
+            cursor = page.next_cursor
+
+        assert len(seen) == len(set(seen))
+        # Posts created in one transaction share created_at, so id breaks the tie
+        expected = [post.id for post in sorted(created, key=lambda post: (post.created_at, post.id))]
+        assert expected == [_id for _id in seen if _id in {post.id for post in created}]
+
+    async def test_list_posts_without_track(self, post_repo: PostRepository, user_id):
+        """Test listing posts whose track_id is null."""
+        post = await post_repo.create(PostInput(title="Trackless Post", body="No track", user_id=user_id, event_id=uuid4()))
+        listed = {item.id: item for item in (await post_repo.get_all(limit=1000)).items}
+        streamed = {item.id: item async for item in post_repo.stream_all()}
+
+        assert post.track_id is None
+        assert listed[post.id].track_id is None
+        assert streamed[post.id].track_id is None
+
+    async def test_stream_all_posts(self, post_repo: PostRepository, create_post):
+        """Test streaming all posts through a server-side cursor."""
+        post = await create_post
+        page = await post_repo.get_all(limit=1000)
+        streamed = [item async for item in post_repo.stream_all(fetch_size=2)]
+
+        assert post.id in {item.id for item in streamed}
+        assert [item.id for item in streamed][:len(page.items)] == [item.id for item in page.items]
+
     async def test_get_post_by_id(self, post_repo: PostRepository, create_post):
         """Test retrieving a post by its ID."""
         post = await create_post
@@ -68,7 +134,7 @@ class TestPostRepository:
         """Test updating a post."""
         post = await create_post
         updated_data = PostUpdate(title="Updated Post Title", body="Updated body text")
-        updated_post = await post_repo.update(post, updated_data)
+        updated_post = await post_repo.update(post.id, updated_data)
 
         assert updated_post.title == "Updated Post Title"
         assert updated_post.body == "Updated body text"
@@ -76,7 +142,15 @@ class TestPostRepository:
     async def test_delete_post(self, post_repo: PostRepository, create_post):
         """Test deleting a post."""
         post = await create_post
-        deleted = await post_repo.delete(post)
+        deleted = await post_repo.delete(post.id)
 
         assert deleted is True
         assert await post_repo.get_post(post.id) is None
+
+    async def test_update_missing_post(self, post_repo: PostRepository):
+        """Test updating a non-existing post reports it as not found."""
+        assert await post_repo.update(uuid4(), PostUpdate(title="Missing")) is None
+
+    async def test_delete_missing_post(self, post_repo: PostRepository):
+        """Test deleting a non-existing post reports it as not found."""
+        assert await post_repo.delete(uuid4()) is False
@@ -0,0 +1,38 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.repositories.stored_file.stored_file_repository import StoredFileRepository
+from src.schemas.stored_file.stored_file_schema import StoredFileInput
+
+
+@pytest.mark.anyio
+class TestStoredFileRepository:
+    @pytest.fixture
+    async def stored_file_repo(self, session: AsyncSession):
+        return StoredFileRepository(session)
+
+    async def test_set_reference(self, stored_file_repo: StoredFileRepository):
+        """Test pointing a filename at a content key."""
+        data = StoredFileInput(filename="track.gpx", content_key="Content/ab/abcd", size=10, content_type="application/gpx+xml")
+        stored_file = await stored_file_repo.set_reference(data)
+
+        assert stored_file.id is not None
+        assert stored_file.content_key == "Content/ab/abcd"
+        assert (await stored_file_repo.get_by_filename("track.gpx")).size == 10
+
+    async def test_set_reference_replaces_existing(self, stored_file_repo: StoredFileRepository):
+        """Test re-uploading a filename repoints it instead of adding a row."""
+        await stored_file_repo.set_reference(StoredFileInput(filename="event.json", content_key="Content/aa/aa", size=1))
+        await stored_file_repo.set_reference(StoredFileInput(filename="event.json", content_key="Content/bb/bb", size=2))
+
+        stored_file = await stored_file_repo.get_by_filename("event.json")
+        assert stored_file.content_key == "Content/bb/bb"
+        assert await stored_file_repo.count_references("Content/aa/aa") == 0
+
+    async def test_shared_content_is_counted(self, stored_file_repo: StoredFileRepository):
+        """Test several filenames may share one content key."""
+        for name in ("a.gpx", "b.gpx"):
+            await stored_file_repo.set_reference(StoredFileInput(filename=name, content_key="Content/cc/cc", size=3))
+
+        assert await stored_file_repo.count_references("Content/cc/cc") == 2
+        assert await stored_file_repo.get_by_filename("missing.gpx") is None
@@ -2,8 +2,10 @@ from datetime import datetime
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models.user.user import User
 from src.repositories.subscription.subscription_repository import SubscriptionRepository
 from src.schemas.subscription.subscription_schema import SubscriptionInput, SubscriptionUpdate
 
@@ -14,6 +16,14 @@ class TestSubscriptionRepository:
     async def subscription_repo(self, session: AsyncSession):
         return SubscriptionRepository(session)
 
+    @pytest.fixture
+    async def user_id(self, session: AsyncSession):
+        user_id = uuid4()
+        await session.execute(insert(User).values(
+            id=user_id, first_name="Subscription", last_name="Test", hashed_password=b"x", email=f"{user_id.hex[:20]}@x.io"
+        ))
+        return user_id
+
     @pytest.fixture
     async def create_subscription(self, subscription_repo: SubscriptionRepository):
         subscription_data = SubscriptionInput(
@@ -37,10 +47,25 @@ class TestSubscriptionRepository:
         assert subscription.end_at == datetime(2025, 12, 31)
         assert subscription.user_id is not None
 
+    async def test_create_many_subscriptions(self, subscription_repo: SubscriptionRepository, user_id):
+        """Test creating many subscriptions in one call, failing only the one of an unknown user."""
+        subscriptions_data = [
+            SubscriptionInput(access=float(i), end_at=datetime(2025, 12, 31), user_id=user_id)
+            for i in range(4)
+        ]
+        subscriptions_data[0].user_id = uuid4()
+        result = await subscription_repo.create_many(subscriptions_data)
+
+        assert result.created == 3
+        assert result.failed == 1
+        assert [item.result.access for item in result.items if item.result] == [1.0, 2.0, 3.0]
+        assert result.items[0].result is None and "subscriptions_user_id_fkey" in result.items[0].error
+        assert all(item.error is None for item in result.items[1:])
+
     async def test_get_all_subscriptions(self, subscription_repo: SubscriptionRepository, create_subscription):
         """Test retrieving all subscriptions."""
         subscription = await create_subscription
-        subscriptions = await subscription_repo.get_all()
+        subscriptions = (await subscription_repo.get_all()).items
 
         assert len(subscriptions) > 0
         assert subscriptions[0].id == subscription.id
@@ -57,7 +82,7 @@ class TestSubscriptionRepository:
         """Test updating a subscription."""
         subscription = await create_subscription
         updated_data = SubscriptionUpdate(access=3.0, end_at=datetime(2026, 12, 31))
-        updated_subscription = await subscription_repo.update(subscription, updated_data)
+        updated_subscription = await subscription_repo.update(subscription.id, updated_data)
 
         assert updated_subscription.access == 3.0
         assert updated_subscription.end_at == datetime(2026, 12, 31)
@@ -65,7 +90,7 @@ class TestSubscriptionRepository:
     async def test_delete_subscription(self, subscription_repo: SubscriptionRepository, create_subscription):
         """Test deleting a subscription."""
         subscription = await create_subscription
-        deleted = await subscription_repo.delete(subscription)
+        deleted = await subscription_repo.delete(subscription.id)
 
         assert deleted is True
         assert await subscription_repo.get_subscription(subscription.id) is None
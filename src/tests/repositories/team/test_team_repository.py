@@ -39,7 +39,7 @@ class TestTeamRepository:
     async def test_get_all_teams(self, team_repo: TeamRepository, create_team):
         """Test retrieving all teams."""
         team = await create_team
-        teams = await team_repo.get_all()
+        teams = (await team_repo.get_all()).items
 
         assert len(teams) > 0
         assert teams[0].id == team.id
@@ -64,7 +64,7 @@ class TestTeamRepository:
         """Test updating a team."""
         team = await create_team
         updated_data = TeamUpdate(name="Updated Team Name", description="Updated description")
-        updated_team = await team_repo.update(team, updated_data)
+        updated_team = await team_repo.update(team.id, updated_data)
 
         assert updated_team.name == "Updated Team Name"
         assert updated_team.description == "Updated description"
@@ -72,7 +72,7 @@ class TestTeamRepository:
     async def test_delete_team(self, team_repo: TeamRepository, create_team):
         """Test deleting a team."""
         team = await create_team
-        deleted = await team_repo.delete(team)
+        deleted = await team_repo.delete(team.id)
 
         assert deleted is True
         assert await team_repo.get_team(team.id) is None
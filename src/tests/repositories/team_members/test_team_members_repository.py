@@ -1,8 +1,11 @@
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models.team.team import Team
+from src.database.models.user.user import User
 from src.repositories.team_members.team_members_repository import TeamMemberRepository
 from src.schemas.team_member.team_member_schema import TeamMemberInput, TeamMemberUpdate
 
@@ -33,10 +36,33 @@ class TestTeamMemberRepository:
         assert team_member.user_id == team_member_data.user_id
         assert team_member.team_id == team_member_data.team_id
 
+    async def test_add_members(self, session: AsyncSession, team_member_repo: TeamMemberRepository):
+        """Test adding many team members, skipping existing and repeated memberships and unknown users."""
+        user_ids = [uuid4(), uuid4()]
+        team_id = uuid4()
+        await session.execute(insert(User), [
+            dict(id=_id, first_name="Member", last_name="Test", hashed_password=b"x", email=f"{_id.hex[:20]}@x.io")
+            for _id in user_ids
+        ])
+        await session.execute(insert(Team).values(id=team_id, name="Bulk Team", owner_id=user_ids[0]))
+        team_member = await team_member_repo.add_member(TeamMemberInput(user_id=user_ids[0], team_id=team_id))
+        new_member = TeamMemberInput(user_id=user_ids[1], team_id=team_id)
+        existing_member = TeamMemberInput(user_id=team_member.user_id, team_id=team_id)
+        unknown_member = TeamMemberInput(user_id=uuid4(), team_id=team_id)
+        result = await team_member_repo.add_members([new_member, existing_member, new_member, unknown_member])
+
+        assert result.created == 1
+        assert result.failed == 3
+        assert result.items[0].result.user_id == new_member.user_id
+        assert result.items[1].result is None and result.items[1].error == "Already a member of this team"
+        assert result.items[2].result is None and result.items[2].error == "Already a member of this team"
+        assert result.items[3].result is None and "team_members_user_id_fkey" in result.items[3].error
+        assert len(await team_member_repo.get_team_members(team_id)) == 2
+
     async def test_get_all_team_members(self, team_member_repo: TeamMemberRepository, create_team_member):
         """Test retrieving all team members."""
         team_member = await create_team_member
-        members = await team_member_repo.get_all_members()
+        members = (await team_member_repo.get_all_members()).items
 
         assert len(members) > 0
         assert members[0].id == team_member.id
@@ -61,14 +87,14 @@ class TestTeamMemberRepository:
         """Test updating a team member's details."""
         team_member = await create_team_member
         updated_data = TeamMemberUpdate(team_id=uuid4())
-        updated_team_member = await team_member_repo.update(team_member, updated_data)
+        updated_team_member = await team_member_repo.update(team_member.id, updated_data)
 
         assert updated_team_member.team_id == updated_data.team_id
 
     async def test_delete_team_member(self, team_member_repo: TeamMemberRepository, create_team_member):
         """Test removing a team member from a team."""
         team_member = await create_team_member
-        deleted = await team_member_repo.delete(team_member)
+        deleted = await team_member_repo.delete(team_member.id)
 
         assert deleted is True
         assert await team_member_repo.get_team_members(team_member.team_id) == []
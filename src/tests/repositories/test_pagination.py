@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Column, DateTime, String
+
+from src.repositories.pagination import InvalidCursorError, decode_cursor, encode_cursor, page_limit
+from src.config.config import settings
+
+
+class TestCursor:
+    def test_round_trip_datetime(self):
+        """Test that a datetime sort key survives encoding with its timezone."""
+        _id = uuid4()
+        created_at = datetime(2024, 10, 9, 17, 26, 1, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor(created_at, _id)
+
+        assert decode_cursor(cursor, Column("created_at", DateTime(timezone=True))) == (created_at, _id)
+
+    def test_round_trip_string(self):
+        """Test that a string sort key survives encoding."""
+        _id = uuid4()
+        cursor = encode_cursor("O'Brien", _id)
+
+        assert "=" not in cursor
+        assert decode_cursor(cursor, Column("last_name", String)) == ("O'Brien", _id)
+
+    @pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor("x", uuid4())[:-4]])
+    def test_invalid_cursor(self, cursor):
+        """Test that a tampered or truncated cursor is rejected."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, Column("created_at", DateTime(timezone=True)))
+
+    def test_page_limit(self):
+        """Test that page sizes default and are capped."""
+        assert page_limit(None) == settings.db.page_size
+        assert page_limit(0) == 1
+        assert page_limit(settings.db.max_page_size + 1) == settings.db.max_page_size
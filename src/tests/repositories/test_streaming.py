@@ -0,0 +1,36 @@
+import json
+from uuid import uuid4
+
+import pytest
+
+from src.repositories.streaming import ndjson
+from src.schemas.team_member.team_member_schema import TeamMemberInput
+
+
+@pytest.mark.anyio
+class TestNdjson:
+    @pytest.fixture
+    def anyio_backend(self):
+        return "asyncio"
+
+    async def test_ndjson_chunks(self):
+        """Test that items are written one JSON object per line in bounded chunks."""
+        members = [TeamMemberInput(user_id=uuid4(), team_id=uuid4()) for _ in range(5)]
+
+        async def items():
+            for member in members:
+                yield member
+
+        chunks = [chunk async for chunk in ndjson(items(), lines_per_chunk=2)]
+
+        assert [chunk.count(b"\n") for chunk in chunks] == [2, 2, 1]
+        lines = b"".join(chunks).decode().splitlines()
+        assert [TeamMemberInput(**json.loads(line)) for line in lines] == members
+
+    async def test_ndjson_empty(self):
+        """Test that an empty result produces no output."""
+        async def items():
+            return
+            yield
+
+        assert [chunk async for chunk in ndjson(items())] == []
@@ -0,0 +1,90 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.post.post import Post
+from src.database.models.user.user import User
+from src.repositories.utils import columns, insert_many, output_columns, to_outputs
+from src.schemas.post.post_schema import PostOutput
+from src.schemas.team_member.team_member_schema import TeamMemberOutput
+from src.schemas.user.user_schema import UserOutput
+
+
+class TestProjection:
+    def test_output_columns(self):
+        """Test that only the output's columns and the required ones are selected."""
+        names = [column.name for column in output_columns(User, UserOutput)]
+
+        assert "hashed_password" not in names
+        assert set(names) == set(UserOutput.model_fields)
+        assert [column.name for column in output_columns(User, UserOutput, User.hashed_password)][-1] == "hashed_password"
+
+    def test_to_outputs(self):
+        """Test that rows are validated into outputs, coercing where pydantic would."""
+        row = {"id": str(uuid4()), "user_id": uuid4(), "team_id": uuid4(), "joined_at": datetime.now(timezone.utc)}
+        (member,) = to_outputs(TeamMemberOutput, [row])
+
+        assert str(member.id) == row["id"]
+        assert member.joined_at == row["joined_at"]
+
+        with pytest.raises(ValidationError):
+            to_outputs(TeamMemberOutput, [{**row, "team_id": "not a uuid"}])
+
+    def test_to_outputs_trusted(self):
+        """Test that trusted rows are constructed without validation."""
+        row = {"id": uuid4(), "user_id": uuid4(), "team_id": uuid4(), "joined_at": datetime.now(timezone.utc)}
+
+        assert to_outputs(TeamMemberOutput, [row], trusted=True) == to_outputs(TeamMemberOutput, [row])
+
+
+@pytest.mark.anyio
+class TestInsertMany:
+    @pytest.fixture
+    async def user_id(self, session: AsyncSession):
+        user_id = uuid4()
+        await session.execute(insert(User).values(
+            id=user_id, first_name="Bulk", last_name="Test", hashed_password=b"x", email=f"{user_id.hex[:20]}@x.io"
+        ))
+        return user_id
+
+    def posts(self, count: int, user_id, event_id) -> list[dict]:
+        return [dict(id=uuid4(), title=f"Post {i}", body="Bulk", user_id=user_id, event_id=event_id) for i in range(count)]
+
+    async def test_failing_rows_are_isolated(self, session: AsyncSession, user_id):
+        """Test constraint violations and rejected values fail only their own rows."""
+        event_id = uuid4()
+        rows = self.posts(6, user_id, event_id)
+        rows[1]["user_id"] = uuid4()
+        rows[4]["title"] = "x" * 200
+        result = await insert_many(session, insert(Post).returning(*columns(Post)), rows, PostOutput)
+
+        assert (result.created, result.failed) == (4, 2)
+        assert [item.index for item in result.items if item.error] == [1, 4]
+        assert "foreign key" in result.items[1].error
+        assert "too long" in result.items[4].error
+        assert [item.result.id for item in result.items if item.result] == [rows[i]["id"] for i in (0, 2, 3, 5)]
+        assert await session.scalar(select(func.count()).select_from(Post).where(Post.event_id == event_id)) == 4
+
+    async def test_failing_batch_is_bisected(self, session: AsyncSession, user_id, monkeypatch):
+        """Test a bad row is found by halving the batch rather than retrying every row."""
+        rows = self.posts(64, user_id, uuid4())
+        rows[37]["user_id"] = uuid4()
+        executes = []
+        execute = session.execute
+
+        async def counting_execute(*args, **kwargs):
+            executes.append(len(args[1]))
+            return await execute(*args, **kwargs)
+
+        monkeypatch.setattr(session, "execute", counting_execute)
+        result = await insert_many(session, insert(Post).returning(*columns(Post)), rows, PostOutput)
+
+        assert (result.created, result.failed) == (63, 1)
+        assert result.items[37].error is not None
+        # The whole batch, then both halves at each of the six levels down to the bad row
+        assert len(executes) == 1 + 2 * 6
+        assert sorted(executes, reverse=True) == [64, 32, 32, 16, 16, 8, 8, 4, 4, 2, 2, 1, 1]
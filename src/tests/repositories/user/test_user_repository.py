@@ -43,7 +43,7 @@ class TestUserRepository:
     async def test_get_all_users(self, user_repo: UserRepository, create_user):
         """Test retrieving all users."""
         user = await create_user
-        users = await user_repo.get_all()
+        users = (await user_repo.get_all()).items
 
         assert len(users) > 0
         assert users[0].id == user.id
@@ -86,14 +86,14 @@ class TestUserRepository:
         """Test updating user details."""
         user = await create_user
         update_data = UserUpdate(first_name="UpdatedFirstName")
-        updated_user = await user_repo.update(user, update_data)
+        updated_user = await user_repo.update(user.id, update_data)
 
         assert updated_user.first_name == update_data.first_name
 
     async def test_delete_user(self, user_repo: UserRepository, create_user):
         """Test deleting a user."""
         user = await create_user
-        deleted = await user_repo.delete(user)
+        deleted = await user_repo.delete(user.id)
 
         assert deleted is True
         assert await user_repo.user_exists_by_id(user.id) is False
@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.post.post import Post
+from src.database.models.user.user import User
+from src.services.post.post_import_service import PostImportService
+
+
+@pytest.mark.anyio
+class TestPostImportService:
+    @pytest.fixture
+    async def user_id(self, session: AsyncSession):
+        user_id = uuid4()
+        await session.execute(insert(User).values(
+            id=user_id, first_name="Import", last_name="Test", hashed_password=b"x", email=f"{user_id.hex[:20]}@x.io"
+        ))
+        return user_id
+
+    async def test_import_posts(self, session: AsyncSession, user_id):
+        """Test importing posts in several COPY batches with progress reports."""
+        event_id = uuid4()
+        progress = []
+        service = PostImportService(session, batch_size=4, on_progress=progress.append)
+
+        async def rows():
+            for i in range(10):
+                yield {"title": f"Result {i}", "body": "Finished", "user_id": user_id, "event_id": event_id}
+
+        report = await service.import_posts(rows())
+
+        assert report.read == 10
+        assert report.inserted == 10
+        assert [p.staged for p in progress] == [4, 8, 10]
+        count = await session.scalar(select(func.count()).select_from(Post).where(Post.event_id == event_id))
+        assert count == 10
+
+    async def test_import_reports_rejected_and_skipped_rows(self, session: AsyncSession, user_id):
+        """Test that invalid rows are rejected and rows of unknown users skipped."""
+        event_id = uuid4()
+        rows = [
+            {"title": "Valid", "body": "Finished", "user_id": user_id, "event_id": event_id},
+            {"title": "", "body": "Finished", "user_id": user_id, "event_id": event_id},
+            {"title": "Unknown user", "body": "Finished", "user_id": uuid4(), "event_id": event_id},
+        ]
+        report = await PostImportService(session).import_posts(rows)
+
+        assert report.inserted == 1
+        assert report.rejected == 1
+        assert report.skipped == 1
+        assert report.errors[0][0] == 1
+
+    async def test_imports_in_one_transaction(self, session: AsyncSession, user_id):
+        """Test that a second import inside the same outer transaction gets its own staging table."""
+        event_id = uuid4()
+        service = PostImportService(session)
+        for i in range(2):
+            report = await service.import_posts([{"title": f"Import {i}", "body": "Finished", "user_id": user_id, "event_id": event_id}])
+            assert report.inserted == 1
+
+        count = await session.scalar(select(func.count()).select_from(Post).where(Post.event_id == event_id))
+        assert count == 2
@@ -0,0 +1,39 @@
+from uuid import uuid4
+
+import pytest
+
+from src.services.storage.resilience import ResilientReader
+from src.services.storage.s3_helper import S3Helper
+from src.services.storage.storage_service import StorageService
+from src.tests.services.storage.utils import local_s3_server
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+def s3_endpoint():
+    with local_s3_server() as endpoint:
+        yield endpoint
+
+
+@pytest.fixture
+async def s3(s3_endpoint: str):
+    helper = S3Helper(endpoint_url=s3_endpoint, region_name="us-east-1", max_pool_connections=4)
+    yield helper
+    await helper.close()
+
+
+@pytest.fixture
+async def bucket(s3: S3Helper) -> str:
+    name = f"test-{uuid4().hex[:12]}"
+    client = await s3.get_client()
+    await client.create_bucket(Bucket=name)
+    return name
+
+
+@pytest.fixture
+async def storage(s3: S3Helper, bucket: str) -> StorageService:
+    return StorageService(config={"bucket": bucket}, s3=s3, reader=ResilientReader())
@@ -0,0 +1,75 @@
+import hashlib
+from io import BytesIO
+
+import aiohttp
+import pytest
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.schemas.storage.presign_schema import PresignedUploadComplete
+from src.services.storage.deduplicated_storage_service import DeduplicatedStorageService
+from src.services.storage.s3_helper import S3Helper
+
+
+@pytest.mark.anyio
+class TestDeduplicatedStorageService:
+    @pytest.fixture
+    async def storage(self, session: AsyncSession, s3: S3Helper, bucket: str) -> DeduplicatedStorageService:
+        config = {"bucket": bucket, "content_path": "Content/", "multipart_threshold": 1024}
+        return DeduplicatedStorageService(session, config=config, s3=s3)
+
+    async def keys(self, storage: DeduplicatedStorageService) -> list[str]:
+        client = await storage.s3.get_client()
+        response = await client.list_objects_v2(Bucket=storage.bucket)
+        return sorted(item["Key"] for item in response.get("Contents", []))
+
+    async def test_duplicate_is_a_metadata_only_upload(self, storage: DeduplicatedStorageService, monkeypatch):
+        """Test identical bytes are stored once and the second upload only adds a reference."""
+        body = b"<gpx>same</gpx>"
+        first = await storage.upload(file=UploadFile(file=BytesIO(body), filename="a.gpx", size=len(body)))
+        puts = []
+        put = storage._put
+
+        async def counting_put(**kwargs):
+            puts.append(kwargs["key"])
+            await put(**kwargs)
+
+        monkeypatch.setattr(storage, "_put", counting_put)
+        second = await storage.upload(file=UploadFile(file=BytesIO(body), filename="b.gpx", size=len(body)))
+
+        content_key = storage.content_key(hashlib.sha256(body).hexdigest())
+        assert first.message == "a.gpx uploaded successfully"
+        assert second.message == "b.gpx already stored, reference updated"
+        assert puts == []
+        assert await self.keys(storage) == [content_key]
+        assert await storage.repository.count_references(content_key) == 2
+        assert await storage.download_file("b.gpx") == body
+
+    async def test_streamed_upload_is_hashed_in_one_pass(self, storage: DeduplicatedStorageService):
+        """Test large files are hashed while staged and leave only the content object behind."""
+        body = b"r" * 4096
+        for filename in ("big-1.gpx", "big-2.gpx"):
+            result = await storage.upload(file=UploadFile(file=BytesIO(body), filename=filename, size=len(body)))
+            assert result.status, result.error
+
+        content_key = storage.content_key(hashlib.sha256(body).hexdigest())
+        assert result.message == "big-2.gpx already stored, reference updated"
+        assert await self.keys(storage) == [content_key]
+        assert await storage.download_file("big-1.gpx") == body
+
+    async def test_presigned_upload_is_verified(self, storage: DeduplicatedStorageService):
+        """Test a presigned object is only registered when it hashes to its content key."""
+        body = b"<gpx>presigned</gpx>"
+        content_key = storage.content_key(hashlib.sha256(body).hexdigest())
+        wrong_key = storage.content_key(hashlib.sha256(b"other").hexdigest())
+        async with aiohttp.ClientSession() as http:
+            for key in (content_key, wrong_key):
+                upload = await storage.presign_upload(key)
+                async with http.put(upload.url, data=body) as response:
+                    assert response.status == 200
+
+        assert (await storage.complete_presigned_upload(PresignedUploadComplete(key=content_key))).status
+        result = await storage.complete_presigned_upload(PresignedUploadComplete(key=wrong_key))
+        assert not result.status
+        assert await self.keys(storage) == [content_key]
+        assert (await storage.repository.get_by_filename(content_key)).size == len(body)
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from src.services.storage.single_flight import SingleFlight
+
+
+@pytest.mark.anyio
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_result(self):
+        """Test callers of the same key run the function once."""
+        flights = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"splits": []}
+
+        results = await asyncio.gather(*(flights.do("key", fetch) for _ in range(20)))
+
+        assert calls == 1
+        assert all(result is results[0] for result in results)
+        assert flights.in_flight == {}
+
+    async def test_errors_reach_every_waiter_and_release_key(self):
+        """Test a failure is raised to all waiters and the next call retries."""
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("bucket unavailable")
+
+        results = await asyncio.gather(*(flights.do("key", fail) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+        async def succeed():
+            return b"ok"
+
+        assert await flights.do("key", succeed) == b"ok"
+
+    async def test_waiter_timeout_does_not_cancel_others(self):
+        """Test a caller timing out leaves the shared fetch running for the rest."""
+        flights = SingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return b"done"
+
+        leader = asyncio.create_task(flights.do("key", slow))
+        await asyncio.sleep(0)
+        with pytest.raises(asyncio.TimeoutError):
+            await flights.do("key", slow, timeout=0.01)
+
+        assert await leader == b"done"
@@ -0,0 +1,726 @@
+import asyncio
+import json
+from io import BytesIO
+from types import SimpleNamespace
+
+import aiohttp
+import pytest
+from botocore.exceptions import ClientError, EndpointConnectionError
+from fastapi import UploadFile
+
+from src.schemas.storage.presign_schema import CompletedPart, PresignedUploadComplete
+from src.schemas.storage.storage_schema import FileOutput
+from src.services.storage.disk_cache import DiskCache
+from src.services.storage.manifest_cache import ManifestCache
+from src.services.storage.multipart import MultipartUploadError, PartProgress, TransferLimiter, is_transient
+from src.services.storage.resilience import CircuitBreaker, ResilientReader
+from src.services.storage.s3_helper import S3Helper
+from src.services.storage.storage_service import PARQUET_SUFFIX, StorageService
+from src.services.storage.tiered_storage_service import TieredStorageService
+
+
+@pytest.mark.anyio
+class TestStorageService:
+    async def test_upload_and_download(self, storage: StorageService):
+        """Test a file round trip through the bucket."""
+        file = UploadFile(file=BytesIO(b"<gpx></gpx>"), filename="routes/track.gpx")
+        result = await storage.upload(file=file)
+
+        assert result.status
+        assert result.size == len(b"<gpx></gpx>")
+        assert result.url.endswith("/routes/track.gpx")
+        assert await storage.download("routes/track.gpx") == b"<gpx></gpx>"
+
+    async def test_upload_to_json_and_download_json(self, storage: StorageService):
+        """Test JSON documents are written and parsed back."""
+        data = {"runner": {"splits": [61, 123, 190]}}
+        await storage.upload_to_json(data=data, filename="Events/Splits/test")
+
+        assert await storage.download_json("Events/Splits/test") == data
+
+    async def test_download_missing_key(self, storage: StorageService):
+        """Test a missing object falls back to an empty body."""
+        assert await storage.download("missing") == b""
+        assert await storage.download_json("missing") == b""
+
+    async def test_multi_upload_shares_client(self, storage: StorageService, s3: S3Helper):
+        """Test concurrent uploads reuse the single pooled client."""
+        files = [UploadFile(file=BytesIO(b"x" * 10), filename=f"bulk/{i}") for i in range(8)]
+        client = await s3.get_client()
+        results = await storage.multi_upload(files=files)
+
+        assert len(results) == 8
+        assert await s3.get_client() is client
+
+
+@pytest.mark.anyio
+class TestMultipartUpload:
+    PART_SIZE = 5 * 1024 * 1024
+
+    @pytest.fixture
+    async def storage(self, s3: S3Helper, bucket: str) -> StorageService:
+        limiter = TransferLimiter(max_files=2, max_parts=2)
+        config = {"bucket": bucket, "multipart_threshold": self.PART_SIZE, "part_size": self.PART_SIZE}
+        return StorageService(config=config, s3=s3, limiter=limiter)
+
+    async def test_large_file_is_streamed_in_parts(self, storage: StorageService):
+        """Test files over the threshold are uploaded part by part with progress."""
+        payload = b"r" * (2 * self.PART_SIZE + 100)
+        progress: list[PartProgress] = []
+        file = UploadFile(file=BytesIO(payload), filename="routes/big.gpx", size=len(payload))
+        result = await storage.upload_multipart(file=file, progress=progress.append)
+
+        assert result.size == len(payload)
+        assert sorted(p.part_number for p in progress) == [1, 2, 3]
+        assert max(p.uploaded_bytes for p in progress) == len(payload)
+        assert await storage.download("routes/big.gpx") == payload
+
+    async def test_resume_skips_stored_parts(self, storage: StorageService, s3: S3Helper, bucket: str):
+        """Test an interrupted upload resumes from the parts already on the bucket."""
+        payload = b"a" * self.PART_SIZE + b"b" * 100
+        client = await s3.get_client()
+        upload = await client.create_multipart_upload(Bucket=bucket, Key="routes/resumed.gpx")
+        await client.upload_part(
+            Bucket=bucket, Key="routes/resumed.gpx", UploadId=upload["UploadId"],
+            PartNumber=1, Body=payload[:self.PART_SIZE],
+        )
+
+        progress: list[PartProgress] = []
+        file = UploadFile(file=BytesIO(payload), filename="routes/resumed.gpx", size=len(payload))
+        await storage.upload_multipart(file=file, progress=progress.append, upload_id=upload["UploadId"])
+
+        assert [p.part_number for p in progress] == [2]
+        assert await storage.download("routes/resumed.gpx") == payload
+
+    async def test_failed_read_releases_part_permit(self, storage: StorageService):
+        """Test a read error on the source file does not leak part permits."""
+        reads = 0
+
+        class FailingFile:
+            async def read(self, n: int) -> bytes:
+                nonlocal reads
+                reads += 1
+                if reads == 2:
+                    raise OSError("client disconnected")
+                return b"r" * n
+
+        with pytest.raises(MultipartUploadError):
+            await storage.multipart.upload(FailingFile(), "routes/failed.gpx")
+
+        assert storage.limiter.parts._value == 2
+
+
+@pytest.mark.anyio
+class TestEventData:
+    @pytest.fixture
+    def event(self) -> dict:
+        return {
+            f"runner-{i}": {"class": f"M{i % 3}", "splits": [60 + i, 120 + i], "name": f"Runner {i}"}
+            for i in range(30)
+        }
+
+    @pytest.fixture
+    async def storage(self, s3: S3Helper, bucket: str) -> StorageService:
+        return StorageService(config={"bucket": bucket, "row_group_size": 4}, s3=s3)
+
+    async def test_parquet_filter_and_projection(self, storage: StorageService, event: dict):
+        """Test reading one runner's columns from the Parquet object."""
+        await storage.upload_to_parquet(data=event, filename="Events/Splits/e1" + PARQUET_SUFFIX)
+        data = await storage.download_event_data("Events/Splits/", "e1", runners=["runner-4"], columns=["splits"])
+
+        assert data == {"runner-4": {"splits": [64, 124]}}
+
+    async def test_parquet_class_filter(self, storage: StorageService, event: dict):
+        """Test row group filtering by class returns the whole records."""
+        await storage.upload_to_parquet(data=event, filename="Events/Splits/e2" + PARQUET_SUFFIX)
+        data = await storage.download_event_data("Events/Splits/", "e2", classes=["M1"])
+
+        assert data == {runner: record for runner, record in event.items() if record["class"] == "M1"}
+
+    async def test_parquet_round_trip_with_colliding_and_sparse_keys(self, storage: StorageService):
+        """Test records keep their own runner/class fields and only the keys they had."""
+        event = {
+            "runner-1": {"runner": "Ann", "class_name": "W21", "__runner__": 1, "splits": [60]},
+            "runner-2": {"class": "M21", "club": "OK"},
+            "runner-3": {"value": 3},
+            "runner-4": 42,
+        }
+        await storage.upload_to_parquet(data=event, filename="Events/Splits/e6" + PARQUET_SUFFIX)
+
+        assert await storage.download_event_data("Events/Splits/", "e6") == event
+        assert await storage.download_event_data("Events/Splits/", "e6", classes=["W21"], columns=["runner"]) == {
+            "runner-1": {"runner": "Ann"}
+        }
+
+    async def test_json_fallback_and_migration(self, storage: StorageService, event: dict):
+        """Test JSON-only events stay readable and can be migrated to Parquet."""
+        await storage.upload_to_json(data=event, filename="Events/Splits/e3")
+        await storage.upload_to_json(data=event, filename="Events/Routes/e3")
+
+        assert await storage.download_event_data("Events/Splits/", "e3", runners=["runner-1"]) == {
+            "runner-1": event["runner-1"]
+        }
+
+        outputs = await storage.migrate_event_data("e3")
+        assert all(output.status for output in outputs)
+        assert await storage.download(f"Events/Splits/e3{PARQUET_SUFFIX}")
+        assert await storage.download_event_data("Events/Routes/", "e3") == event
+
+    async def test_publish_resolves_through_manifest(self, storage: StorageService, event: dict):
+        """Test a published bundle is read through its manifest and republishing bumps the version."""
+        routes = {runner: {"class": record["class"], "track": [[0, 0, 0]]} for runner, record in event.items()}
+        result = await storage.publish_event_data(SimpleNamespace(splits=event, routes=routes), "e4")
+
+        assert result.status, result.error
+        assert not await storage.object_exists("Events/Splits/e4")
+        assert await storage.download_event_data("Events/Splits/", "e4", runners=["runner-2"]) == {"runner-2": event["runner-2"]}
+        assert await storage.download_event_data("Events/Routes/", "e4") == routes
+
+        await storage.publish_event_data(SimpleNamespace(splits={}, routes={}), "e4")
+        manifest = await storage.get_event_manifest("e4")
+        assert manifest.version == 2
+        assert await storage.download_event_data("Events/Splits/", "e4") == {}
+
+    async def test_manifest_is_resolved_once_per_event(self, s3: S3Helper, bucket: str, event: dict, monkeypatch):
+        """Test reads reuse a resolved manifest, and the absence of one, until a publish."""
+        storage = StorageService(config={"bucket": bucket}, s3=s3, manifests=ManifestCache())
+        await storage.upload_to_parquet(data=event, filename="Events/Splits/e10" + PARQUET_SUFFIX)
+        manifest_reads = []
+        download_json = storage._download_json
+
+        async def recording_download_json(key):
+            if key.endswith("manifest.json"):
+                manifest_reads.append(key)
+            return await download_json(key)
+
+        monkeypatch.setattr(storage, "_download_json", recording_download_json)
+        for _ in range(2):
+            assert await storage.download_event_data("Events/Splits/", "e10") == event
+        assert len(manifest_reads) == 1
+
+        await storage.publish_event_data(SimpleNamespace(splits={}, routes={}), "e10")
+        assert await storage.download_event_data("Events/Splits/", "e10") == {}
+        assert await storage.download_event_data("Events/Routes/", "e10") == {}
+        # The publish reads the current version uncached, the next read resolves the new manifest
+        assert len(manifest_reads) == 3
+
+    async def test_failed_publish_keeps_previous_bundle(self, storage: StorageService, event: dict, monkeypatch):
+        """Test the manifest is only written when every artifact uploaded."""
+        await storage.publish_event_data(SimpleNamespace(splits=event, routes=event), "e5")
+
+        async def failing_upload_to_parquet(*, data, filename):
+            return FileOutput(status=False, error=f"{filename} failed")
+
+        monkeypatch.setattr(storage, "upload_to_parquet", failing_upload_to_parquet)
+        result = await storage.publish_event_data(SimpleNamespace(splits={}, routes={}), "e5")
+
+        assert not result.status
+        assert (await storage.get_event_manifest("e5")).version == 1
+        assert await storage.download_event_data("Events/Splits/", "e5") == event
+
+    async def test_superseded_bundles_are_removed(self, s3: S3Helper, bucket: str, event: dict):
+        """Test a publish deletes earlier bundles once their retention has passed."""
+        storage = StorageService(config={"bucket": bucket, "bundle_retention": 0}, s3=s3)
+        await storage.publish_event_data(SimpleNamespace(splits=event, routes=event), "e7")
+        await storage.publish_event_data(SimpleNamespace(splits={}, routes={}), "e7")
+
+        client = await s3.get_client()
+        response = await client.list_objects_v2(Bucket=bucket, Prefix="Events/Bundles/e7/")
+        prefixes = {item["Key"].split("/")[3] for item in response["Contents"]}
+        manifest = await storage.get_event_manifest("e7")
+        assert prefixes == {"manifest.json", manifest.artifacts["Events/Splits/"].key.split("/")[3]}
+
+    async def test_failed_bundle_cleanup_is_logged(self, storage: StorageService, event: dict, monkeypatch, caplog):
+        """Test a failing cleanup does not fail the publish but is logged with its prefix."""
+        client = await storage.s3.get_client()
+
+        async def failing_delete_objects(**kwargs):
+            raise ClientError({"Error": {"Code": "AccessDenied"}}, "DeleteObjects")
+
+        storage.config["bundle_retention"] = 0
+        await storage.publish_event_data(SimpleNamespace(splits=event, routes=event), "e11")
+        monkeypatch.setattr(client, "delete_objects", failing_delete_objects)
+        result = await storage.publish_event_data(SimpleNamespace(splits={}, routes={}), "e11")
+
+        assert result.status
+        assert "remove_superseded_bundles_failed Events/Bundles/e11/" in caplog.text
+
+    async def test_concurrent_publishes_never_mix_bundles(self, storage: StorageService, event: dict):
+        """Test two publishes racing on one version each leave a complete bundle behind."""
+        other = {runner: {**record, "splits": [0]} for runner, record in event.items()}
+        results = await asyncio.gather(
+            storage.publish_event_data(SimpleNamespace(splits=event, routes=event), "e8"),
+            storage.publish_event_data(SimpleNamespace(splits=other, routes=other), "e8"),
+        )
+
+        assert all(result.status for result in results)
+        splits = await storage.download_event_data("Events/Splits/", "e8")
+        routes = await storage.download_event_data("Events/Routes/", "e8")
+        assert splits in (event, other)
+        assert routes == splits
+
+    async def test_json_bundle_reads_runners_through_the_index(self, s3: S3Helper, bucket: str, event: dict, monkeypatch):
+        """Test a runner filter on a JSON bundle uses range reads instead of the whole document."""
+        config = {"bucket": bucket, "event_data_format": "json", "json_index_min_bytes": 0}
+        storage = StorageService(config=config, s3=s3)
+        await storage.publish_event_data(SimpleNamespace(splits=event, routes=event), "e9")
+        download_json = storage.download_json
+        documents = []
+
+        async def recording_download_json(key):
+            documents.append(key)
+            return await download_json(key)
+
+        monkeypatch.setattr(storage, "download_json", recording_download_json)
+        data = await storage.download_event_data("Events/Splits/", "e9", runners=["runner-3", "runner-5"], columns=["splits"])
+
+        assert data == {"runner-3": {"splits": [63, 123]}, "runner-5": {"splits": [65, 125]}}
+        assert all(key.endswith(".index") for key in documents)
+
+
+@pytest.mark.anyio
+class TestDiskCache:
+    @pytest.fixture
+    async def storage(self, s3: S3Helper, bucket: str, tmp_path) -> StorageService:
+        cache = DiskCache(directory=tmp_path, max_bytes=1024, revalidate_after=60)
+        return StorageService(config={"bucket": bucket}, s3=s3, cache=cache)
+
+    async def test_hit_after_miss(self, storage: StorageService):
+        """Test the second read is served from disk."""
+        await storage.upload_to_json(data={"a": 1}, filename="Events/Splits/cached")
+
+        assert await storage.download_json("Events/Splits/cached") == {"a": 1}
+        assert await storage.download_json("Events/Splits/cached") == {"a": 1}
+        stats = storage.cache_stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+        assert stats.bytes_saved == len(b'{"a": 1}')
+
+    async def test_revalidation_uses_etag(self, storage: StorageService, s3: S3Helper, bucket: str):
+        """Test stale entries are revalidated and refreshed when the object changed."""
+        storage.cache.revalidate_after = 0
+        await storage.upload(file=UploadFile(file=BytesIO(b"v1"), filename="k", size=2))
+        assert await storage.download("k") == b"v1"
+        assert await storage.download("k") == b"v1"
+        assert storage.cache_stats().hits == 1
+
+        client = await s3.get_client()
+        await client.put_object(Bucket=bucket, Key="k", Body=b"v2")
+        assert await storage.download("k") == b"v2"
+        assert storage.cache_stats().revalidations == 2
+
+    async def test_lru_eviction_by_size(self, storage: StorageService):
+        """Test the least recently used entries are evicted past max_bytes."""
+        for name in ("a", "b", "c"):
+            await storage.upload(file=UploadFile(file=BytesIO(b"x" * 400), filename=name, size=400))
+        await storage.download("a")
+        await storage.download("b")
+        await storage.download("a")
+        await storage.download("c")
+
+        assert set(storage.cache.entries) == {f"{storage.bucket}/a", f"{storage.bucket}/c"}
+        assert storage.cache.total_bytes == 800
+        assert storage.cache_stats().evictions == 1
+
+    async def test_concurrent_puts_count_bytes_once(self, tmp_path):
+        """Test concurrent puts of one key leave a single entry in the size total."""
+        cache = DiskCache(directory=tmp_path, max_bytes=1024)
+        await asyncio.gather(*(cache.put("k", b"x" * 100, f"etag-{i}") for i in range(5)))
+
+        assert cache.total_bytes == 100
+        assert await cache.read("k") == b"x" * 100
+
+    async def test_invalidate_during_fetch_drops_stale_body(self, tmp_path):
+        """Test a body fetched before an invalidation is not cached."""
+        cache = DiskCache(directory=tmp_path, max_bytes=1024)
+        fetched = asyncio.Event()
+        release = asyncio.Event()
+
+        async def get_object(etag):
+            fetched.set()
+            await release.wait()
+            return b"stale", "etag-1"
+
+        fetch = asyncio.create_task(cache.fetch("k", get_object))
+        await fetched.wait()
+        cache.invalidate("k")
+        release.set()
+
+        assert await fetch == b"stale"
+        assert await cache.read("k") is None
+        assert cache.total_bytes == 0
+        assert not cache.generations
+
+
+@pytest.mark.anyio
+class TestDownloadCoalescing:
+    async def test_concurrent_download_json_issues_one_get(self, storage: StorageService, monkeypatch):
+        """Test concurrent readers of one key share a single GET and parse."""
+        await storage.upload_to_json(data={"routes": [1, 2, 3]}, filename="Events/Routes/popular")
+        get_object = storage._get_object
+        calls = []
+
+        async def counting_get_object(key, etag=None):
+            calls.append(key)
+            return await get_object(key, etag)
+
+        monkeypatch.setattr(storage, "_get_object", counting_get_object)
+        results = await asyncio.gather(*(storage.download_json("Events/Routes/popular") for _ in range(25)))
+
+        assert calls == ["Events/Routes/popular"]
+        assert all(result == {"routes": [1, 2, 3]} for result in results)
+
+
+@pytest.mark.anyio
+class TestJsonCompression:
+    @pytest.mark.parametrize("encoding", ["zstd", "gzip"])
+    async def test_compressed_round_trip(self, s3: S3Helper, bucket: str, encoding: str):
+        """Test JSON is stored compressed with Content-Encoding and read back transparently."""
+        storage = StorageService(config={"bucket": bucket, "json_compression": encoding}, s3=s3)
+        data = {f"runner-{i}": {"splits": list(range(50))} for i in range(50)}
+        result = await storage.upload_to_json(data=data, filename="Events/Splits/compressed")
+
+        client = await s3.get_client()
+        head = await client.head_object(Bucket=bucket, Key="Events/Splits/compressed")
+        assert head["ContentEncoding"] == encoding
+        assert result.size < len(json.dumps(data))
+        assert await storage.download_json("Events/Splits/compressed") == data
+
+    async def test_uncompressed_objects_stay_readable(self, storage: StorageService, s3: S3Helper, bucket: str):
+        """Test objects written before compression are still parsed."""
+        client = await s3.get_client()
+        await client.put_object(Bucket=bucket, Key="Events/Splits/legacy", Body=b'{"legacy": true}')
+
+        assert await storage.download_json("Events/Splits/legacy") == {"legacy": True}
+
+
+@pytest.mark.anyio
+class TestJsonStreaming:
+    @pytest.mark.parametrize("encoding", ["none", "zstd"])
+    async def test_large_document_is_streamed_in_parts(self, s3: S3Helper, bucket: str, encoding: str):
+        """Test documents larger than one part go up as a multipart stream."""
+        config = {"bucket": bucket, "json_compression": encoding, "part_size": 5 * 1024 * 1024}
+        storage = StorageService(config=config, s3=s3)
+        data = {f"runner-{i}": {"track": [[59.9 + k / 1e5, 30.3, k] for k in range(200)]} for i in range(1500)}
+        await storage.upload_to_json(data=data, filename="Events/Routes/streamed")
+
+        if encoding == "none":
+            client = await s3.get_client()
+            head = await client.head_object(Bucket=bucket, Key="Events/Routes/streamed", PartNumber=1)
+            assert head["PartsCount"] > 1
+        assert await storage.download_json("Events/Routes/streamed") == data
+
+
+@pytest.mark.anyio
+class TestJsonItemRangeReads:
+    @pytest.mark.parametrize("encoding", ["none", "zstd", "gzip"])
+    async def test_item_is_read_with_a_range_request(self, s3: S3Helper, bucket: str, encoding: str, monkeypatch):
+        """Test one runner's route is fetched by its indexed byte range."""
+        config = {"bucket": bucket, "json_compression": encoding, "json_index_min_bytes": 0}
+        storage = StorageService(config=config, s3=s3)
+        routes = {f"runner-{i}": {"track": [[59.9, 30.3, k] for k in range(20)]} for i in range(40)}
+        await storage.upload_to_json(data=routes, filename="Events/Routes/indexed", index=True)
+        ranges = []
+        download_range = storage.download_range
+
+        async def recording_download_range(key, start, end):
+            ranges.append((start, end))
+            return await download_range(key, start, end)
+
+        monkeypatch.setattr(storage, "download_range", recording_download_range)
+
+        assert await storage.download_json_item("Events/Routes/indexed", "runner-7") == routes["runner-7"]
+        assert await storage.download_json_item("Events/Routes/indexed", "missing") is None
+        assert len(ranges) == 1
+        assert await storage.download_json("Events/Routes/indexed") == routes
+
+    async def test_unindexed_object_falls_back_to_full_read(self, storage: StorageService):
+        """Test objects written without an index are still served."""
+        await storage.upload_to_json(data={"runner-1": [1, 2]}, filename="Events/Routes/plain")
+
+        assert await storage.download_json_item("Events/Routes/plain", "runner-1") == [1, 2]
+
+    async def test_small_document_is_not_indexed(self, storage: StorageService):
+        """Test documents under json_index_min_bytes are written without an index."""
+        await storage.upload_to_json(data={"runner-1": [1, 2]}, filename="Events/Routes/small", index=True)
+
+        assert not await storage.object_exists("Events/Routes/small.index")
+        assert await storage.download_json_item("Events/Routes/small", "runner-1") == [1, 2]
+
+    async def test_rewrite_removes_stale_index(self, s3: S3Helper, bucket: str):
+        """Test an indexed write too small to index deletes the index of the previous body."""
+        storage = StorageService(config={"bucket": bucket, "json_index_min_bytes": 0}, s3=s3)
+        await storage.upload_to_json(data={"runner-1": [1], "runner-2": [2]}, filename="Events/Routes/rewritten", index=True)
+        storage.config["json_index_min_bytes"] = 1000
+        await storage.upload_to_json(data={"runner-1": ["a" * 100], "runner-2": [3]}, filename="Events/Routes/rewritten", index=True)
+
+        assert not await storage.object_exists("Events/Routes/rewritten.index")
+        assert await storage.download_json_item("Events/Routes/rewritten", "runner-2") == [3]
+
+    async def test_indexed_document_is_serialized_once(self, s3: S3Helper, bucket: str, monkeypatch):
+        """Test deciding whether to index does not serialize the document a second time."""
+        storage = StorageService(config={"bucket": bucket, "json_index_min_bytes": 1000}, s3=s3)
+        serialized = []
+
+        class Point:
+            def __str__(self):
+                serialized.append(self)
+                return "59.9,30.3"
+
+        routes = {f"runner-{i}": [Point() for _ in range(20)] for i in range(10)}
+        deleted = []
+        delete = storage._delete
+
+        async def recording_delete(key):
+            deleted.append(key)
+            await delete(key)
+
+        monkeypatch.setattr(storage, "_delete", recording_delete)
+        await storage.upload_to_json(data=routes, filename="Events/Routes/once", index=True)
+        await storage.upload_to_json(data=routes, filename="Events/Routes/fresh", index=True, new_key=True)
+        await storage.upload_to_json(data={"runner-1": [1]}, filename="Events/Routes/unindexed")
+
+        assert len(serialized) == 2 * 200
+        assert await storage.object_exists("Events/Routes/once.index")
+        assert await storage.download_json_item("Events/Routes/once", "runner-3") == ["59.9,30.3"] * 20
+        assert deleted == ["Events/Routes/once.index"]
+
+    async def test_mismatched_index_falls_back_to_full_read(self, s3: S3Helper, bucket: str):
+        """Test an index that does not match the body is not trusted."""
+        storage = StorageService(config={"bucket": bucket, "json_index_min_bytes": 0}, s3=s3)
+        await storage.upload_to_json(data={"runner-1": [1], "runner-2": [2]}, filename="Events/Routes/mismatched", index=True)
+        client = await s3.get_client()
+        body = json.dumps({"runner-1": ["a" * 100], "runner-2": [3]}).encode()
+        await client.put_object(Bucket=bucket, Key="Events/Routes/mismatched", Body=body)
+
+        assert await storage.download_json_item("Events/Routes/mismatched", "runner-2") == [3]
+
+
+@pytest.mark.anyio
+class TestPresignedTransfers:
+    async def test_presigned_put_and_get(self, storage: StorageService):
+        """Test a client can upload and download directly with presigned URLs."""
+        upload = await storage.presign_upload("Uploads/track.gpx")
+        async with aiohttp.ClientSession() as http:
+            async with http.put(upload.url, data=b"<gpx/>") as response:
+                assert response.status == 200
+
+            result = await storage.complete_presigned_upload(PresignedUploadComplete(key="Uploads/track.gpx", size=6))
+            assert result.status
+            assert result.size == 6
+
+            download = await storage.presign_download("Uploads/track.gpx")
+            async with http.get(download.url) as response:
+                assert await response.read() == b"<gpx/>"
+
+    async def test_presigned_multipart_upload(self, storage: StorageService):
+        """Test presigned parts are completed by the callback."""
+        part_size = storage.multipart.part_size
+        payload = b"p" * part_size + b"q" * 10
+        upload = await storage.presign_multipart_upload("Uploads/big.gpx", size=len(payload))
+        assert len(upload.parts) == 2
+
+        parts = []
+        async with aiohttp.ClientSession() as http:
+            for part in upload.parts:
+                chunk = payload[(part.part_number - 1) * part_size:part.part_number * part_size]
+                async with http.put(part.url, data=chunk) as response:
+                    parts.append(CompletedPart(part_number=part.part_number, etag=response.headers["ETag"]))
+
+        result = await storage.complete_presigned_upload(PresignedUploadComplete(
+            key="Uploads/big.gpx", size=len(payload), upload_id=upload.upload_id, parts=parts
+        ))
+        assert result.status
+        assert await storage.download("Uploads/big.gpx") == payload
+
+    async def test_completion_rejects_size_mismatch(self, storage: StorageService):
+        """Test the callback fails when the stored object is not what the client announced."""
+        await storage.upload(file=UploadFile(file=BytesIO(b"short"), filename="Uploads/bad", size=5))
+        result = await storage.complete_presigned_upload(PresignedUploadComplete(key="Uploads/bad", size=50))
+
+        assert not result.status
+
+
+@pytest.mark.anyio
+class TestTieredStorage:
+    @pytest.fixture
+    async def tiered(self, storage: StorageService, tmp_path) -> TieredStorageService:
+        config = {"hot_dir": str(tmp_path), "hot_max_bytes": 1000, "hot_max_age": 3600, "local_only": False}
+        return TieredStorageService(config=config, cold=storage)
+
+    async def test_writes_go_to_both_tiers(self, tiered: TieredStorageService, storage: StorageService):
+        """Test uploads land in the hot tier and the bucket."""
+        await tiered.upload(file=UploadFile(file=BytesIO(b"hot"), filename="Events/hot", size=3))
+
+        assert bytes(await tiered.read("Events/hot")) == b"hot"
+        assert await storage.download("Events/hot") == b"hot"
+
+    async def test_cold_objects_are_promoted(self, tiered: TieredStorageService, storage: StorageService):
+        """Test a hot miss promotes the object and later reads stay local."""
+        await storage.upload_to_json(data={"a": 1}, filename="Events/cold")
+
+        assert await tiered.download_json("Events/cold") == {"a": 1}
+        assert "Events/cold" in tiered.hot.entries
+        assert await tiered.read("Events/missing") is None
+
+    async def test_demotion_by_size(self, tiered: TieredStorageService, storage: StorageService):
+        """Test least recently used hot copies are demoted past the size limit."""
+        for name in ("a", "b", "c"):
+            await tiered.upload(file=UploadFile(file=BytesIO(b"x" * 400), filename=name, size=400))
+
+        assert list(tiered.hot.entries) == ["b", "c"]
+        assert await tiered.download("a") == b"x" * 400
+
+    async def test_failed_cold_read_is_not_promoted(self, tiered: TieredStorageService, storage: StorageService, monkeypatch):
+        """Test a failing cold GET is raised instead of caching an empty body."""
+        await storage.upload_to_json(data={"a": 1}, filename="Events/flaky")
+        client = await storage.s3.get_client()
+
+        async def failing_get_object(**kwargs):
+            raise unavailable()
+
+        monkeypatch.setattr(client, "get_object", failing_get_object)
+        with pytest.raises(ClientError):
+            await tiered.read("Events/flaky")
+        assert await tiered.download("Events/flaky") == b""
+        assert "Events/flaky" not in tiered.hot.entries
+
+        monkeypatch.undo()
+        assert await tiered.download_json("Events/flaky") == {"a": 1}
+
+    async def test_large_upload_is_streamed_to_both_tiers(self, s3: S3Helper, bucket: str, tmp_path):
+        """Test a multipart-sized file reaches the bucket and the hot tier without a whole-file read."""
+        cold = StorageService(config={"bucket": bucket, "multipart_threshold": 1024}, s3=s3)
+        tiered = TieredStorageService(config={"hot_dir": str(tmp_path), "local_only": False}, cold=cold)
+        payload = b"t" * 4096
+        file = UploadFile(file=BytesIO(payload), filename="Events/big", size=len(payload))
+        reads = []
+        read = file.read
+
+        async def recording_read(size: int = -1) -> bytes:
+            reads.append(size)
+            return await read(size)
+
+        file.read = recording_read
+        result = await tiered.upload(file=file)
+
+        assert result.size == len(payload)
+        assert -1 not in reads
+        assert bytes(tiered.hot.get("Events/big")) == payload
+        assert await cold.download("Events/big") == payload
+
+    async def test_local_only_mode(self, tmp_path):
+        """Test the backend works with no bucket and never demotes."""
+        tiered = TieredStorageService(config={"hot_dir": str(tmp_path), "hot_max_bytes": 1, "local_only": True})
+        await tiered.upload_to_json(data={"splits": [1, 2]}, filename="Events/Splits/local")
+
+        assert tiered.cold is None
+        assert await tiered.download_json("Events/Splits/local") == {"splits": [1, 2]}
+
+
+def unavailable() -> ClientError:
+    return ClientError({"Error": {"Code": "SlowDown"}, "ResponseMetadata": {"HTTPStatusCode": 503}}, "GetObject")
+
+
+@pytest.mark.anyio
+class TestResilientReads:
+    async def test_transient_errors_are_retried(self, storage: StorageService, monkeypatch):
+        """Test a GET failing with 503 is retried with backoff until it succeeds."""
+        await storage.upload_to_json(data={"a": 1}, filename="Events/flaky")
+        storage.reader = ResilientReader(retries=2, base_delay=0.01)
+        client = await storage.s3.get_client()
+        get_object = client.get_object
+        failures = [unavailable(), unavailable()]
+
+        async def flaky_get_object(**kwargs):
+            if failures:
+                raise failures.pop()
+            return await get_object(**kwargs)
+
+        monkeypatch.setattr(client, "get_object", flaky_get_object)
+
+        assert await storage.download_json("Events/flaky") == {"a": 1}
+        assert storage.read_metrics().retries == 2
+        assert storage.read_metrics().successes == 1
+
+    async def test_breaker_opens_and_fails_fast(self, storage: StorageService, monkeypatch):
+        """Test repeated transient failures open the circuit and later reads skip the bucket."""
+        storage.reader = ResilientReader(retries=0, breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60))
+        client = await storage.s3.get_client()
+        calls = []
+
+        async def failing_get_object(**kwargs):
+            calls.append(kwargs["Key"])
+            raise unavailable()
+
+        monkeypatch.setattr(client, "get_object", failing_get_object)
+        for _ in range(3):
+            assert await storage.download("Events/down") == b""
+
+        metrics = storage.read_metrics()
+        assert len(calls) == 2
+        assert storage.reader.breaker.state == "open"
+        assert (metrics.failures, metrics.rejected, metrics.breaker_opened) == (2, 1, 1)
+
+    async def test_missing_keys_do_not_trip_the_breaker(self, storage: StorageService):
+        """Test a 404 is returned as-is without retries or breaker failures."""
+        storage.reader = ResilientReader(retries=2, breaker=CircuitBreaker(failure_threshold=1, reset_timeout=60))
+
+        assert await storage.download("missing") == b""
+        assert storage.reader.breaker.state == "closed"
+        assert storage.read_metrics().retries == 0
+
+    async def test_slow_reads_are_hedged(self, storage: StorageService, monkeypatch):
+        """Test a GET slower than the latency percentile is raced by a second request."""
+        await storage.upload_to_json(data={"a": 1}, filename="Events/slow")
+        storage.reader = ResilientReader(hedge_percentile=50, hedge_min_samples=1)
+        storage.reader.latencies.add(0.01)
+        client = await storage.s3.get_client()
+        get_object = client.get_object
+        calls = []
+
+        async def slow_first_get_object(**kwargs):
+            calls.append(kwargs["Key"])
+            if len(calls) == 1:
+                await asyncio.sleep(5)
+            return await get_object(**kwargs)
+
+        monkeypatch.setattr(client, "get_object", slow_first_get_object)
+
+        assert await asyncio.wait_for(storage.download_json("Events/slow"), 2) == {"a": 1}
+        assert len(calls) == 2
+        assert storage.read_metrics().hedge_wins == 1
+
+    async def test_cancelled_read_cancels_the_request(self):
+        """Test cancelling the caller before the hedge fires also cancels the primary request."""
+        reader = ResilientReader(hedge_percentile=50, hedge_min_samples=1)
+        reader.latencies.add(10)
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def slow_read():
+            started.set()
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        call = asyncio.create_task(reader.call(slow_read))
+        await started.wait()
+        call.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), 1)
+        assert reader.metrics.hedges == 0
+
+    @pytest.mark.parametrize("error, transient", [
+        (unavailable(), True),
+        (ClientError({"Error": {"Code": "NoSuchKey"}, "ResponseMetadata": {"HTTPStatusCode": 404}}, "GetObject"), False),
+        (ClientError({"Error": {"Code": "SlowDown"}}, "GetObject"), True),
+        (EndpointConnectionError(endpoint_url="http://s3"), True),
+        (asyncio.TimeoutError(), True),
+        (ValueError("bad argument"), False),
+        (KeyError("Body"), False),
+    ])
+    def test_only_transient_errors_are_retried(self, error: Exception, transient: bool):
+        """Test connection, timeout, 5xx and throttling errors are transient and nothing else."""
+        assert is_transient(error) is transient
@@ -0,0 +1,24 @@
+import socket
+from contextlib import contextmanager
+
+from moto.server import ThreadedMotoServer
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextmanager
+def local_s3_server():
+    """
+    Runs a moto S3 server on a free local port and yields its endpoint url.
+    """
+    port = free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.stop()
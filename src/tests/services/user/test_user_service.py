@@ -0,0 +1,36 @@
+import json
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.user.user import User
+from src.repositories import streaming
+from src.services.user.user_service import UserService
+
+
+@pytest.mark.anyio
+class TestUserService:
+    async def test_export_ndjson(self, session: AsyncSession, monkeypatch):
+        """Test that the export streams every user as NDJSON over several cursor fetches."""
+        user_ids = [uuid4() for _ in range(5)]
+        await session.execute(insert(User), [
+            dict(id=_id, first_name="Export", last_name="Test", hashed_password=b"x", email=f"{_id.hex[:20]}@x.io")
+            for _id in user_ids
+        ])
+        fetches = []
+        to_outputs = streaming.to_outputs
+
+        def counting_to_outputs(output, rows, trusted=False):
+            fetches.append(len(rows))
+            return to_outputs(output, rows, trusted)
+
+        monkeypatch.setattr(streaming, "to_outputs", counting_to_outputs)
+        chunks = [chunk async for chunk in UserService(session).export_ndjson(fetch_size=2)]
+        lines = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+
+        assert len(fetches) >= 3
+        assert max(fetches) == 2
+        assert {str(_id) for _id in user_ids} <= {line["id"] for line in lines}
+        assert "hashed_password" not in lines[0]